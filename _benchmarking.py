@@ -0,0 +1,149 @@
+# -*- coding: utf-8 -*-
+"""Script for running the benchmarks.
+
+    python _benchmarking.py [--output FILE] [--compare FILE]
+                            [--threshold RATIO] [--match TEXT]
+
+Cases are collected from `cases()` in the modules `bench_*.py`, each
+case is a dict with a name, parameters, and a function to time. Times
+are the best of several repeats and are written to a JSON file. With
+`--compare`, the script exits with status 1 if a case is slower than
+in the given file by more than the threshold.
+"""
+import argparse
+import glob
+import importlib.util
+import json
+import os
+import platform
+import sys
+import time
+
+import numpy as np
+
+OUTPUT = 'bench_output.json'
+THRESHOLD = 0.25  # Tolerated relative slowdown.
+
+REPEAT = 5
+MINTIME = 0.05  # Seconds per repeat, calls are looped up to it.
+
+dirnames = [
+    'polybases'
+]
+
+
+def load_cases(pattern):
+
+    for dirname in dirnames:
+
+        paths = sorted(glob.glob(
+            os.path.join(dirname, '_benchmarks', 'bench_*.py')
+        ))
+
+        for path in paths:
+
+            name = os.path.splitext(os.path.basename(path))[0]
+            spec = importlib.util.spec_from_file_location(name, path)
+            module = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(module)
+
+            for case in module.cases():
+                if pattern is None or pattern in case['name']:
+                    yield case
+
+
+def timeit(func):
+    """Best time per call over the repeats.
+    """
+
+    func()
+
+    number = 1
+    elapsed = measure(func, number)
+
+    while elapsed < MINTIME:
+        number *= 2 if elapsed == 0. else max(2, int(MINTIME/elapsed))
+        elapsed = measure(func, number)
+
+    best = min(
+        measure(func, number) for _ in range(REPEAT-1)
+    )
+
+    return min(best, elapsed)/number
+
+
+def measure(func, number):
+
+    start = time.perf_counter()
+
+    for _ in range(number):
+        func()
+
+    return time.perf_counter() - start
+
+
+def run(pattern):
+
+    results = {}
+
+    for case in load_cases(pattern):
+
+        seconds = timeit(case['func'])
+
+        results[case['name']] = {
+            'params': case['params'],
+            'seconds': seconds
+        }
+
+        print(f"{case['name']:<72} {seconds*1e3:12.4f} ms")
+
+    return {
+        'meta': {
+            'python': platform.python_version(),
+            'numpy': np.__version__,
+            'machine': platform.machine(),
+            'time': time.strftime('%Y-%m-%dT%H:%M:%S')
+        },
+        'results': results
+    }
+
+
+def compare(report, basefile, threshold):
+    """Returns the names of cases slower than in basefile.
+    """
+
+    with open(basefile, encoding='utf-8') as file:
+        base = json.load(file)['results']
+
+    slower = []
+
+    for name, result in report['results'].items():
+
+        if name not in base:
+            continue
+
+        ratio = result['seconds']/base[name]['seconds']
+
+        if ratio > 1. + threshold:
+            slower.append(name)
+            print(f'REGRESSION {name}: {ratio:.2f}x')
+
+    return slower
+
+
+parser = argparse.ArgumentParser(description='Runs the benchmarks.')
+parser.add_argument('--output', default=OUTPUT)
+parser.add_argument('--compare', default=None)
+parser.add_argument('--threshold', type=float, default=THRESHOLD)
+parser.add_argument('--match', default=None)
+
+args = parser.parse_args()
+
+REPORT = run(args.match)
+
+with open(args.output, 'w', encoding='utf-8') as output:
+    json.dump(REPORT, output, indent=2)
+
+if args.compare is not None:
+    if compare(REPORT, args.compare, args.threshold):
+        sys.exit(1)
@@ -3,5 +3,7 @@
 """
 from . import utils
 from .abcpolys import *
+from .bundles import *
+from .elements import *
 from .legendre import Legendre
 from .chebyshev import Chebyshev
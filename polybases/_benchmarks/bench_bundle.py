@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+"""Benchmark operator bundles against separate realizations.
+"""
+import numpy as np
+from specbvp import polybases
+
+BASES = {
+    'legendre': polybases.Legendre,
+    'chebyshev': polybases.Chebyshev
+}
+
+NUMNODES = 2000
+MAXDEGREE = 200
+
+
+def get_oprs(basis):
+    return [
+        basis.polys(),
+        basis.derivs(order=1),
+        basis.derivs(order=2),
+        basis.integax(weighted=False),
+        basis.integxb(weighted=True)
+    ]
+
+
+def realize_separately(oprs):
+    return [
+        opr.asmat() for opr in oprs
+    ]
+
+
+def cases():
+    for basisname, basis in BASES.items():
+
+        nodes = np.linspace(-1., 1., NUMNODES)
+        indices = range(MAXDEGREE+1)
+
+        oprs = get_oprs(basis())
+
+        for opr in oprs:
+            opr.setnodes(nodes).setpolys(*indices)
+
+        bundle = basis().bundle(get_oprs(basis()))
+        bundle.setnodes(nodes).setpolys(*indices)
+
+        funcs = {
+            'separate': lambda oprs=oprs: realize_separately(oprs),
+            'bundle': bundle.asmats
+        }
+
+        for mode, func in funcs.items():
+            yield {
+                'name': '/'.join([
+                    'bundle', basisname, mode, f'nodes={NUMNODES}',
+                    f'maxdegree={MAXDEGREE}'
+                ]),
+                'params': {
+                    'basis': basisname,
+                    'mode': mode,
+                    'nodes': NUMNODES,
+                    'maxdegree': MAXDEGREE
+                },
+                'func': func
+            }
@@ -0,0 +1,45 @@
+# -*- coding: utf-8 -*-
+"""Benchmark Newton solvers.
+"""
+import math
+from specbvp.polybases import utils
+from specbvp.polybases.legendre import gaussnodes
+
+NUMBERS = [16, 128, 1024]
+TOL = 1e-15
+
+
+class DottieNumber(utils.SolverNewton):
+    """Scalar solver for the overhead of iterations.
+    """
+
+    def get_norm(self, arg):
+        return abs(arg)
+
+    def get_func(self, arg):
+        return math.cos(arg) - arg
+
+    def get_deriv(self, arg):
+        return -math.sin(arg) - 1.
+
+
+def compute_gauss(number):
+    finder = gaussnodes.NodesFinder(number)
+    guess = finder.get_nodes_guess(number)
+    return finder.compute(guess, tol=TOL)
+
+
+def cases():
+
+    yield {
+        'name': 'findroots/scalar',
+        'params': {},
+        'func': lambda: DottieNumber().compute(1., tol=TOL)
+    }
+
+    for number in NUMBERS:
+        yield {
+            'name': f'findroots/gauss-legendre/number={number}',
+            'params': {'number': number},
+            'func': lambda number=number: compute_gauss(number)
+        }
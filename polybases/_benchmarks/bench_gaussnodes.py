@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+"""Benchmark the methods of computing the Gauss nodes.
+
+Prints the time per call of `GaussNodes.setnum()` for the Newton and
+asymptotic methods. The crossover indicates `GaussNodes.ASYNUM`.
+"""
+import timeit
+from specbvp import polybases
+from specbvp.polybases.legendre import gaussnodes
+
+NUMBERS = [
+    10, 20, 30, 40, 60, 80, 100, 200, 500, 1000, 2000
+]
+
+METHODS = gaussnodes.GaussNodes.METHODS
+
+
+def time_setnum(method, number, repeat=5):
+
+    nodeset = gaussnodes.GaussNodes().setmethod(method)
+
+    def setnum():
+        nodeset.setnum(number)
+
+    calls, _ = timeit.Timer(setnum).autorange()
+    times = timeit.Timer(setnum).repeat(repeat, calls)
+
+    return min(times)/calls
+
+
+def cases():
+    for method in METHODS:
+        for number in [100, 1000]:
+
+            nodeset = gaussnodes.GaussNodes().setmethod(method)
+            nodeset.CACHE = None
+
+            yield {
+                'name': f'gaussnodes/{method}/number={number}',
+                'params': {'method': method, 'number': number},
+                'func': lambda nodeset=nodeset, number=number: (
+                    nodeset.setnum(number)
+                )
+            }
+
+
+def main():
+
+    saved = polybases.NodeSet.CACHE
+    polybases.NodeSet.CACHE = None
+
+    print(f'{"number":>8}', *[f'{name:>12}' for name in METHODS])
+
+    for number in NUMBERS:
+        times = [
+            time_setnum(method, number) for method in METHODS
+        ]
+        print(f'{number:>8}', *[f'{1e3*val:>10.3f}ms' for val in times])
+
+    polybases.NodeSet.CACHE = saved
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,35 @@
+# -*- coding: utf-8 -*-
+"""Benchmark node sets without the cache.
+"""
+from specbvp import polybases
+
+BASES = {
+    'legendre': polybases.Legendre,
+    'chebyshev': polybases.Chebyshev
+}
+
+FAMILIES = ['gauss', 'lobatto']
+NUMBERS = [16, 128, 1024]
+
+
+def cases():
+    for basisname, basis in BASES.items():
+        for family in FAMILIES:
+            for number in NUMBERS:
+
+                nodeset = basis().nodes()[family]
+                nodeset.CACHE = None
+
+                yield {
+                    'name': '/'.join([
+                        'nodes', basisname, family, f'number={number}'
+                    ]),
+                    'params': {
+                        'basis': basisname,
+                        'family': family,
+                        'number': number
+                    },
+                    'func': lambda nodeset=nodeset, number=number: (
+                        nodeset.setnum(number)
+                    )
+                }
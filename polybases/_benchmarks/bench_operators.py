@@ -0,0 +1,56 @@
+# -*- coding: utf-8 -*-
+"""Benchmark operators over nodes, degrees and index sparsity.
+"""
+import numpy as np
+from specbvp import polybases
+
+BASES = {
+    'legendre': polybases.Legendre,
+    'chebyshev': polybases.Chebyshev
+}
+
+OPERATORS = {
+    'polys': lambda basis: basis.polys(),
+    'derivs1': lambda basis: basis.derivs(order=1),
+    'derivs2': lambda basis: basis.derivs(order=2),
+    'integax': lambda basis: basis.integax(weighted=False),
+    'integax-weighted': lambda basis: basis.integax(weighted=True),
+    'integxb': lambda basis: basis.integxb(weighted=False),
+    'integxb-weighted': lambda basis: basis.integxb(weighted=True)
+}
+
+NUMNODES = [100, 10000]
+MAXDEGREES = [32, 256]
+
+SPARSITY = {
+    'dense': lambda maxdegree: range(maxdegree+1),
+    'sparse': lambda maxdegree: range(maxdegree, -1, -(maxdegree//4))
+}
+
+
+def cases():
+    for basisname, basis in BASES.items():
+        for oprname, getopr in OPERATORS.items():
+            for numnodes in NUMNODES:
+                for maxdegree in MAXDEGREES:
+                    for sparsity, getindices in SPARSITY.items():
+
+                        opr = getopr(basis())
+                        opr.setnodes(np.linspace(-1., 1., numnodes))
+                        opr.setpolys(*getindices(maxdegree))
+
+                        yield {
+                            'name': '/'.join([
+                                'operators', basisname, oprname,
+                                f'nodes={numnodes}',
+                                f'maxdegree={maxdegree}', sparsity
+                            ]),
+                            'params': {
+                                'basis': basisname,
+                                'operator': oprname,
+                                'nodes': numnodes,
+                                'maxdegree': maxdegree,
+                                'sparsity': sparsity
+                            },
+                            'func': opr.asmat
+                        }
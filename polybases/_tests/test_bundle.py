@@ -0,0 +1,87 @@
+# -*- coding: utf-8 -*-
+"""Test the realization of operator bundles.
+"""
+import unittest
+import numpy as np
+from specbvp import polybases
+
+
+class Suite:
+
+    BASIS = None
+    OPERATORS = []
+
+    TOL = 1e-10
+
+    NODES = [np.linspace(-1., 1., 9), 0.3]
+    INDICES = [[0], [1], [0, 1, 2], list(range(12)), [11, 3, 3]]
+
+    def test_suite(self):
+        for nodes in self.NODES:
+            for indices in self.INDICES:
+                self._validate_bundle(nodes, indices)
+
+    def test_views(self):
+
+        oprs = [self.BASIS.polys(), self.BASIS.polys()]
+        bundle = self.BASIS.bundle(oprs).setnodes(self.NODES[0])
+
+        mats = bundle.setpolys(*range(6)).asmats()
+        refmat = mats[0].copy()
+
+        self.assertFalse(np.may_share_memory(mats[0], mats[1]))
+
+        mats[1][...] = 0.
+        _ = bundle.asmats()
+
+        np.testing.assert_array_equal(mats[0], refmat)
+
+    def _validate_bundle(self, nodes, indices):
+
+        bundle = self.BASIS.bundle(self.OPERATORS)
+        mats = bundle.setnodes(nodes).setpolys(*indices).asmats()
+
+        for opr, mat in zip(self.OPERATORS, mats):
+
+            refmat = opr.setnodes(nodes).setpolys(*indices).asmat()
+
+            self.assertEqual(mat.shape, refmat.shape)
+            np.testing.assert_allclose(
+                mat, refmat, atol=self.TOL, err_msg=repr(opr)
+            )
+
+
+class TestLegendre(Suite, unittest.TestCase):
+
+    BASIS = polybases.Legendre()
+
+    OPERATORS = [
+        BASIS.polys(),
+        BASIS.derivs(order=1),
+        BASIS.derivs(order=2),
+        BASIS.derivs(order=4),
+        BASIS.integax(weighted=False),
+        BASIS.integxb(weighted=False),
+        BASIS.integax(weighted=True),
+        BASIS.integxb(weighted=True)
+    ]
+
+
+class TestChebyshev(Suite, unittest.TestCase):
+
+    BASIS = polybases.Chebyshev()
+
+    OPERATORS = [
+        BASIS.polys(),
+        BASIS.derivs(order=1),
+        BASIS.derivs(order=2),
+        BASIS.derivs(order=3),
+        BASIS.integax(weighted=False),
+        BASIS.integxb(weighted=False),
+        BASIS.integax(weighted=True),
+        BASIS.integxb(weighted=True)
+    ]
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,105 @@
+# -*- coding: utf-8 -*-
+"""Test operators in the coefficient space.
+"""
+import importlib.util
+import unittest
+import numpy as np
+from specbvp import polybases
+
+HAS_SCIPY = importlib.util.find_spec('scipy') is not None
+
+
+class Suite:
+
+    BASIS = None
+    ORDERS = [1, 2, 3]
+
+    TOL = 1e-9
+
+    NODES = np.linspace(-1., 1., 13)
+    COEFFS = np.random.default_rng(3).normal(size=(17, 4))
+
+    def test_suite(self):
+        for order in self.ORDERS:
+            self._validate_derivs(order)
+
+    def test_integrators(self):
+        for weighted in [False, True]:
+            self._validate_integrators(weighted)
+
+    @unittest.skipUnless(HAS_SCIPY, 'requires scipy')
+    def test_asmat(self):
+        for opr in self.get_coeffoprs():
+            self._validate_asmat(opr)
+
+    def get_coeffoprs(self):
+
+        basis = self.BASIS
+
+        derivs = [
+            basis.coeffderivs(order) for order in self.ORDERS
+        ]
+
+        integs = [
+            basis.coeffintegax(weighted=False),
+            basis.coeffintegxb(weighted=False),
+            basis.coeffintegax(weighted=True),
+            basis.coeffintegxb(weighted=True)
+        ]
+
+        return derivs + integs
+
+    def _validate_derivs(self, order):
+
+        coeffs = self.COEFFS
+        opr = self.BASIS.coeffderivs(order)
+
+        np.testing.assert_allclose(
+            self.BASIS.evaluate(opr.apply(coeffs), self.NODES),
+            self.BASIS.evaluate(coeffs, self.NODES, self.BASIS.derivs(order)),
+            rtol=self.TOL, atol=self.TOL
+        )
+
+        np.testing.assert_allclose(
+            opr.apply(coeffs.T, axis=1), opr.apply(coeffs).T
+        )
+
+    def _validate_integrators(self, weighted):
+
+        basis = self.BASIS
+        coeffs = self.COEFFS
+
+        pairs = [
+            (basis.coeffintegax(weighted), basis.integax(weighted)),
+            (basis.coeffintegxb(weighted), basis.integxb(weighted))
+        ]
+
+        for opr, valopr in pairs:
+            np.testing.assert_allclose(
+                basis.evaluate(opr.apply(coeffs), self.NODES),
+                basis.evaluate(coeffs, self.NODES, valopr),
+                rtol=self.TOL, atol=self.TOL
+            )
+
+    def _validate_asmat(self, opr):
+
+        coeffs = self.COEFFS
+
+        np.testing.assert_allclose(
+            opr.asmat(len(coeffs)) @ coeffs, opr.apply(coeffs),
+            rtol=self.TOL, atol=self.TOL
+        )
+
+
+class TestLegendre(Suite, unittest.TestCase):
+
+    BASIS = polybases.Legendre()
+
+
+class TestChebyshev(Suite, unittest.TestCase):
+
+    BASIS = polybases.Chebyshev()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,89 @@
+# -*- coding: utf-8 -*-
+"""Test the conversion of coefficients between bases.
+"""
+import unittest
+import numpy as np
+from specbvp import polybases
+
+
+class Suite(unittest.TestCase):
+
+    SOURCE = None
+    TARGET = None
+
+    TOL = 1e-12
+
+    NUMBERS = [1, 2, 3, 12, 40]
+    NODES = np.linspace(-1., 1., 13)
+
+    def test_suite(self):
+        if self.SOURCE is not None:
+            for number in self.NUMBERS:
+                self._validate_conversion(number)
+
+    def test_fast(self):
+        if self.SOURCE is not None:
+            for number in [2, 3, 40, 301]:
+                self._validate_fastplan(number)
+
+    def test_axis(self):
+        if self.SOURCE is not None:
+            self._validate_axis()
+
+    def get_converter(self):
+        return self.SOURCE.converters()[self.TARGET[0]]
+
+    def get_coeffs(self, number, *shape):
+        rng = np.random.default_rng(number)
+        return rng.normal(size=(number, *shape))
+
+    def _validate_conversion(self, number):
+
+        coeffs = self.get_coeffs(number, 3)
+        converted = self.get_converter().convert(coeffs)
+
+        np.testing.assert_allclose(
+            self.TARGET[1].evaluate(converted, self.NODES),
+            self.SOURCE.evaluate(coeffs, self.NODES),
+            atol=self.TOL*number
+        )
+
+    def _validate_fastplan(self, number):
+
+        coeffs = self.get_coeffs(number, 2)
+        converter = self.get_converter()
+
+        mat = converter.compute_mat(number)
+        plan = converter.compute_fastplan(number)
+
+        np.testing.assert_allclose(
+            converter.apply_fast(plan, coeffs), mat @ coeffs,
+            atol=self.TOL*number
+        )
+
+    def _validate_axis(self):
+
+        coeffs = self.get_coeffs(9, 2, 4)
+        converter = self.get_converter()
+
+        np.testing.assert_allclose(
+            converter.convert(np.moveaxis(coeffs, 0, 1), axis=1),
+            np.moveaxis(converter.convert(coeffs), 0, 1),
+            atol=self.TOL
+        )
+
+
+class TestLegendreToChebyshev(Suite):
+
+    SOURCE = polybases.Legendre()
+    TARGET = ('chebyshev', polybases.Chebyshev())
+
+
+class TestChebyshevToLegendre(Suite):
+
+    SOURCE = polybases.Chebyshev()
+    TARGET = ('legendre', polybases.Legendre())
+
+
+if __name__ == '__main__':
+    unittest.main()
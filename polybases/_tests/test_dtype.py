@@ -0,0 +1,159 @@
+# -*- coding: utf-8 -*-
+"""Test the floating-point type of operators and node sets.
+"""
+import unittest
+import numpy as np
+from specbvp import polybases
+
+
+class Suite:
+
+    BASIS = None
+    DTYPES = [np.float32, np.longdouble]
+
+    NODES = np.linspace(-1., 1., 7)
+    INDICES = range(9)
+
+    def test_operators(self):
+        for dtype in self.DTYPES:
+            self._validate_operators(dtype)
+
+    def test_nodes(self):
+        for dtype in self.DTYPES:
+            self._validate_nodes(dtype)
+
+    def test_coeffoprs(self):
+        for dtype in self.DTYPES:
+            self._validate_coeffoprs(dtype)
+
+    def test_bundles(self):
+        for dtype in self.DTYPES:
+            self._validate_bundles(dtype)
+
+    def test_totals(self):
+        for dtype in self.DTYPES:
+            self._validate_totals(dtype)
+
+    def get_oprs(self, basis):
+        return [
+            basis.polys(),
+            basis.derivs(order=1),
+            basis.derivs(order=2),
+            basis.integax(weighted=False),
+            basis.integxb(weighted=True)
+        ]
+
+    def get_tol(self, dtype):
+        return 100.*np.finfo(dtype).eps
+
+    def _validate_operators(self, dtype):
+
+        basis = self.BASIS(dtype=dtype)
+        refbasis = self.BASIS()
+
+        oprs = self.get_oprs(basis)
+        refoprs = self.get_oprs(refbasis)
+
+        for opr, refopr in zip(oprs, refoprs):
+
+            opr.setnodes(self.NODES).setpolys(*self.INDICES)
+            refopr.setnodes(self.NODES).setpolys(*self.INDICES)
+
+            mat = opr.asmat()
+            refmat = refopr.asmat()
+
+            self.assertEqual(mat.dtype, dtype, msg=repr(opr))
+            np.testing.assert_allclose(
+                mat, refmat, rtol=self.get_tol(dtype), atol=1e-4
+            )
+
+            values = basis.evaluate(np.ones(9), self.NODES, opr)
+            self.assertEqual(values.dtype, dtype, msg=repr(opr))
+
+        bundle = basis.bundle(oprs).setnodes(self.NODES)
+
+        for mat in bundle.setpolys(*self.INDICES).asmats():
+            self.assertEqual(mat.dtype, dtype)
+
+    def _validate_bundles(self, dtype):
+
+        basis = self.BASIS(dtype=dtype)
+        oprs = self.get_oprs(basis)
+
+        bundle = basis.bundle(oprs).setnodes(self.NODES)
+        mats = bundle.setpolys(*self.INDICES).asmats()
+
+        for opr, mat in zip(oprs, mats):
+
+            opr.setnodes(self.NODES).setpolys(*self.INDICES)
+            refmat = opr.asmat()
+
+            self.assertEqual(mat.dtype, dtype, msg=repr(opr))
+            np.testing.assert_allclose(
+                mat, refmat, rtol=0,
+                atol=self.get_tol(dtype)*np.amax(np.fabs(refmat)),
+                err_msg=repr(opr)
+            )
+
+    def _validate_totals(self, dtype):
+
+        basis = self.BASIS(dtype=dtype)
+        tol = 10.*np.finfo(dtype).eps
+
+        for weighted in [False, True]:
+
+            integax = basis.integax(weighted=weighted)
+            integxb = basis.integxb(weighted=weighted)
+
+            total = integax.setnodes([1.]).setpolys(*self.INDICES).asmat()
+            refs = integxb.setnodes([-1.]).setpolys(*self.INDICES).asmat()
+
+            np.testing.assert_allclose(total, refs, rtol=0, atol=tol)
+
+    def _validate_nodes(self, dtype):
+
+        basis = self.BASIS(dtype=dtype)
+        refbasis = self.BASIS()
+
+        for family, nodeset in basis.nodes().items():
+
+            nodeset.setnum(12)
+            refset = refbasis.nodes()[family].setnum(12)
+
+            self.assertEqual(nodeset.nodes.dtype, dtype)
+            self.assertEqual(nodeset.weights.dtype, dtype)
+
+            np.testing.assert_allclose(
+                nodeset.nodes, refset.nodes, atol=self.get_tol(dtype)
+            )
+            np.testing.assert_allclose(
+                nodeset.weights, refset.weights, atol=self.get_tol(dtype)
+            )
+
+    def _validate_coeffoprs(self, dtype):
+
+        basis = self.BASIS(dtype=dtype)
+
+        oprs = [
+            basis.coeffderivs(order=2),
+            basis.coeffintegax(weighted=False),
+            basis.coeffintegxb(weighted=True)
+        ]
+
+        for opr in oprs:
+            image = opr.apply(np.ones(9))
+            self.assertEqual(image.dtype, dtype, msg=repr(opr))
+
+
+class TestLegendre(Suite, unittest.TestCase):
+
+    BASIS = polybases.Legendre
+
+
+class TestChebyshev(Suite, unittest.TestCase):
+
+    BASIS = polybases.Chebyshev
+
+
+if __name__ == '__main__':
+    unittest.main()
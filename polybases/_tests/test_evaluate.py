@@ -0,0 +1,86 @@
+# -*- coding: utf-8 -*-
+"""Test the evaluation of polynomial expansions.
+"""
+import unittest
+import numpy as np
+from specbvp import polybases
+
+
+class Suite:
+
+    BASIS = None
+    OPERATORS = []
+
+    TOL = 1e-11
+
+    NODES = np.linspace(-1., 1., 13)
+    COEFFS = np.random.default_rng(1).normal(size=(17, 4))
+
+    def test_suite(self):
+        for opr in self.OPERATORS:
+            self._validate_operator(opr)
+
+    def test_scalar(self):
+        self._validate_scalar()
+
+    def _validate_operator(self, opr):
+
+        coeffs = self.COEFFS
+
+        opr.setnodes(self.NODES)
+        opr.setpolys(*range(len(coeffs)))
+
+        refvals = opr.asmat() @ coeffs
+        values = self.BASIS.evaluate(coeffs, self.NODES, opr)
+
+        np.testing.assert_allclose(
+            values, refvals, atol=self.TOL, err_msg=repr(opr)
+        )
+
+    def _validate_scalar(self):
+
+        coeffs = self.COEFFS[:, 0]
+
+        opr = self.BASIS.polys()
+        opr.setnodes(0.5)
+        opr.setpolys(*range(len(coeffs)))
+
+        self.assertAlmostEqual(
+            self.BASIS.evaluate(coeffs, 0.5), opr.asmat() @ coeffs,
+            delta=self.TOL
+        )
+
+
+class TestLegendre(Suite, unittest.TestCase):
+
+    BASIS = polybases.Legendre()
+
+    OPERATORS = [
+        BASIS.polys(),
+        BASIS.derivs(order=1),
+        BASIS.derivs(order=2),
+        BASIS.integax(weighted=False),
+        BASIS.integxb(weighted=False),
+        BASIS.integax(weighted=True),
+        BASIS.integxb(weighted=True)
+    ]
+
+
+class TestChebyshev(Suite, unittest.TestCase):
+
+    BASIS = polybases.Chebyshev()
+
+    OPERATORS = [
+        BASIS.polys(),
+        BASIS.derivs(order=1),
+        BASIS.derivs(order=2),
+        BASIS.derivs(order=3),
+        BASIS.integax(weighted=False),
+        BASIS.integxb(weighted=False),
+        BASIS.integax(weighted=True),
+        BASIS.integxb(weighted=True)
+    ]
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -3,6 +3,7 @@
 """
 import math
 import unittest
+import numpy as np
 from specbvp.polybases import utils
 
 
@@ -20,6 +21,26 @@ class DottieNumber(utils.SolverNewton):
         return -math.sin(arg) - 1.
 
 
+class SquareRoot(utils.SolverMasked):
+    """Example solver of x*x = a from an array of guesses.
+    """
+
+    def __init__(self, value):
+        super().__init__()
+        self.value = value
+        self.sizes = []
+
+    def computenext(self, arg):
+        self.sizes.append(arg.size)
+        return super().computenext(arg)
+
+    def get_func(self, arg):
+        return arg*arg - self.value
+
+    def get_deriv(self, arg):
+        return 2.*arg
+
+
 class TestSolverNewton(unittest.TestCase):
 
     DOTTIE = 0.7390851332151607
@@ -57,5 +78,50 @@ class TestSolverNewton(unittest.TestCase):
         )
 
 
+class TestSolverMasked(unittest.TestCase):
+
+    VALUE = 2.
+    GUESSES = [math.sqrt(2.), 1., 4., 100., 1e3]
+
+    def test_compute(self):
+
+        solver = SquareRoot(self.VALUE).compute(self.GUESSES, tol=1e-14)
+
+        np.testing.assert_allclose(
+            solver.result, np.full(5, math.sqrt(self.VALUE))
+        )
+
+        assert solver.converge is True
+        assert solver.converged.all()
+
+    def test_masking(self):
+
+        solver = SquareRoot(self.VALUE).compute(self.GUESSES, tol=1e-14)
+
+        assert solver.counts[0] == 1
+        assert solver.counts[-1] == len(solver.history)
+
+        assert solver.sizes == sorted(solver.sizes, reverse=True)
+        assert sum(solver.sizes) == solver.counts.sum()
+
+    def test_converge(self):
+
+        solver = SquareRoot(self.VALUE)
+        solver.compute(self.GUESSES, tol=1e-14, maxiter=3)
+
+        assert solver.converge is False
+        assert solver.converged[0] and not solver.converged[-1]
+
+        np.testing.assert_allclose(solver.result[0], math.sqrt(self.VALUE))
+        assert solver.result[-1] > 100.
+
+    def test_empty(self):
+
+        solver = SquareRoot(self.VALUE).compute(np.ones(0), tol=1e-14)
+
+        assert solver.converge is True
+        assert solver.history == []
+        assert solver.result.size == 0
+
 if __name__ == '__main__':
     unittest.main()
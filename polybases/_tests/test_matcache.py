@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+"""Test the cache of operator matrices.
+"""
+import unittest
+import numpy as np
+from specbvp import polybases
+from specbvp.polybases import utils
+
+NODES = np.linspace(-1., 1., 11)
+INDICES = range(8)
+
+
+def realize(opr, cache, nodes=NODES):
+    opr.setcache(cache).setnodes(nodes).setpolys(*INDICES)
+    return opr.asmat()
+
+
+class TestMatCache(unittest.TestCase):
+
+    def test_hits(self):
+
+        cache = utils.MatCache()
+        basis = polybases.Legendre()
+
+        first = realize(basis.derivs(order=2), cache)
+        second = realize(basis.derivs(order=2), cache)
+
+        assert first is second
+        assert not second.flags.writeable
+
+        stats = cache.stats()
+
+        assert stats['hits'] == 1
+        assert stats['misses'] == 1
+        assert stats['nbytes'] == first.nbytes
+
+    def test_keys(self):
+
+        cache = utils.MatCache()
+
+        mats = [
+            realize(polybases.Legendre().derivs(order=1), cache),
+            realize(polybases.Legendre().derivs(order=2), cache),
+            realize(polybases.Chebyshev().derivs(order=1), cache),
+            realize(polybases.Legendre().integax(weighted=False), cache),
+            realize(polybases.Legendre().integax(weighted=True), cache),
+            realize(polybases.Legendre().polys(), cache, NODES[1:]),
+            realize(polybases.Legendre().polys(), cache, NODES[0])
+        ]
+
+        assert cache.stats()['misses'] == len(mats)
+        assert cache.stats()['hits'] == 0
+
+        np.testing.assert_array_equal(
+            mats[0], polybases.Legendre().derivs(order=1).setnodes(
+                NODES
+            ).setpolys(*INDICES).asmat()
+        )
+
+    def test_budget(self):
+
+        matbytes = len(NODES)*len(INDICES)*8
+        cache = utils.MatCache(maxbytes=2*matbytes)
+
+        for order in [1, 2, 3, 1]:
+            realize(polybases.Legendre().derivs(order=order), cache)
+
+        stats = cache.stats()
+
+        assert stats['size'] == 2
+        assert stats['nbytes'] == 2*matbytes
+        assert stats['evictions'] == 2
+
+        cache.setbytes(matbytes//2)
+        realize(polybases.Legendre().polys(), cache)
+
+        assert cache.stats()['size'] == 0
+        assert cache.stats()['nbytes'] == 0
+
+    def test_out(self):
+
+        cache = utils.MatCache()
+        opr = polybases.Legendre().polys()
+
+        first = realize(opr, cache)
+        out = np.empty_like(first)
+
+        assert opr.asmat(out=out) is out
+        assert out.flags.writeable
+        assert cache.stats()['hits'] == 1
+
+        np.testing.assert_array_equal(out, first)
+
+
+if __name__ == '__main__':
+    unittest.main()
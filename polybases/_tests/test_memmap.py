@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+"""Test matrices in memory-mapped files and their blocked products.
+"""
+import os
+import tempfile
+import unittest
+import numpy as np
+from specbvp import polybases
+from specbvp.polybases.utils import blockprods
+
+NODES = np.linspace(-1., 1., 501)
+INDICES = [6, 0, 2, 11]
+
+
+class TestMemmap(unittest.TestCase):
+
+    OPERATORS = [
+        polybases.Legendre().polys(),
+        polybases.Chebyshev().derivs(order=2),
+        polybases.Legendre().integxb(weighted=True),
+        polybases.Chebyshev().integax(weighted=False)
+    ]
+
+    def test_tempfile(self):
+        for opr in self.OPERATORS:
+
+            opr.setnodes(NODES).setpolys(*INDICES)
+            outmat = opr.asmemmap()
+
+            self.assertIsInstance(outmat, np.memmap)
+            np.testing.assert_allclose(
+                outmat, opr.asmat(), atol=1e-13, err_msg=repr(opr)
+            )
+
+    def test_filename(self):
+
+        opr = polybases.Legendre().derivs(order=1)
+        opr.setnodes(NODES).setpolys(*INDICES)
+
+        with tempfile.TemporaryDirectory() as dirname:
+
+            filename = os.path.join(dirname, 'mat.dat')
+            outmat = opr.asmemmap(filename)
+
+            stored = np.fromfile(filename).reshape(len(INDICES), -1)
+
+            np.testing.assert_array_equal(stored.T, outmat)
+            del outmat
+
+    def test_out(self):
+
+        opr = polybases.Chebyshev().polys()
+        opr.setnodes(NODES).setpolys(*INDICES)
+
+        with tempfile.TemporaryFile() as file:
+            out = np.memmap(file, float, 'w+', shape=(len(NODES), 4))
+            self.assertIs(opr.asmat(out=out), out)
+
+        np.testing.assert_array_equal(out, opr.asmat())
+
+        with tempfile.TemporaryFile() as file:
+            out = np.memmap(file, np.int8, 'w+', shape=(len(NODES), 4))
+            with self.assertRaises(TypeError):
+                opr.asmat(out=out)
+
+
+class TestBlockProds(unittest.TestCase):
+
+    def setUp(self):
+        opr = polybases.Legendre().polys().setnodes(NODES)
+        self.mat = opr.setpolys(*range(8)).asmemmap()
+        self.rhs = np.cos(np.pi*NODES)
+
+    def test_gram(self):
+        for blocksize in [None, 1, 64, 1000]:
+            np.testing.assert_allclose(
+                blockprods.gram(self.mat, blocksize),
+                self.mat.T @ self.mat, rtol=1e-12, atol=1e-12
+            )
+
+    def test_tdot(self):
+
+        rhs = np.stack([self.rhs, NODES], axis=-1)
+
+        for blocksize in [None, 1, 64, 1000]:
+            np.testing.assert_allclose(
+                blockprods.tdot(self.mat, rhs, blocksize),
+                self.mat.T @ rhs, rtol=1e-12, atol=1e-12
+            )
+
+        with self.assertRaises(ValueError):
+            blockprods.tdot(self.mat, self.rhs[1:])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,118 @@
+# -*- coding: utf-8 -*-
+"""Test the cache of node sets.
+"""
+import tempfile
+import unittest
+import numpy as np
+from specbvp import polybases
+from specbvp.polybases import utils
+
+GAUSS = polybases.Legendre().nodes().get('gauss')
+
+
+class CacheSwap(unittest.TestCase):
+    """Base for tests running with a fresh cache.
+    """
+
+    def setUp(self):
+        self.saved = polybases.NodeSet.CACHE
+
+    def tearDown(self):
+        polybases.NodeSet.CACHE = self.saved
+
+    def set_cache(self, *args, **kwargs):
+        cache = utils.NodesCache(*args, **kwargs)
+        polybases.NodeSet.CACHE = cache
+        return cache
+
+
+class TestMemory(CacheSwap):
+
+    def test_hits(self):
+
+        cache = self.set_cache()
+
+        first = GAUSS.setnum(5).nodes
+        second = GAUSS.setnum(5).nodes
+
+        assert first is second
+        assert not second.flags.writeable
+
+        stats = cache.stats()
+
+        assert stats['hits'] == 1
+        assert stats['misses'] == 1
+
+    def test_eviction(self):
+
+        cache = self.set_cache(maxsize=2)
+
+        for number in [3, 4, 5, 3]:
+            GAUSS.setnum(number)
+
+        stats = cache.stats()
+
+        assert stats['size'] == 2
+        assert stats['misses'] == 4
+        assert stats['evictions'] == 2
+
+    def test_methods(self):
+
+        self.set_cache()
+        quad = polybases.Legendre().nodes().get('gauss')
+
+        asynodes = quad.setmethod('asymptotic').setnum(40).nodes
+        newtonnodes = quad.setmethod('newton').setnum(40).nodes
+
+        assert asynodes is not newtonnodes
+        assert quad.setmethod('asymptotic').setnum(40).nodes is asynodes
+
+        np.testing.assert_allclose(asynodes, newtonnodes, atol=1e-14)
+
+    def test_disabled(self):
+
+        polybases.NodeSet.CACHE = None
+
+        first = GAUSS.setnum(5).nodes
+        second = GAUSS.setnum(5).nodes
+
+        assert first is not second
+
+
+class TestDisk(CacheSwap):
+
+    def test_store(self):
+
+        with tempfile.TemporaryDirectory() as cachedir:
+
+            self.set_cache(cachedir=cachedir)
+            refnodes = GAUSS.setnum(6).nodes
+
+            cache = self.set_cache(cachedir=cachedir)
+            quad = GAUSS.setnum(6)
+
+            assert isinstance(quad.nodes, np.memmap)
+            assert cache.stats()['loads'] == 1
+
+            np.testing.assert_array_equal(quad.nodes, refnodes)
+
+    def test_methods(self):
+
+        with tempfile.TemporaryDirectory() as cachedir:
+
+            quad = polybases.Legendre().nodes().get('gauss')
+
+            self.set_cache(cachedir=cachedir)
+            asynodes = quad.setmethod('asymptotic').setnum(40).nodes
+
+            cache = self.set_cache(cachedir=cachedir)
+            quad.setmethod('newton').setnum(40)
+
+            assert cache.stats()['loads'] == 0
+            assert not isinstance(quad.nodes, np.memmap)
+
+            np.testing.assert_allclose(quad.nodes, asynodes, atol=1e-14)
+
+
+if __name__ == '__main__':
+    unittest.main()
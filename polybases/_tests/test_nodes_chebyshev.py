@@ -0,0 +1,73 @@
+# -*- coding: utf-8 -*-
+"""Test the Chebyshev quadrature rules.
+"""
+import math
+import unittest
+import numpy as np
+from specbvp import polybases
+
+CHEBYSHEV = polybases.Chebyshev()
+
+
+class Suite(unittest.TestCase):
+
+    TOL = 1e-13
+
+    FAMILY = None
+    NUMBERS = []
+
+    def test_exactness(self):
+        for number in self.NUMBERS:
+            self._validate_exactness(number)
+
+    def _validate_exactness(self, number):
+        """Rules are exact for polynomials of degree n-1.
+        """
+
+        quad = CHEBYSHEV.nodes().get(self.FAMILY).setnum(number)
+
+        opr = CHEBYSHEV.polys()
+        opr.setnodes(quad.nodes)
+        opr.setpolys(*range(number))
+
+        integs = quad.weights @ opr.asmat()
+        refinteg = CHEBYSHEV.integax().setnodes(1.)
+
+        for index, integ in enumerate(integs):
+            self.assertAlmostEqual(
+                integ, refinteg.setpolys(index).asmat()[0], delta=self.TOL
+            )
+
+
+class TestGauss(Suite):
+
+    FAMILY = 'gauss'
+    NUMBERS = [1, 2, 3, 8, 33]
+
+    def test_nodes(self):
+
+        nodes = CHEBYSHEV.nodes().get('gauss').setnum(3).nodes
+        node = math.sqrt(3.)/2.
+
+        np.testing.assert_allclose(
+            nodes, [-node, 0., node], atol=self.TOL
+        )
+
+
+class TestLobatto(Suite):
+
+    FAMILY = 'lobatto'
+    NUMBERS = [2, 3, 8, 33]
+
+    def test_nodes(self):
+
+        nodes = CHEBYSHEV.nodes().get('lobatto').setnum(5).nodes
+        node = math.sqrt(2.)/2.
+
+        np.testing.assert_allclose(
+            nodes, [-1., -node, 0., node, 1.], atol=self.TOL
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -110,5 +110,70 @@ class TestGauss(unittest.TestCase):
         self._validate_quad(number=4)
 
 
+class TestLobatto(unittest.TestCase):
+
+    TOL = 1e-13
+
+    QUAD = polybases.Legendre().nodes().get('lobatto')
+
+    def test_quad_five(self):
+
+        quad = self.QUAD.setnum(5)
+        node = math.sqrt(21.)/7.
+
+        np.testing.assert_allclose(
+            quad.nodes, [-1., -node, 0., node, 1.], atol=self.TOL
+        )
+
+        np.testing.assert_allclose(
+            quad.weights, [0.1, 49./90., 32./45., 49./90., 0.1],
+            atol=self.TOL
+        )
+
+    def test_exactness(self):
+        """Rule is exact for polynomials of degree 2n-3.
+        """
+
+        number = 12
+        quad = self.QUAD.setnum(number)
+
+        for power in range(2*number-2):
+            integ = quad.weights @ quad.nodes**power
+            refinteg = (1 + (-1)**power)/(power + 1.)
+            self.assertAlmostEqual(integ, refinteg, delta=self.TOL)
+
+
+class TestGaussMethods(unittest.TestCase):
+
+    TOL = 1e-12
+
+    NUMBERS = [
+        1, 2, 7, 20, 21, 120, 121
+    ]
+
+    def test_methods(self):
+        for number in self.NUMBERS:
+            self._validate_methods(number)
+
+    def _validate_methods(self, number):
+
+        quad = polybases.legendre.gaussnodes.GaussNodes()
+
+        refquad = quad.setmethod('newton').compute_nodeset(number)
+        asyquad = quad.setmethod('asymptotic').compute_nodeset(number)
+
+        for ref, val in zip(refquad, asyquad):
+            err = np.amax(np.fabs(val - ref))
+            assert err < self.TOL, number
+
+    def test_default(self):
+
+        quad = polybases.legendre.gaussnodes.GaussNodes()
+        number = quad.ASYNUM + 1
+
+        assert quad.get_method(number) == 'asymptotic'
+        assert quad.get_method(number-1) == 'newton'
+
+
 if __name__ == '__main__':
     unittest.main()
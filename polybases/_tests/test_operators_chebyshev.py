@@ -2,9 +2,13 @@
 """Test operators on the Chebyschev polynomials.
 """
 import math
+import tracemalloc
 import unittest
+import numpy as np
 from specbvp import polybases
 
+CHEBYSHEV = polybases.Chebyshev()
+
 
 class Suite(unittest.TestCase):
 
@@ -74,6 +78,37 @@ class TestDerivs(Suite):
     ]
 
 
+class TestDerivsTwo(Suite):
+
+    OPERATOR = polybases.Chebyshev().derivs(order=2)
+
+    CASES = {
+        'A': (0.5, 1, 0.),
+        'B': (-1., 2, 4.),
+        'C': (0.5, 4, 8.),
+        'D': (0., 6, 36.),
+        'E': (1., 6, 420.),
+        'F': (-1., 7, -784.)
+    }
+
+    PROPS = [
+        '(d/dx)^2 T_{n} at x = 1 is n^2*(n^2-1)/3',
+        '(d/dx)^2 T_{n} at x = -1 is (-1)^n*n^2*(n^2-1)/3'
+    ]
+
+
+class TestDerivsThree(Suite):
+
+    OPERATOR = polybases.Chebyshev().derivs(order=3)
+
+    CASES = {
+        'A': (0.5, 2, 0.),
+        'B': (0.5, 3, 24.),
+        'C': (0.5, 4, 96.),
+        'D': (1., 5, 840.)
+    }
+
+
 class TestIntegT0Tn(Suite):
 
     OPERATOR = polybases.chebyshev.IntegT0Tn()
@@ -153,5 +188,205 @@ class TestIntegT1TnXB(Suite):
     }
 
 
+class TestItercols(unittest.TestCase):
+    """Realization of operators column by column.
+    """
+
+    NODES = np.linspace(-1., 1., 9)
+    INDICES = [7, 0, 3, 1, 12, 3]
+
+    OPERATORS = [
+        CHEBYSHEV.polys(),
+        CHEBYSHEV.derivs(order=2),
+        CHEBYSHEV.integax(weighted=False),
+        CHEBYSHEV.integax(weighted=True),
+        CHEBYSHEV.integxb(weighted=False),
+        CHEBYSHEV.integxb(weighted=True)
+    ]
+
+    def test_columns(self):
+        for opr in self.OPERATORS:
+            self._validate_columns(opr)
+
+    def test_blocks(self):
+        for opr in self.OPERATORS:
+            self._validate_blocks(opr, blocksize=2)
+
+    def test_memory(self):
+
+        nodes = np.linspace(-1., 1., 10000)
+
+        opr = CHEBYSHEV.integxb(weighted=True)
+        opr.setnodes(nodes).setpolys(*range(0, 3000, 1000))
+
+        tracemalloc.start()
+        for _ in opr.itercols():
+            pass
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        self.assertLess(peak, 50*nodes.nbytes)
+
+    def get_refmat(self, opr):
+        opr.setnodes(self.NODES).setpolys(*sorted(set(self.INDICES)))
+        return opr.asmat()
+
+    def _validate_columns(self, opr):
+
+        refmat = self.get_refmat(opr)
+        opr.setpolys(*self.INDICES)
+
+        items = list(opr.itercols())
+
+        self.assertEqual(
+            [index for index, _ in items], sorted(set(self.INDICES))
+        )
+
+        for (_, column), refcol in zip(items, refmat.T):
+            np.testing.assert_allclose(
+                column, refcol, atol=1e-14, err_msg=repr(opr)
+            )
+
+    def _validate_blocks(self, opr, blocksize):
+
+        refmat = self.get_refmat(opr)
+        opr.setpolys(*self.INDICES)
+
+        blocks = list(opr.itercols(blocksize))
+        indices = np.concatenate([index for index, _ in blocks])
+
+        np.testing.assert_array_equal(indices, sorted(set(self.INDICES)))
+        np.testing.assert_allclose(
+            np.concatenate([block for _, block in blocks], axis=-1),
+            refmat, atol=1e-14, err_msg=repr(opr)
+        )
+
+
+class TestElements(unittest.TestCase):
+    """Operators mapped to elements.
+    """
+
+    BOUNDS = [[0., 1.], [1., 3.], [-2., 0.5]]
+    NODES = np.linspace(-1., 1., 7)
+    INDICES = range(6)
+
+    def test_shape(self):
+
+        opr = self.get_elementopr(CHEBYSHEV.derivs(order=1))
+
+        shape = (len(self.BOUNDS), len(self.NODES), len(self.INDICES))
+
+        self.assertEqual(opr.asmat().shape, shape)
+        self.assertEqual(opr.getnodes().shape, shape[:-1])
+
+        out = np.empty(shape)
+        self.assertIs(opr.asmat(out=out), out)
+
+    def test_scaling(self):
+
+        oprs = [
+            (CHEBYSHEV.polys(), 0),
+            (CHEBYSHEV.derivs(order=2), -2),
+            (CHEBYSHEV.integax(weighted=False), 1),
+            (CHEBYSHEV.integxb(weighted=False), 1)
+        ]
+
+        for refopr, power in oprs:
+
+            refopr.setnodes(self.NODES).setpolys(*self.INDICES)
+            refmat = refopr.asmat()
+
+            mats = self.get_elementopr(refopr).asmat()
+
+            for (lower, upper), mat in zip(self.BOUNDS, mats):
+                scale = (0.5*(upper-lower))**power
+                np.testing.assert_allclose(
+                    mat, scale*refmat, rtol=1e-14, err_msg=repr(refopr)
+                )
+
+    def test_physical(self):
+        """Derivative of T1 and integral of T0 on [a,x].
+        """
+
+        derivs = self.get_elementopr(CHEBYSHEV.derivs(order=1))
+        integs = self.get_elementopr(CHEBYSHEV.integax())
+
+        nodes = derivs.getnodes()
+        lowers = np.array(self.BOUNDS)[:, :1]
+        lengths = np.diff(self.BOUNDS, axis=-1)
+
+        np.testing.assert_allclose(
+            derivs.asmat()[..., 1], np.broadcast_to(2./lengths, nodes.shape)
+        )
+        np.testing.assert_allclose(
+            integs.asmat()[..., 0], nodes - lowers, atol=1e-14
+        )
+
+    def test_weighted(self):
+        self._validate_weighted(CHEBYSHEV.integax(True), fromx=False)
+        self._validate_weighted(CHEBYSHEV.integxb(True), fromx=True)
+
+    def test_settings(self):
+        """The unweighted counterpart copies the settings, not the state.
+        """
+
+        cache = polybases.utils.MatCache()
+        workspace = polybases.utils.Workspace()
+
+        opr = CHEBYSHEV.integax(weighted=True).setdtype(np.float32)
+        opr.setcache(cache).setworkers(2).setworkspace(workspace)
+
+        elementopr = self.get_elementopr(opr)
+        unweighted = elementopr.get_unweighted()
+
+        self.assertIsNot(unweighted, opr.UNWEIGHTED)
+        self.assertIsNone(opr.UNWEIGHTED.nodes)
+        self.assertIsNone(type(opr).UNWEIGHTED.dtype)
+
+        self.assertEqual(unweighted.dtype, np.float32)
+        self.assertIs(unweighted.cache, cache)
+        self.assertIs(unweighted.workspace, workspace)
+        self.assertEqual(unweighted.workers, 2)
+
+        self.assertEqual(elementopr.asmat().dtype, np.float32)
+
+    def test_bounds(self):
+        with self.assertRaises(ValueError):
+            CHEBYSHEV.onelements(CHEBYSHEV.polys(), [0., 1., 2.])
+
+    def get_elementopr(self, opr):
+        opr = CHEBYSHEV.onelements(opr, self.BOUNDS)
+        return opr.setnodes(self.NODES).setpolys(*self.INDICES)
+
+    def _validate_weighted(self, opr, fromx):
+        """Integrals of s*P(t(s)) by Gauss quadrature in s.
+        """
+
+        elementopr = self.get_elementopr(opr)
+
+        mats = elementopr.asmat()
+        nodes = elementopr.getnodes()
+
+        points, weights = np.polynomial.legendre.leggauss(8)
+        polys = CHEBYSHEV.polys().setpolys(*self.INDICES)
+
+        for (lower, upper), mat, element in zip(self.BOUNDS, mats, nodes):
+
+            half = 0.5*(upper-lower)
+
+            for node, row in zip(element, mat):
+
+                start, stop = (node, upper) if fromx else (lower, node)
+                length = 0.5*(stop-start)
+
+                svalues = start + length*(points+1.)
+                values = polys.setnodes((svalues-lower)/half - 1.).asmat()
+
+                np.testing.assert_allclose(
+                    row, length*(weights*svalues) @ values,
+                    atol=1e-13, err_msg=repr(opr)
+                )
+
+
 if __name__ == '__main__':
     unittest.main()
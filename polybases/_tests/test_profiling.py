@@ -0,0 +1,81 @@
+# -*- coding: utf-8 -*-
+"""Test the counters of operators and Newton solvers.
+"""
+import unittest
+import numpy as np
+from specbvp import polybases
+from specbvp.polybases import utils
+
+NODES = np.linspace(-1., 1., 11)
+
+
+def get_record(stats, name):
+    for key, record in stats.items():
+        if key.endswith(name):
+            return record
+    return None
+
+
+class TestProfiler(unittest.TestCase):
+
+    def test_operators(self):
+
+        opr = polybases.Legendre().polys()
+        opr.setnodes(NODES).setpolys(*range(9))
+
+        with utils.Profiler() as profiler:
+            outmat = opr.asmat()
+            opr.asmat()
+
+        record = get_record(profiler.stats()['operators'], 'Polys')
+
+        self.assertEqual(record['calls'], 2)
+        self.assertEqual(record['steps'], 2*7)
+        self.assertEqual(record['bytes'], 2*outmat.nbytes)
+        self.assertGreater(record['arrays'], 0)
+        self.assertGreater(record['seconds'], 0.)
+
+    def test_integrators(self):
+
+        opr = polybases.Chebyshev().integxb(weighted=True)
+        opr.setnodes(NODES).setpolys(0, 4, 8)
+
+        with utils.Profiler() as profiler:
+            opr.asmat()
+
+        stats = profiler.stats()['operators']
+
+        self.assertEqual(get_record(stats, 'IntegT1TnXB')['calls'], 1)
+        self.assertEqual(get_record(stats, '.IntegT1Tn')['triplets'], 3)
+        self.assertGreater(get_record(stats, '.Polys')['steps'], 0)
+
+    def test_solvers(self):
+
+        nodeset = polybases.Legendre().nodes()['gauss']
+        nodeset.CACHE = None
+
+        with utils.Profiler() as profiler:
+            nodeset.setnum(20)
+
+        record = get_record(profiler.stats()['solvers'], 'NodesFinder')
+
+        self.assertEqual(record['calls'], 1)
+        self.assertEqual(record['failures'], 0)
+        self.assertEqual(record['iterations'], len(record['histories'][0]))
+        self.assertLess(record['histories'][0][-1], 1e-14)
+
+    def test_inactive(self):
+
+        profiler = utils.Profiler()
+
+        polybases.Legendre().polys().setnodes(NODES).setpolys(3).asmat()
+
+        with profiler:
+            pass
+
+        self.assertIsNone(utils.profiling.ACTIVE)
+        self.assertEqual(profiler.stats(), {'operators': {}, 'solvers': {}})
+
+
+if __name__ == '__main__':
+    unittest.main()
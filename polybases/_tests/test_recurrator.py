@@ -0,0 +1,262 @@
+# -*- coding: utf-8 -*-
+"""Test the array engine for recurrence relations.
+"""
+import tracemalloc
+import unittest
+import numpy as np
+from specbvp import polybases
+
+
+class TestSeqArray(unittest.TestCase):
+
+    NODES = np.linspace(-1., 1., 11)
+    MAXINDEX = 8
+
+    OPERATORS = [
+        polybases.Legendre().polys(),
+        polybases.Legendre().derivs(order=1),
+        polybases.Legendre().derivs(order=3),
+        polybases.Chebyshev().polys(),
+        polybases.Chebyshev().derivs(order=1)
+    ]
+
+    def test_layouts(self):
+
+        recurr = polybases.Legendre().polys().setnodes(self.NODES)
+        refseq = np.array(recurr.getsequence(self.MAXINDEX))
+
+        rows = recurr.getseqarray(self.MAXINDEX)
+        cols = recurr.getseqarray(self.MAXINDEX, transpose=True)
+
+        assert rows.flags.c_contiguous
+        assert cols.T.flags.c_contiguous
+
+        np.testing.assert_allclose(rows, refseq, atol=1e-14)
+        np.testing.assert_allclose(cols, refseq.T, atol=1e-14)
+
+    def test_subset(self):
+
+        recurr = polybases.Legendre().polys().setnodes(self.NODES)
+        refseq = np.array(recurr.getsequence(self.MAXINDEX))
+
+        indices = [self.MAXINDEX, 0, 5, 5, 2]
+        subset = recurr.getseqsubset(indices)
+
+        np.testing.assert_allclose(subset, refseq[indices], atol=1e-14)
+
+    def test_outcols(self):
+        for opr in self.OPERATORS:
+            self._validate_outcols(opr)
+
+    def _validate_outcols(self, opr):
+
+        indices = np.array([1, self.MAXINDEX, 0, 4, 4])
+        outmat = opr.getoutmat(self.NODES, self.MAXINDEX)
+
+        opr.setnodes(self.NODES)
+        opr.setpolys(*indices)
+
+        np.testing.assert_allclose(
+            opr.asmat(), outmat[:, np.unique(indices)], atol=1e-12,
+            err_msg=repr(opr)
+        )
+
+    def test_outmat(self):
+        for opr in self.OPERATORS:
+            self._validate_outmat(opr)
+
+    def _validate_outmat(self, opr):
+
+        outs = opr.getoutputs(self.NODES, self.MAXINDEX)
+        outmat = opr.getoutmat(self.NODES, self.MAXINDEX)
+
+        np.testing.assert_allclose(
+            outmat, np.array(outs).T, atol=1e-12, err_msg=repr(opr)
+        )
+
+    def test_columns(self):
+        """Columns follow the sorted unique indices.
+        """
+
+        opr = polybases.Legendre().polys().setnodes(self.NODES)
+        outmat = opr.getoutmat(self.NODES, self.MAXINDEX)
+
+        opr.setpolys(3, 1, 1)
+
+        self.assertEqual(list(opr.asdict()), [1, 3])
+        np.testing.assert_allclose(
+            opr.asmat(), outmat[:, [1, 3]], atol=1e-14
+        )
+
+
+class TestOutBuffers(unittest.TestCase):
+
+    NODES = np.linspace(-1., 1., 11)
+    INDICES = [1, 8, 0, 4]
+
+    OPERATORS = [
+        polybases.Legendre().polys(),
+        polybases.Legendre().derivs(order=2),
+        polybases.Legendre().integax(weighted=True),
+        polybases.Chebyshev().polys(),
+        polybases.Chebyshev().derivs(order=2),
+        polybases.Chebyshev().integxb(weighted=False)
+    ]
+
+    def test_suite(self):
+        for opr in self.OPERATORS:
+            self._validate_out(opr)
+
+    def test_workspace(self):
+
+        workspace = polybases.utils.Workspace()
+
+        opr = polybases.Legendre().polys().setworkspace(workspace)
+        opr.setnodes(self.NODES).setpolys(*self.INDICES)
+
+        out = np.empty((len(self.INDICES), len(self.NODES))).T
+
+        opr.asmat(out=out)
+        arrays = dict(workspace.arrays)
+
+        opr.asmat(out=out)
+
+        for name, array in workspace.arrays.items():
+            self.assertIs(array, arrays[name])
+
+    def test_nested_workspace(self):
+
+        integrators = [
+            polybases.Legendre().integax(weighted=True),
+            polybases.Legendre().integxb(weighted=False),
+            polybases.Chebyshev().integax(weighted=False)
+        ]
+
+        for opr in integrators:
+
+            workspace = polybases.utils.Workspace()
+
+            opr.setworkspace(workspace)
+            opr.setnodes(self.NODES).setpolys(*self.INDICES)
+
+            opr.asmat()
+            self.assertTrue(workspace.arrays, msg=repr(opr))
+
+    def test_inner_operators(self):
+        """Inner operators are owned by the instance, not by its class.
+        """
+
+        workspace = polybases.utils.Workspace()
+
+        opr = polybases.Legendre().integax(weighted=True)
+        other = polybases.Legendre().integax(weighted=True)
+
+        opr.setworkspace(workspace)
+        inner = opr.INTEG_FROM_X.PRIMINTEG.BASES
+
+        self.assertIs(inner.workspace, workspace)
+        self.assertIsNot(inner, other.INTEG_FROM_X.PRIMINTEG.BASES)
+
+        for integ in [other, type(opr)]:
+            self.assertIsNone(integ.INTEG_FROM_X.PRIMINTEG.workspace)
+            self.assertIsNone(integ.UNWEIGHTED.workspace)
+
+        clone = opr.clone()
+        self.assertIsNot(clone.INTEG_FROM_X.PRIMINTEG.BASES, inner)
+
+    def test_shape(self):
+
+        opr = polybases.Legendre().polys()
+        opr.setnodes(self.NODES).setpolys(*self.INDICES)
+
+        with self.assertRaises(ValueError):
+            opr.asmat(out=np.empty((len(self.INDICES), len(self.NODES))))
+
+    def _validate_out(self, opr):
+
+        opr.setnodes(self.NODES).setpolys(*self.INDICES)
+        opr.setworkspace(polybases.utils.Workspace())
+
+        out = np.empty((len(self.NODES), len(self.INDICES)))
+
+        self.assertIs(opr.asmat(out=out), out)
+        np.testing.assert_allclose(
+            out, opr.asmat(), atol=1e-12, err_msg=repr(opr)
+        )
+
+
+class TestIntegSubsets(unittest.TestCase):
+
+    NODES = np.linspace(-1., 1., 11)
+    INDICES = [7, 0, 3, 4, 1, 7]
+
+    OPERATORS = [
+        polybases.Legendre().integax(weighted=False),
+        polybases.Legendre().integxb(weighted=True),
+        polybases.Chebyshev().integax(weighted=True),
+        polybases.Chebyshev().integxb(weighted=False)
+    ]
+
+    def test_subset(self):
+        for opr in self.OPERATORS:
+
+            opr.setnodes(self.NODES).setpolys(*self.INDICES)
+            outmat = opr.getoutmat(self.NODES, max(self.INDICES))
+
+            np.testing.assert_allclose(
+                opr.asmat(), outmat[:, np.unique(self.INDICES)], atol=1e-14,
+                err_msg=repr(opr)
+            )
+
+    def test_contiguous(self):
+        for opr in self.OPERATORS:
+
+            outmat = opr.getoutmat(self.NODES, 9)
+
+            for indices in [range(0, 6), range(3, 10), [5]]:
+
+                opr.setnodes(self.NODES).setpolys(*indices)
+
+                np.testing.assert_allclose(
+                    opr.asmat(), outmat[:, indices], atol=1e-14,
+                    err_msg=repr(opr)
+                )
+
+    def test_memory(self):
+
+        nodes = np.linspace(-1., 1., 10000)
+        opr = polybases.Legendre().integax(weighted=True)
+        opr.setnodes(nodes).setpolys(2000)
+
+        tracemalloc.start()
+        opr.asmat()
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        self.assertLess(peak, 50*nodes.nbytes)
+
+    def test_out_memory(self):
+        """Integrators write to out with scratch from the workspace.
+        """
+
+        nodes = np.linspace(-1., 1., 10000)
+
+        for opr in self.OPERATORS:
+            for indices in [range(100, 130), [3, 50, 7, 120, 0, 64]]:
+
+                opr.setworkspace(polybases.utils.Workspace())
+                opr.setnodes(nodes).setpolys(*indices)
+
+                out = np.empty((len(set(indices)), len(nodes))).T
+                opr.asmat(out=out)
+
+                tracemalloc.start()
+                opr.asmat(out=out)
+                _, peak = tracemalloc.get_traced_memory()
+                tracemalloc.stop()
+
+                self.assertLess(peak, 4*nodes.nbytes, msg=repr(opr))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,174 @@
+# -*- coding: utf-8 -*-
+"""Test the real roots of expansions.
+"""
+import unittest
+import numpy as np
+from specbvp import polybases
+
+
+class Suite:
+
+    BASIS = None
+    TOL = 1e-14
+
+    ROOTS = [-0.9, -0.25, 0.1, 0.6]
+
+    def test_gauss(self):
+        for number in [1, 7, 40, 300]:
+            self._validate_gauss(number)
+
+    def test_product(self):
+        self._validate_product()
+
+    def test_batch(self):
+        self._validate_batch()
+
+    def test_split(self):
+        self._validate_split()
+
+    def test_double(self):
+        self._validate_double()
+
+    def test_endpoints(self):
+        self._validate_endpoints()
+
+    def test_dtype(self):
+        for dtype in [np.float32, np.longdouble]:
+            self._validate_dtype(dtype)
+
+    def test_noroots(self):
+
+        basis = self.BASIS()
+
+        self.assertEqual(basis.roots([1.]).size, 0)
+        self.assertEqual(basis.roots([0., 0., 0.]).size, 0)
+        self.assertEqual(basis.roots([3., 1.]).size, 0)
+
+    def get_coeffs(self, roots, size, func=None):
+        """Coefficients of the polynomial with the roots, times func.
+        """
+
+        basis = self.BASIS()
+        nodes = basis.nodes()['gauss'].setnum(size).nodes
+
+        values = np.prod([nodes-root for root in roots], axis=0)
+
+        if func is not None:
+            values = values*func(nodes)
+
+        mat = basis.polys().setnodes(nodes).setpolys(*range(size)).asmat()
+
+        return np.linalg.solve(mat, values)
+
+    def _validate_gauss(self, number):
+        """Roots of the polynomial of the degree are the Gauss nodes.
+        """
+
+        basis = self.BASIS()
+
+        coeffs = np.zeros(number+1)
+        coeffs[number] = 1.
+
+        roots = basis.roots(coeffs)
+        nodes = basis.nodes()['gauss'].setnum(number).nodes
+
+        np.testing.assert_allclose(roots, np.sort(nodes), atol=self.TOL)
+
+    def _validate_product(self):
+
+        coeffs = self.get_coeffs(self.ROOTS, size=6)
+        roots = self.BASIS().roots(coeffs)
+
+        np.testing.assert_allclose(roots, self.ROOTS, atol=self.TOL)
+
+    def _validate_split(self):
+        """Root at the split point of a degree above MAXDEGREE.
+        """
+
+        split = polybases.roots.ColleagueRoots.SPLIT
+
+        def func(nodes):
+            return 2. + np.sin(40.*nodes)
+
+        coeffs = self.get_coeffs([split], size=100, func=func)
+        roots = self.BASIS().roots(coeffs)
+
+        np.testing.assert_allclose(roots, [split], atol=self.TOL)
+
+    def _validate_double(self):
+        """Double roots split into pairs of about sqrt(eps).
+        """
+
+        for root in [-0.77, 0.123, 0.3]:
+
+            coeffs = self.get_coeffs([-0.5, root, root], size=40)
+            roots = self.BASIS().roots(coeffs)
+
+            np.testing.assert_allclose(
+                roots, np.sort([-0.5, root, root]), atol=1e-6
+            )
+
+    def _validate_endpoints(self):
+        """Roots at the endpoints are kept, roots just beyond are not.
+        """
+
+        basis = self.BASIS()
+
+        coeffs = self.get_coeffs([-1., 0.2, 1.], size=4)
+        np.testing.assert_allclose(
+            basis.roots(coeffs), [-1., 0.2, 1.], atol=self.TOL
+        )
+
+        for root in [1.+5e-7, -1.-5e-7, 1.+1e-10]:
+
+            coeffs = self.get_coeffs([root, 0.2], size=3)
+            roots = basis.roots(coeffs)
+
+            np.testing.assert_allclose(roots, [0.2], atol=self.TOL)
+
+    def _validate_dtype(self, dtype):
+        """Roots are polished in the dtype of the basis.
+        """
+
+        coeffs = self.get_coeffs(self.ROOTS, size=6)
+
+        roots = self.BASIS(dtype=dtype).roots(coeffs)
+        batch = self.BASIS(dtype=dtype).roots(np.stack([coeffs]*2, -1))
+
+        tol = 10*np.finfo(dtype).eps
+
+        self.assertEqual(roots.dtype, dtype)
+        self.assertEqual(batch[1].dtype, dtype)
+
+        np.testing.assert_allclose(roots, self.ROOTS, atol=max(tol, 1e-15))
+
+    def _validate_batch(self):
+
+        coeffs = np.stack([
+            self.get_coeffs(self.ROOTS, size=6),
+            self.get_coeffs(self.ROOTS[1:3], size=6)
+        ], axis=-1)
+
+        roots = self.BASIS().roots(coeffs)
+
+        self.assertEqual(len(roots), 2)
+
+        np.testing.assert_allclose(roots[0], self.ROOTS, atol=self.TOL)
+        np.testing.assert_allclose(roots[1], self.ROOTS[1:3], atol=self.TOL)
+
+        with self.assertRaises(ValueError):
+            self.BASIS().roots(coeffs[..., np.newaxis])
+
+
+class TestLegendre(Suite, unittest.TestCase):
+
+    BASIS = polybases.Legendre
+
+
+class TestChebyshev(Suite, unittest.TestCase):
+
+    BASIS = polybases.Chebyshev
+
+
+if __name__ == '__main__':
+    unittest.main()
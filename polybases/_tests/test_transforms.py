@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+"""Test the transforms between values and coefficients.
+"""
+import unittest
+import numpy as np
+from specbvp import polybases
+
+
+class Suite:
+
+    BASIS = None
+    FAMILY = None
+
+    TOL = 1e-12
+
+    NUMBERS = [2, 3, 8, 17, 64]
+    COEFFS = np.random.default_rng(2).normal(size=(64, 5))
+
+    def test_suite(self):
+        for number in self.NUMBERS:
+            self._validate_transform(number)
+
+    def test_axis(self):
+        self._validate_axis()
+
+    def _validate_transform(self, number):
+
+        coeffs = self.COEFFS[0:number]
+
+        nodes = self.BASIS.nodes()[self.FAMILY].setnum(number).nodes
+        opr = self.BASIS.polys().setnodes(nodes).setpolys(*range(number))
+
+        values = opr.asmat() @ coeffs
+        transform = self.BASIS.transforms()[self.FAMILY]
+
+        np.testing.assert_allclose(
+            transform.tovalues(coeffs), values, atol=self.TOL*number
+        )
+        np.testing.assert_allclose(
+            transform.tocoeffs(values), coeffs, atol=self.TOL*number
+        )
+
+    def _validate_axis(self):
+
+        coeffs = self.COEFFS[0:8]
+        transform = self.BASIS.transforms()[self.FAMILY]
+
+        values = transform.tovalues(coeffs.T, axis=1)
+
+        np.testing.assert_allclose(
+            values, transform.tovalues(coeffs).T, atol=self.TOL
+        )
+        np.testing.assert_allclose(
+            transform.tocoeffs(values, axis=-1), coeffs.T, atol=self.TOL
+        )
+
+
+class TestChebyshevGauss(Suite, unittest.TestCase):
+
+    BASIS = polybases.Chebyshev()
+    FAMILY = 'gauss'
+
+
+class TestChebyshevLobatto(Suite, unittest.TestCase):
+
+    BASIS = polybases.Chebyshev()
+    FAMILY = 'lobatto'
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+"""Test the threaded evaluation of operators.
+"""
+import unittest
+import numpy as np
+from specbvp import polybases
+
+
+class Suite:
+
+    BASIS = None
+    WORKERS = 3
+    CHUNKSIZE = 100
+
+    NODES = np.linspace(-1., 1., 1001)
+    INDICES = [0, 1, 2, 5, 17, 40]
+
+    def test_matrices(self):
+        for opr in self.get_oprs(self.BASIS()):
+            self._validate_matrix(opr, self.NODES)
+
+    def test_grid(self):
+        nodes = np.reshape(self.NODES[:1000], (40, 25))
+        for opr in self.get_oprs(self.BASIS()):
+            self._validate_matrix(opr, nodes)
+
+    def test_out(self):
+        self._validate_out(self.BASIS().polys())
+
+    def test_empty(self):
+        for opr in self.get_oprs(self.BASIS()):
+
+            opr.setnodes(np.empty(0)).setpolys(*self.INDICES)
+            mat = opr.setworkers(self.WORKERS).asmat()
+
+            self.assertEqual(mat.shape, (0, len(self.INDICES)))
+
+    def get_oprs(self, basis):
+        return [
+            basis.polys(),
+            basis.derivs(order=2),
+            basis.integax(weighted=False),
+            basis.integxb(weighted=True)
+        ]
+
+    def _validate_matrix(self, opr, nodes):
+
+        opr.setnodes(nodes).setpolys(*self.INDICES)
+
+        refmat = opr.asmat()
+
+        opr.CHUNKSIZE = self.CHUNKSIZE
+        mat = opr.setworkers(self.WORKERS).asmat()
+
+        np.testing.assert_array_equal(mat, refmat, err_msg=repr(opr))
+
+    def _validate_out(self, opr):
+
+        opr.setnodes(self.NODES).setpolys(*self.INDICES)
+        opr.CHUNKSIZE = self.CHUNKSIZE
+
+        refmat = opr.asmat()
+
+        out = np.empty((len(self.INDICES), len(self.NODES))).T
+        mat = opr.setworkers(self.WORKERS).asmat(out=out)
+
+        self.assertIs(mat, out)
+        np.testing.assert_array_equal(mat, refmat)
+
+        with self.assertRaises(ValueError):
+            opr.asmat(out=out[1:])
+
+
+class TestLegendre(Suite, unittest.TestCase):
+
+    BASIS = polybases.Legendre
+
+
+class TestChebyshev(Suite, unittest.TestCase):
+
+    BASIS = polybases.Chebyshev
+
+
+if __name__ == '__main__':
+    unittest.main()
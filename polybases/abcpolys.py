@@ -2,10 +2,19 @@
 """ABCs for polynomial bases.
 """
 from abc import ABC, abstractmethod
+from concurrent import futures
+import copy
+import itertools as itr
+import tempfile
 import numpy as np
+from .utils import nodecache, matcache, optional, profiling, workspace
+from .utils.arrays import astype, asindices
+from .bundles import OprBundle
+from .elements import ElementOpr
 
 __all__ = [
-    'PolyBasis', 'PolyOpr', 'NodeSet'
+    'PolyBasis', 'PolyOpr', 'NodeSet', 'Transform', 'Converter',
+    'CoeffOpr'
 ]
 
 
@@ -13,9 +22,122 @@ class PolyOpr(ABC):
     """ABC for operators on a polynomial sequence.
     """
 
+    CHUNKSIZE = 2**14
+    UNWEIGHTED = None  # Same operator without the weight x, if weighted.
+
     def __init__(self):
         self.nodes = None
         self.indices = None
+        self.dtype = None
+        self.workspace = None
+        self.workers = None
+        self.cache = None
+        self.own_operators()
+
+    def own_operators(self):
+        """Replaces operators held in class attributes by own copies.
+
+        Class attributes only declare the inner operators, they are never
+        configured or evaluated, so instances share no state.
+        """
+
+        for name in dir(type(self)):
+            value = getattr(type(self), name, None)
+            if isinstance(value, PolyOpr):
+                setattr(self, name, value.clone())
+
+    def get_operators(self) -> list:
+        """Inner operators held by the instance.
+        """
+        return [
+            value for value in vars(self).values()
+            if isinstance(value, PolyOpr) and value is not self
+        ]
+
+    def setcache(self, cache):
+        """Defines a cache of realized operators and returns the instance.
+
+        Parameters
+        ----------
+        cache : MatCache | None
+            Cache of the matrices returned by `asmat()`, no caching if
+            None (a).
+
+        Returns
+        -------
+        self
+            The instance itself.
+
+        (a) See `polybases.utils.MatCache`, matrices are keyed by the
+        type and parameters of the operator, the nodes and the indices.
+        Cached matrices are read-only and can be shared by operators.
+
+        """
+        self.cache = cache
+        return self
+
+    def setworkers(self, workers):
+        """Defines a number of threads for `asmat()` and returns the instance.
+
+        Parameters
+        ----------
+        workers : int | None
+            Number of threads evaluating chunks of the nodes, serial
+            evaluation if None or 1 (a).
+
+        Returns
+        -------
+        self
+            The instance itself.
+
+        (a) Nodes are split along the first axis into chunks of about
+        `CHUNKSIZE` points, each thread evaluating a copy of the operator
+        with a workspace of its own.
+
+        """
+        self.workers = workers
+        return self
+
+    def setworkspace(self, workspace):
+        """Defines a workspace for scratch arrays and returns the instance.
+
+        Parameters
+        ----------
+        workspace : Workspace | None
+            Scratch arrays reused by repeated calls of `asmat()` (a).
+
+        Returns
+        -------
+        self
+            The instance itself.
+
+        (a) See `polybases.utils.Workspace`, not to be shared between
+        threads. Integrators pass it on to their inner operators.
+
+        """
+        self.workspace = workspace
+
+        for opr in self.get_operators():
+            _ = opr.setworkspace(workspace)
+
+        return self
+
+    def setdtype(self, dtype):
+        """Defines the floating-point type and returns the instance.
+
+        Parameters
+        ----------
+        dtype : data-type | None
+            Type of the nodes and outputs, inferred from nodes if None.
+
+        Returns
+        -------
+        self
+            The instance itself.
+
+        """
+        self.dtype = dtype
+        return self
 
     def setnodes(self, nodes):
         """Defines the output points and returns the instance.
@@ -32,6 +154,7 @@ class PolyOpr(ABC):
 
         """
         self.nodes = nodes
+        return self
 
     def setpolys(self, *indices):
         """Defines a polynomial sequence and returns the instance.
@@ -60,42 +183,339 @@ class PolyOpr(ABC):
 
         """
 
-        outputs = self.getoutputs(
-            nodes=self.nodes, maxindex=max(self.indices)
-        )
+        outmat = self.asmat()
+        columns = np.moveaxis(outmat, -1, 0)
 
-        return self.mapresults(outputs)
+        return {
+            int(i): columns[col] for col, i in enumerate(self.getindices())
+        }
 
-    def asmat(self):
+    def asmat(self, out=None):
         """Realizes the operator as a Vandermonde-like matrix.
 
+        Parameters
+        ----------
+        out : ndarray = None
+            Array of shape `(*nodes.shape, len(indices))` to write the
+            matrix to, a new array is returned if None (b).
+
         Returns
         -------
         ndarray
             The operator as a Vandermonde-like matrix (a).
 
-        (a) Columns are images of the polynomials tabulated at the nodes.
+        (a) Columns are images of the polynomials tabulated at the nodes,
+        in ascending order of the indices, each index once.
+
+        (b) Recurrence-based operators write to `out` directly, with
+        scratch arrays from the workspace, see `setworkspace()`. The
+        transpose of a C-contiguous array is the fastest layout. Memory
+        maps are written column by column, see `asmemmap()`.
+
+        """
+
+        nodes = astype(self.nodes, self.dtype)
+        indices = self.getindices()
+
+        profiler = profiling.ACTIVE
+
+        if profiler is None:
+            return self.realize_cached(nodes, indices, out)
+
+        timer = profiling.Timer(profiler)
+        outmat = self.realize_cached(nodes, indices, out)
+        timer.stop(self, outmat)
+
+        return outmat
+
+    def realize_cached(self, nodes, indices, out=None):
+
+        if self.cache is None or isinstance(out, np.memmap):
+            return self.realize(nodes, indices, out)
+
+        key = self.get_cachekey(nodes, indices)
+        outmat = self.cache.get(key)
+
+        if outmat is not None:
+            return self.copyto(out, outmat)
+
+        outmat = self.realize(nodes, indices, out)
+        self.cache.put(key, outmat if out is None else outmat.copy())
+
+        return outmat
+
+    def asmemmap(self, filename=None):
+        """Realizes the operator as a matrix in a memory-mapped file.
+
+        Parameters
+        ----------
+        filename : str = None
+            Path of the file, a temporary file is used if None.
+
+        Returns
+        -------
+        np.memmap
+            The matrix of `asmat()`, stored in the file (a).
+
+        (a) Columns are written to the file one by one as they are
+        computed, see `itercols()`, so that only a few columns are held
+        in memory. Each column is contiguous in the file. Products over
+        the matrix can be computed in blocks of rows, see
+        `polybases.utils.blockprods`.
 
         """
-        asdict = self.asdict()
-        return self.dict_to_mat(asdict)
 
-    def dict_to_mat(self, mapping):
+        nodes = astype(self.nodes, self.dtype)
+        indices = self.getindices()
+
+        shape = (len(indices),) + np.shape(nodes)
+        dtype = np.result_type(nodes, 1.)
+
+        if filename is None:
+            with tempfile.TemporaryFile() as file:
+                outmat = np.memmap(file, dtype, mode='w+', shape=shape)
+        else:
+            outmat = np.memmap(filename, dtype, mode='w+', shape=shape)
+
+        return self.asmat(out=np.moveaxis(outmat, 0, -1))
+
+    def realize(self, nodes, indices, out=None):
+
+        if isinstance(out, np.memmap):
+            return self.getoutcols_streamed(nodes, indices, out)
+
+        if self.is_threaded(nodes):
+            return self.getoutcols_threaded(nodes, indices, out)
+
+        return self.getoutcols(nodes, indices, out)
+
+    def itercols(self, blocksize=None):
+        """Realizes the operator column by column, in increasing index.
+
+        Parameters
+        ----------
+        blocksize : int = None
+            Number of columns per block, columns are yielded one by one
+            if None.
+
+        Yields
+        ------
+        index : int | ndarray
+            Index of a polynomial, or indices of a block.
+        column : ndarray
+            Its image at the nodes, of shape `nodes.shape`, or a block of
+            shape `(*nodes.shape, len(indices))` (a).
+
+        (a) Columns are computed on demand and only the last outputs of
+        the recurrences are kept, so that high indices can be realized
+        without the whole matrix, see `asmat()`.
+
+        """
+
+        nodes = astype(self.nodes, self.dtype)
+        indices = self.getindices()
+
+        columns = self.itersubset(nodes, indices)
+
+        if blocksize is None:
+            yield from columns
+            return
+
+        for start in range(0, len(indices), blocksize):
 
-        data = list(
-            mapping.values()
+            block = [
+                column for _, column in itr.islice(columns, blocksize)
+            ]
+
+            yield indices[start:start+blocksize], np.stack(block, axis=-1)
+
+    def getindices(self):
+        return asindices(self.indices)
+
+    def itersubset(self, nodes, indices):
+        """Generates (index, output) at the sorted unique indices.
+        """
+
+        outputs = self.iteroutputs(nodes, indices[-1])
+        wanted = set(indices.tolist())
+
+        for index, output in enumerate(outputs):
+            if index in wanted:
+                yield index, np.array(output)
+
+    def get_lengthpower(self):
+        """Power of the interval length scaling the outputs on [a,b].
+        """
+        return 0
+
+    def get_params(self) -> tuple:
+        """Parameters of the operator beyond its type, e.g. the order.
+        """
+        return ()
+
+    def get_cachekey(self, nodes, indices):
+
+        oprtype = type(self)
+
+        return (
+            f'{oprtype.__module__}.{oprtype.__qualname__}',
+            self.get_params(),
+            matcache.MatCache.hash_array(nodes),
+            tuple(indices.tolist())
         )
 
-        return np.array(data).T
+    def is_threaded(self, nodes):
+
+        if self.workers is None or self.workers < 2:
+            return False
+
+        if np.ndim(nodes) == 0 or len(nodes) == 0:
+            return False
+
+        return len(nodes) > self.get_chunklen(nodes)
+
+    def get_chunklen(self, nodes):
+        """Number of entries along the first axis of nodes per chunk.
+        """
+        _ = np.size(nodes)//len(nodes)
+        return max(1, self.CHUNKSIZE//max(1, _))
+
+    def getoutcols_streamed(self, nodes, indices, out):
+        """Outputs at the indices written to out column by column.
+        """
+
+        self.check_outshape(out, np.shape(nodes) + (len(indices),))
+
+        dtype = np.result_type(nodes, 1.)
+
+        if not np.can_cast(dtype, out.dtype, casting='same_kind'):
+            raise TypeError(
+                f'out has dtype {out.dtype}, cannot hold {dtype}'
+            )
+
+        columns = np.moveaxis(out, -1, 0)
+
+        for col, (_, column) in enumerate(self.itersubset(nodes, indices)):
+            columns[col] = column
+
+        out.flush()
+
+        return out
+
+    def getoutcols_threaded(self, nodes, indices, out=None):
+        """Outputs at the indices, with chunks of nodes in threads.
+
+        Each thread writes its chunks to a slice of the same matrix.
+        """
+
+        nodes = np.asarray(nodes)
+        workers = self.workers
+
+        if out is None:
+            dtype = np.result_type(nodes, 1.)
+            out = np.empty((len(indices),) + nodes.shape, dtype=dtype)
+            out = np.moveaxis(out, 0, -1)
+        else:
+            self.check_outshape(out, nodes.shape + (len(indices),))
+
+        chunklen = self.get_chunklen(nodes)
+        starts = range(0, len(nodes), chunklen)
+
+        def evaluate(worker):
+
+            opr = self.clone().setworkspace(workspace.Workspace())
+
+            for start in starts[worker::workers]:
+                stop = start + chunklen
+                opr.getoutcols(nodes[start:stop], indices, out[start:stop])
+
+        with futures.ThreadPoolExecutor(workers) as pool:
+            _ = list(pool.map(evaluate, range(workers)))
+
+        return out
+
+    def check_outshape(self, out, shape):
+
+        if out.shape != shape:
+            raise ValueError(
+                f'out has shape {out.shape}, expected {shape}'
+            )
+
+    def clone(self):
+        """Returns a copy sharing no operators with the instance.
+        """
+
+        opr = copy.copy(self)
+
+        for name, value in vars(self).items():
+            if isinstance(value, PolyOpr) and value is not self:
+                setattr(opr, name, value.clone())
+
+        return opr
 
     @abstractmethod
     def getoutputs(self, nodes, maxindex) -> list:
         pass
 
-    def mapresults(self, outs):
-        return {
-            i: v for i, v in enumerate(outs) if i in self.indices
-        }
+    def iteroutputs(self, nodes, maxindex):
+        """Generates the outputs from 0 to maxindex (>=0).
+        """
+        return iter(self.getoutputs(nodes, maxindex))
+
+    def getoutmat(self, nodes, maxindex, out=None):
+        """Outputs from 0 to maxindex (>=0) as columns of a matrix.
+
+        The matrix is written to out, if given.
+        """
+
+        outs = self.getoutputs(nodes, maxindex)
+        outmat = np.moveaxis(np.array(outs), 0, -1)
+
+        return self.copyto(out, outmat)
+
+    def tabulate(self, table, maxindex):
+        """Outputs from 0 to maxindex (>=0) along the first axis.
+
+        Outputs are derived from the polynomials in the table.
+        """
+
+        outmat = self.getoutmat(table.nodes, maxindex)
+
+        return np.moveaxis(outmat, -1, 0)
+
+    def evalseries(self, nodes, coeffs):
+        """Sums the outputs weighted by coefficients along the first axis.
+        """
+
+        coeffs = np.asarray(coeffs)
+        outmat = self.getoutmat(nodes, len(coeffs)-1)
+
+        return np.tensordot(
+            outmat, coeffs, axes=(-1, 0)
+        )
+
+    def getoutcols(self, nodes, indices, out=None):
+        """Outputs at the indices as columns of a matrix.
+
+        The matrix is written to out, if given.
+        """
+
+        outmat = self.getoutmat(nodes, indices.max())
+
+        return np.take(
+            outmat, indices, axis=-1, out=out
+        )
+
+    def copyto(self, out, array):
+
+        if out is None:
+            return array
+
+        self.check_outshape(out, array.shape)
+
+        np.copyto(out, array, casting='same_kind')
+
+        return out
 
 
 class PolyBasis:
@@ -104,8 +524,18 @@ class PolyBasis:
     - Returns *operators* derived from `PolyOpr`.
     - Returns *node sets* derived from `NodeSet`.
 
+    Parameters
+    ----------
+    dtype : data-type = None
+        Floating-point type of operators and node sets (a).
+
+    (a) Inferred from the inputs if None, node sets are float64 then.
+
     """
 
+    def __init__(self, dtype=None):
+        self.dtype = dtype
+
     @abstractmethod
     def polys(self):
         """Returns an *operator* that evaluates polynomials.
@@ -122,6 +552,17 @@ class PolyBasis:
 
         """
 
+    @abstractmethod
+    def coeffderivs(self, order=1):
+        """Returns a *coefficient operator* that differentiates expansions.
+
+        Parameters
+        ----------
+        order : int = 1
+            Order of the desired derivative starting from one.
+
+        """
+
     @abstractmethod
     def integax(self, weighted=False):
         """Returns an *operator* that integrates polynomials over `[a,x]`.
@@ -144,11 +585,178 @@ class PolyBasis:
 
         """
 
+    @abstractmethod
+    def coeffintegax(self, weighted=False):
+        """Returns a *coefficient operator* that integrates over `[a,x]`.
+
+        Parameters
+        ----------
+        weighted : bool = False
+            Polynomials are multiplied by `x`, if True.
+
+        Returns
+        -------
+        CoeffOpr
+            Integrator with an almost banded matrix (a).
+
+        (a) Banded, but for a dense first row. The image has one more
+        coefficient, or two if weighted.
+
+        """
+
+    @abstractmethod
+    def coeffintegxb(self, weighted=False):
+        """Returns a *coefficient operator* that integrates over `[x,b]`.
+
+        Parameters
+        ----------
+        weighted : bool = False
+            Polynomials are multiplied by `x`, if True.
+
+        Returns
+        -------
+        CoeffOpr
+            Integrator with an almost banded matrix, see `coeffintegax()`.
+
+        """
+
     @abstractmethod
     def nodes(self) -> dict:
         """Returns a dictionary with the available node sets.
         """
 
+    def transforms(self) -> dict:
+        """Returns a dictionary with the available fast transforms.
+
+        Returns
+        -------
+        dict
+            Maps families of node sets to objects derived from
+            `Transform`, empty if the basis has no fast transforms.
+
+        """
+        return {}
+
+    def converters(self) -> dict:
+        """Returns a dictionary with the available conversions.
+
+        Returns
+        -------
+        dict
+            Maps names of other bases to objects derived from
+            `Converter`, which take coefficients in this basis.
+
+        """
+        return {}
+
+    @abstractmethod
+    def tabulator(self):
+        """Returns a table of polynomials derived from `Tabulator`.
+        """
+
+    @abstractmethod
+    def rootfinder(self):
+        """Returns a finder of real roots of expansions, see `roots()`.
+        """
+
+    def roots(self, coeffs):
+        """Finds the real roots of expansions in `[-1,1]`.
+
+        Parameters
+        ----------
+        coeffs : array-like
+            Coefficients of the polynomials from `0`, of shape `(n,)`
+            or `(n, m)` for m expansions.
+
+        Returns
+        -------
+        ndarray | list[ndarray]
+            Roots in ascending order, one array per expansion (a).
+
+        (a) Roots are eigenvalues of colleague matrices, with the interval
+        split recursively for high degrees, polished by Newton iterations.
+        Multiple roots are found to about the square root of the machine
+        epsilon and may be repeated. An expansion that vanishes
+        identically has no roots. Roots are in the dtype of the basis,
+        float64 if None, and are polished in it.
+
+        """
+        return self.rootfinder().compute(coeffs)
+
+    def bundle(self, oprs):
+        """Returns a *bundle* of operators realized in one pass.
+
+        Parameters
+        ----------
+        oprs : list[PolyOpr]
+            Operators returned by the basis.
+
+        Returns
+        -------
+        OprBundle
+            Operators sharing the polynomials at the nodes (a).
+
+        (a) Polynomials are computed once, the derivatives and integrals
+        are derived from them.
+
+        """
+        bundle = OprBundle(self.tabulator(), oprs)
+        return bundle.setdtype(self.dtype)
+
+    def onelements(self, opr, bounds):
+        """Returns an operator mapped to a sequence of elements.
+
+        Parameters
+        ----------
+        opr : PolyOpr
+            Operator returned by the basis.
+        bounds : array-like
+            Bounds `[a,b]` of the elements, of shape `(n_elements, 2)`.
+
+        Returns
+        -------
+        ElementOpr
+            Operator realized at reference nodes in `[-1,1]` for all
+            elements at once, see `ElementOpr.asmat()`.
+
+        """
+        return ElementOpr(opr).setbounds(bounds)
+
+    def evaluate(self, coeffs, nodes, opr=None):
+        """Evaluates a polynomial expansion at the nodes.
+
+        Parameters
+        ----------
+        coeffs : array-like
+            Expansion coefficients along the first axis (a).
+        nodes : number | array-like
+            Output point(s) within `[a,b]`.
+        opr : PolyOpr = None
+            Operator to apply to the expansion, defaults to `polys()`.
+
+        Returns
+        -------
+        ndarray
+            Values of shape `(*nodes.shape, *coeffs.shape[1:])`.
+
+        (a) Several expansions can be stacked along the other axes.
+
+        The result is the same as `opr.asmat() @ coeffs` with the
+        polynomials from `0` to `len(coeffs)-1`. The Vandermonde-like
+        matrix is not realized, if the operator supports the Clenshaw
+        summation.
+
+        """
+
+        if opr is None:
+            opr = self.polys()
+
+        dtype = opr.dtype
+
+        return opr.evalseries(
+            astype(nodes, dtype), astype(coeffs, dtype)
+        )
+
 
 class NodeSet(ABC):
     """Set of nodes associated with a polynomials basis.
@@ -163,11 +771,43 @@ class NodeSet(ABC):
     weights : ndarray | None
         Weights as a flat numpy array, if any.
 
+    Node sets are cached in `NodeSet.CACHE` by basis, family, and
+    number of nodes (a). Cached arrays are read-only.
+
+    (a) See `polybases.utils.NodesCache`, set to None to disable. The
+    dtype is a part of the key, if set.
+
     """
 
+    BASIS = None  # Name of the basis, node sets are not cached if None.
+    FAMILY = None  # Name of the node family.
+
+    CACHE = nodecache.NodesCache()
+
     def __init__(self):
         self.nodes = None
         self.weights = None
+        self.dtype = None
+
+    def setdtype(self, dtype):
+        """Defines the floating-point type and returns the instance.
+
+        Parameters
+        ----------
+        dtype : data-type | None
+            Type of nodes and weights, float64 if None (a).
+
+        Returns
+        -------
+        self
+            The instance itself.
+
+        (a) Newton iterations run in the dtype, with the tolerance
+        scaled by its machine epsilon.
+
+        """
+        self.dtype = dtype
+        return self
 
     def setnum(self, number):
         """Defines the number of points and returns the instance.
@@ -184,14 +824,66 @@ class NodeSet(ABC):
 
         """
 
-        nodes = self.find_nodes(number)
-        weights = self.find_weights(nodes)
+        nodes, weights = self.get_nodeset(number)
 
         self.nodes = nodes
         self.weights = weights
 
         return self
 
+    def get_nodeset(self, number):
+
+        cache = self.CACHE
+        key = self.get_cachekey(number)
+
+        if cache is None or key is None:
+            return self.get_typed_nodeset(number)
+
+        nodeset = cache.get(key)
+
+        if nodeset is None:
+            nodeset = self.get_typed_nodeset(number)
+            cache.put(key, nodeset)
+
+        return nodeset
+
+    def get_typed_nodeset(self, number):
+        return tuple(
+            self.asdtype(item) for item in self.compute_nodeset(number)
+        )
+
+    def get_cachekey(self, number):
+
+        if self.BASIS is None:
+            return None
+
+        if self.dtype is None:
+            return (self.BASIS, self.FAMILY, number)
+
+        return (self.BASIS, self.FAMILY, number, self.get_dtype().name)
+
+    def get_dtype(self):
+        if self.dtype is None:
+            return np.dtype(float)
+        return np.dtype(self.dtype)
+
+    def asdtype(self, array):
+        if array is None:
+            return None
+        return np.asarray(array, dtype=self.get_dtype())
+
+    def scale_tol(self, tol):
+        """Scales a float64 tolerance to the machine epsilon of the dtype.
+        """
+        return tol*np.finfo(self.get_dtype()).eps/np.finfo(float).eps
+
+    def compute_nodeset(self, number):
+
+        nodes = self.find_nodes(number)
+        weights = self.find_weights(nodes)
+
+        return nodes, weights
+
     @abstractmethod
     def find_nodes(self, number):
         pass
@@ -199,3 +891,189 @@ class NodeSet(ABC):
     @abstractmethod
     def find_weights(self, nodes):
         return None
+
+
+class Transform(ABC):
+    """Transform between values at a node set and coefficients.
+
+    - Values are taken at the nodes of the same family, see
+      `PolyBasis.nodes()`, in ascending order.
+    - Several vectors can be stacked along the other axes.
+
+    """
+
+    def tocoeffs(self, values, axis=0):
+        """Computes expansion coefficients from values at the nodes.
+
+        Parameters
+        ----------
+        values : array-like
+            Values at the nodes along the axis.
+        axis : int = 0
+            Axis of the nodes.
+
+        Returns
+        -------
+        ndarray
+            Coefficients of the polynomials from `0` along the axis.
+
+        """
+
+        values = np.moveaxis(np.asarray(values), axis, -1)
+        coeffs = self.forward(values)
+
+        return np.moveaxis(coeffs, -1, axis)
+
+    def tovalues(self, coeffs, axis=0):
+        """Computes values at the nodes from expansion coefficients.
+
+        Parameters
+        ----------
+        coeffs : array-like
+            Coefficients of the polynomials from `0` along the axis.
+        axis : int = 0
+            Axis of the coefficients.
+
+        Returns
+        -------
+        ndarray
+            Values at as many nodes as there are coefficients.
+
+        """
+
+        coeffs = np.moveaxis(np.asarray(coeffs), axis, -1)
+        values = self.backward(coeffs)
+
+        return np.moveaxis(values, -1, axis)
+
+    @abstractmethod
+    def forward(self, values):
+        """Values to coefficients along the last axis.
+        """
+
+    @abstractmethod
+    def backward(self, coeffs):
+        """Coefficients to values along the last axis.
+        """
+
+
+class Converter(ABC):
+    """Conversion of expansion coefficients to another basis.
+    """
+
+    def convert(self, coeffs, axis=0):
+        """Computes coefficients of the same expansion in another basis.
+
+        Parameters
+        ----------
+        coeffs : array-like
+            Coefficients of the polynomials from `0` along the axis (a).
+        axis : int = 0
+            Axis of the coefficients.
+
+        Returns
+        -------
+        ndarray
+            Coefficients in the other basis, of the same shape.
+
+        (a) Several expansions can be stacked along the other axes.
+
+        """
+
+        coeffs = np.moveaxis(np.asarray(coeffs), axis, 0)
+        converted = self.apply(coeffs)
+
+        return np.moveaxis(converted, 0, axis)
+
+    @abstractmethod
+    def apply(self, coeffs):
+        """Converts coefficients along the first axis.
+        """
+
+
+class CoeffOpr(ABC):
+    """ABC for operators from coefficients to coefficients.
+
+    - Maps the coefficients of an expansion to the coefficients of its
+      image in the same basis.
+    - Keeps the number of coefficients, except for integrators, which
+      raise the degree of the image.
+
+    """
+
+    def __init__(self):
+        self.dtype = None
+
+    def setdtype(self, dtype):
+        """Defines the floating-point type and returns the instance.
+
+        Parameters
+        ----------
+        dtype : data-type | None
+            Type of the coefficients, inferred from them if None.
+
+        Returns
+        -------
+        self
+            The instance itself.
+
+        """
+        self.dtype = dtype
+        return self
+
+    def apply(self, coeffs, axis=0):
+        """Applies the operator to expansion coefficients.
+
+        Parameters
+        ----------
+        coeffs : array-like
+            Coefficients of the polynomials from `0` along the axis (a).
+        axis : int = 0
+            Axis of the coefficients.
+
+        Returns
+        -------
+        ndarray
+            Coefficients of the image along the axis.
+
+        (a) Several expansions can be stacked along the other axes.
+
+        """
+
+        coeffs = astype(np.asarray(coeffs), self.dtype)
+        image = self.getimage(np.moveaxis(coeffs, axis, 0))
+
+        return np.moveaxis(image, 0, axis)
+
+    def asmat(self, number):
+        """Realizes the operator as a sparse matrix.
+
+        Parameters
+        ----------
+        number : int
+            Number of coefficients.
+
+        Returns
+        -------
+        scipy.sparse.csr_array
+            Matrix with as many rows as coefficients of the image (a).
+
+        (a) Requires scipy.
+
+        """
+        mat = optional.import_sparse().csr_array(self.getmat(number))
+
+        if self.dtype is None:
+            return mat
+
+        return mat.astype(self.dtype)
+
+    @abstractmethod
+    def getimage(self, coeffs):
+        """Applies the operator along the first axis.
+        """
+
+    @abstractmethod
+    def getmat(self, number):
+        """Returns the matrix in a scipy.sparse format.
+        """
@@ -0,0 +1,206 @@
+# -*- coding: utf-8 -*-
+"""Operators realized together from a common table of polynomials.
+"""
+from abc import ABC, abstractmethod
+import numpy as np
+from .utils.arrays import astype, asindices
+
+__all__ = [
+    'Tabulator', 'OprBundle'
+]
+
+
+class Tabulator(ABC):
+    """ABC for a table of polynomials and their derivatives.
+
+    - Polynomials are computed by one recurrence pass.
+    - Derivatives are derived from the polynomials order by order, by
+      alternate sums of scaled lower derivatives (a).
+    - Tables are kept until the nodes change.
+
+    (a) The scaling is vectorized over the indices, the sums take one
+    in-place addition per index, np.cumsum() along the first axis is
+    slower.
+
+    """
+
+    def __init__(self):
+        self.nodes = None
+        self.minsize = 0
+        self.tables = {}
+
+    def setnodes(self, nodes):
+        self.nodes = nodes
+        self.tables = {}
+        return self
+
+    def setsize(self, maxindex):
+        """Sets the minimal maxindex of tables and returns the instance.
+        """
+        self.minsize = maxindex+1
+        return self
+
+    def getpolys(self, maxindex):
+        """Polynomials from 0 to maxindex (>=0) along the first axis.
+        """
+        return self.getderivs(0, maxindex)
+
+    def getderivs(self, order, maxindex):
+        """Derivatives from 0 to maxindex (>=0) along the first axis.
+        """
+
+        table = self.tables.get(order)
+
+        if table is None or len(table) <= maxindex:
+            table = self.compute_table(order, max(maxindex+1, self.minsize))
+            self.tables[order] = table
+
+        return table[0:maxindex+1]
+
+    def compute_table(self, order, size):
+
+        if order == 0:
+            return self.compute_polys(size-1)
+
+        lower = self.getderivs(order-1, size-1)
+
+        return self.compute_derivs(lower, order)
+
+    def sum_alternate(self, lower, factors):
+        """Sums S_{n+1} = F_n*L_n + F_{n-2}*L_{n-2} + ... from S_0 = 0.
+
+        Rows of lower are scaled at once, the sums are accumulated in
+        place, one addition per index.
+        """
+
+        extra = [1]*(lower.ndim-1)
+        sums = np.empty_like(lower)
+
+        sums[0] = 0.
+        np.multiply(lower[0:-1], factors.reshape(-1, *extra), out=sums[1:])
+
+        for index in range(3, len(sums)):
+            sums[index] += sums[index-2]
+
+        return sums
+
+    @abstractmethod
+    def compute_polys(self, maxindex):
+        """Polynomials from 0 to maxindex (>=0) along the first axis.
+        """
+
+    @abstractmethod
+    def compute_derivs(self, lower, order):
+        """Derivatives of the order from the derivatives of order-1.
+        """
+
+
+class OprBundle:
+    """Bundle of operators realized at common nodes.
+
+    Operators are realized from a common table of polynomials, see
+    `PolyBasis.bundle()`.
+    """
+
+    def __init__(self, table, oprs):
+        self.table = table
+        self.oprs = list(oprs)
+        self.nodes = None
+        self.indices = None
+        self.dtype = None
+
+    def setdtype(self, dtype):
+        """Defines the floating-point type and returns the instance.
+
+        Parameters
+        ----------
+        dtype : data-type | None
+            Type of the nodes and outputs, inferred from nodes if None.
+
+        Returns
+        -------
+        self
+            The instance itself.
+
+        """
+        self.dtype = dtype
+        return self
+
+    def setnodes(self, nodes):
+        """Defines the output points and returns the instance.
+
+        Parameters
+        ----------
+        nodes : number | array-like
+            Collocation point(s) within `[a,b]`.
+
+        Returns
+        -------
+        self
+            The instance itself.
+
+        """
+        self.nodes = nodes
+        return self
+
+    def setpolys(self, *indices):
+        """Defines a polynomial sequence and returns the instance.
+
+        Parameters
+        ----------
+        indices: *int
+            Indices of the polynomials to include.
+
+        Returns
+        -------
+        self
+            The instance itself.
+
+        """
+        self.indices = indices
+        return self
+
+    def asmats(self) -> list:
+        """Realizes the operators as Vandermonde-like matrices.
+
+        Returns
+        -------
+        list[ndarray]
+            Matrices in the order of operators, see `PolyOpr.asmat()`.
+
+        """
+
+        indices = asindices(self.indices)
+        maxindex = indices.max()
+
+        table = self.table.setnodes(astype(self.nodes, self.dtype))
+        table.setsize(maxindex+2)
+
+        mats = []
+
+        for opr in self.oprs:
+
+            mat = self.select(opr.tabulate(table, maxindex), indices)
+
+            if any(np.may_share_memory(mat, other) for other in mats):
+                mat = mat.copy()
+
+            mats.append(mat)
+
+        _ = table.setnodes(None)
+
+        return mats
+
+    def select(self, outs, indices):
+        """Outputs at the indices, sliced if they are contiguous (a).
+
+        (a) The matrices may be views of the tables, which are released
+        after `asmats()`.
+        """
+
+        if indices[-1] - indices[0] == len(indices) - 1:
+            outs = outs[indices[0]:indices[-1]+1]
+        else:
+            outs = np.take(outs, indices, axis=0)
+
+        return np.moveaxis(outs, 0, -1)
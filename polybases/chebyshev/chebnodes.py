@@ -0,0 +1,134 @@
+# -*- coding: utf-8 -*-
+"""Classes representing the Chebyshev nodes in `[-1,1]`.
+"""
+
+import numpy as np
+from ..abcpolys import NodeSet
+
+
+class ChebNodes(NodeSet):
+    """Base class for the Chebyshev nodes.
+    """
+
+    BASIS = 'chebyshev'
+
+    def symmetrize(self, nodes):
+        """Makes nodes exactly symmetric about x=0.
+        """
+        return 0.5*(nodes - nodes[::-1])
+
+    def get_factors(self, index):
+        """Integrals of Tn over [-1, 1] for even n.
+        """
+        return 2./(1.-index*index)
+
+    def get_index(self, number):
+        return np.arange(number, dtype=self.get_dtype())
+
+    def get_pi(self):
+        return np.arccos(self.asdtype(-1.))
+
+
+class GaussNodes(ChebNodes):
+    """Set of Chebyshev–Gauss nodes in (-1, 1).
+
+        x = -COS[pi*(2*k+1)/(2*n)]
+
+    with k = 0, ..., n-1 (ascending order).
+
+    The weights of Fejér's first rule are
+
+        w = (2/n) * SUM[d_m * COS(m*t), m = 0, ..., n-1]
+
+    where t = pi*(2*k+1)/(2*n) and
+
+        d_0 = 1
+        d_m = 2/(1-m^2), m = 2, 4, ...
+        d_m = 0, m = 1, 3, ...
+
+    The sum is computed by the FFT in O(n*log(n)) operations.
+
+    SOURCE: Waldvogel, BIT Numer. Math. 46 (2006) 195–202
+    """
+
+    FAMILY = 'gauss'
+
+    def find_nodes(self, number):
+
+        if number < 1:
+            raise ValueError(
+                'number of Chebyshev–Gauss nodes must be at least 1'
+            )
+
+        index = self.get_index(number)
+        nodes = -np.cos(self.get_pi()*(2*index+1.)/(2*number))
+
+        return self.symmetrize(nodes)
+
+    def find_weights(self, nodes):
+
+        number = len(nodes)
+
+        index = self.get_index(number)
+
+        factors = np.zeros_like(index)
+        factors[0::2] = self.get_factors(index[0::2])
+        factors[0] = 1.
+
+        shifts = np.exp(0.5j*self.get_pi()*index/number)
+        sums = np.fft.ifft(factors*shifts, 2*number)[0:number]
+
+        return 4.*sums.real
+
+
+class LobattoNodes(ChebNodes):
+    """Set of Chebyshev–Gauss–Lobatto nodes in [-1, 1].
+
+        x = -COS[pi*k/(n-1)]
+
+    with k = 0, ..., n-1 (ascending order).
+
+    The weights of the Clenshaw–Curtis rule are
+
+        w = (2/N) * SUM''[c_m * COS(m*t), m = 0, ..., N]
+
+    where N = n-1, t = pi*k/N, the sum is halved at m = 0, N, and
+
+        c_m = 2/(1-m^2), m = 0, 2, ...
+        c_m = 0, m = 1, 3, ...
+
+    The weights at x = -1, 1 are halved. The sum is computed by the
+    FFT in O(n*log(n)) operations.
+
+    SOURCE: Waldvogel, BIT Numer. Math. 46 (2006) 195–202
+    """
+
+    FAMILY = 'lobatto'
+
+    def find_nodes(self, number):
+
+        if number < 2:
+            raise ValueError(
+                'number of Chebyshev–Lobatto nodes must be at least 2'
+            )
+
+        index = self.get_index(number)
+        nodes = -np.cos(self.get_pi()*index/(number-1.))
+
+        return self.symmetrize(nodes)
+
+    def find_weights(self, nodes):
+
+        size = len(nodes)-1
+
+        index = self.get_index(size+1)
+
+        factors = np.zeros_like(index)
+        factors[0::2] = self.get_factors(index[0::2])
+
+        weights = 2.*np.fft.irfft(factors, 2*size)[0:size+1]
+
+        weights[0] *= 0.5
+        weights[size] *= 0.5
+
+        return weights
\ No newline at end of file
@@ -3,11 +3,14 @@
 """
 
 from abc import abstractmethod
-from ..abcpolys import PolyOpr
-from ..utils import RecurrTriplet
+import math
+import numpy as np
+from ..abcpolys import PolyOpr, CoeffOpr
+from ..bundles import Tabulator
+from ..utils import RecurrTriplet, ClenshawSum, OddSums
 
 
-class Recurr(RecurrTriplet):
+class Recurr(RecurrTriplet, ClenshawSum):
     """Recurrence for Chebyschev polynomials of both kinds.
 
         NEXT = 2 * x * CURRENT - PREVIOUS
@@ -23,9 +26,32 @@ class Recurr(RecurrTriplet):
         self.nodes = nodes
         return self
 
+    def evalseries(self, nodes, coeffs):
+
+        coeffs = np.asarray(coeffs)
+        nodes = np.reshape(nodes, np.shape(nodes) + (1,)*(coeffs.ndim-1))
+
+        _ = self.setnodes(nodes)
+        _ = self.clenshaw(coeffs)
+
+        return _
+
     def computenext(self, prev, curr, _):
         return 2.*(self.nodes*curr) - prev
 
+    def computenext_into(self, prev, curr, _, out, work):
+        np.multiply(self.nodes, curr, out=out)
+        out *= 2.
+        out -= prev
+
+    def get_recurrcoeffs(self, _):
+        return 2., 1.
+
+
+class Kind(Recurr):
+    """Recurrence for polynomials of either kind.
+    """
+
     def genstartseq(self):
 
         nodes = self.nodes
@@ -44,7 +70,7 @@ class Recurr(RecurrTriplet):
         pass
 
 
-class ChebOne(Recurr):
+class ChebOne(Kind):
     """Recurrence for polynomials of the 1st kind.
 
     T0 = 1
@@ -60,7 +86,7 @@ class ChebOne(Recurr):
         return nodes
 
 
-class ChebTwo(Recurr):
+class ChebTwo(Kind):
     """Recurrence for polynomials of the 2nd kind.
 
     U0 = 1
@@ -87,39 +113,256 @@ class Polys(ChebOne, PolyOpr):
 
         return _
 
+    def iteroutputs(self, nodes, maxindex):
+        recurr = self.clone().setnodes(nodes)
+        return recurr.itersequence(maxindex)
+
+    def getoutmat(self, nodes, maxindex, out=None):
 
-class Derivs(ChebTwo, PolyOpr):
+        _ = self.setnodes(nodes)
+        _ = self.getseqarray(
+            maxindex, transpose=True, out=out, work=self.workspace
+        )
+
+        return _
+
+    def getoutcols(self, nodes, indices, out=None):
+
+        _ = self.setnodes(nodes)
+        _ = self.getseqsubset(
+            indices, transpose=True, out=out, work=self.workspace
+        )
+
+        return _
+
+    def tabulate(self, table, maxindex):
+        return table.getpolys(maxindex)
+
+
+class Derivs(Recurr, PolyOpr):
     """Operator for getting derivatives of the basis polynomials.
 
-        DERIV[Tn, x] = n*U_{n-1}
+    Derivatives are proportional to the Gegenbauer polynomials,
 
-    SOURCE: en.wikipedia.org/wiki/Chebyshev_polynomials
-    """
+        DERIV[T_n, m] = n * 2^(m-1) * (m-1)! * C_{n-m}^(m)
+
+    so that they obey the recurrence
+
+        NEXT = alfa * x * CURRENT - beta * PREVIOUS
+
+    where:
+
+        alfa = 2*(n+1)/(n-m+1)
+        beta = (n+1)*(n+m-1)/[(n-m+1)*(n-1)]
 
-    def getoutputs(self, nodes, maxindex) -> list:
+    with:
 
-        if maxindex == 0:
-            return [
-                nodes*0.
-            ]
+        n — Index of CURRENT.
+        m — Order of a derivative (from 1).
 
-        return self.getderivs(nodes, maxindex)
+    starting from DERIV[T_n, m] = 0 for n < m and
 
-    def getupolys(self, nodes, maxindex) -> list:
+        DERIV[T_m, m] = 2^(m-1) * m!
+
+    The recurrence holds at x = ±1 as well.
+
+    SOURCE: dlmf.nist.gov/18.7, dlmf.nist.gov/18.9
+    """
+
+    def __init__(self, order=1):
+        super().__init__()
+        self.order = order
+        self.ftype = None
+
+    def setnodes(self, nodes):
+        self.nodes = nodes
+        self.ftype = np.result_type(nodes, 1.).type
+        return self
+
+    def getoutputs(self, nodes, maxindex):
 
         _ = self.setnodes(nodes)
         _ = self.getsequence(maxindex)
 
         return _
 
-    def getderivs(self, nodes, maxindex) -> list:
+    def iteroutputs(self, nodes, maxindex):
+        recurr = self.clone().setnodes(nodes)
+        return recurr.itersequence(maxindex)
+
+    def getoutmat(self, nodes, maxindex, out=None):
+
+        _ = self.setnodes(nodes)
+        _ = self.getseqarray(
+            maxindex, transpose=True, out=out, work=self.workspace
+        )
+
+        return _
+
+    def getoutcols(self, nodes, indices, out=None):
+
+        _ = self.setnodes(nodes)
+        _ = self.getseqsubset(
+            indices, transpose=True, out=out, work=self.workspace
+        )
+
+        return _
+
+    def tabulate(self, table, maxindex):
+        return table.getderivs(self.order, maxindex)
+
+    def computenext(self, prev, curr, index):
+
+        alfa, beta = self.get_recurrcoeffs(index)
+
+        return alfa*(self.nodes*curr) - beta*prev
+
+    def computenext_into(self, prev, curr, index, out, work):
+
+        alfa, beta = self.get_recurrcoeffs(index)
+
+        np.multiply(self.nodes, curr, out=out)
+        np.multiply(prev, beta, out=work)
+
+        out *= alfa
+        out -= work
 
-        upolys = self.getupolys(nodes, maxindex)
+    def get_recurrcoeffs(self, index):
 
-        derivs_from_one = [
-            index*upolys[index-1] for index in range(1, maxindex+1)
+        order = self.order
+
+        alfa = self.get_alfa(index, order)
+        beta = self.get_beta(index, order)
+
+        return alfa, beta
+
+    def get_alfa(self, index, order):
+        return self.ftype(2*index+2)/self.ftype(index-order+1)
+
+    def get_beta(self, index, order):
+
+        if index <= order:
+            return self.ftype(0)
+
+        _ = (index-order+1)*(index-1)
+
+        return self.ftype((index+1)*(index+order-1))/self.ftype(_)
+
+    def get_lengthpower(self):
+        return -self.order
+
+    def get_params(self):
+        return (self.order,)
+
+    def genstartseq(self):
+
+        nodes = self.nodes
+
+        derivs_below_order = [
+            self.derivs_below_order(nodes) for _ in range(self.order)
         ]
 
         return [
-           nodes*0., *derivs_from_one
+            *derivs_below_order, self.deriv_at_order(nodes)
         ]
+
+    def derivs_below_order(self, nodes):
+        return nodes*0.
+
+    def deriv_at_order(self, nodes):
+
+        order = self.order
+
+        _ = 2**(order-1)*math.factorial(order)
+
+        return nodes*0. + self.ftype(_)
+
+
+class Table(Tabulator):
+    """Table of Chebyshev polynomials and their derivatives.
+
+    Derivatives are derived from the lower ones as
+
+        DERIV[T_{n+1}, m] = (n+1)*{
+            2*DERIV[T_n, m-1] + DERIV[T_{n-1}, m]/(n-1)
+        }
+
+    for n > 1, starting from
+
+        DERIV[T_0, m] = 0
+        DERIV[T_1, m] = DERIV[T_0, m-1]
+        DERIV[T_2, m] = 4*DERIV[T_1, m-1]
+
+    that is DERIV[T_n, m]/n by alternate sums of 2*DERIV[T_k, m-1], with
+    the term at k = 0 halved.
+
+    SOURCE: en.wikipedia.org/wiki/Chebyshev_polynomials
+    """
+
+    def compute_polys(self, maxindex):
+        recurr = Polys().setnodes(self.nodes)
+        return recurr.getseqarray(maxindex)
+
+    def compute_derivs(self, lower, order):
+
+        extra = [1]*(lower.ndim-1)
+        counts = np.arange(len(lower), dtype=lower.dtype)
+
+        factors = np.full(len(lower)-1, 2, dtype=lower.dtype)
+        factors[0:1] = 1
+
+        derivs = self.sum_alternate(lower, factors)
+        derivs *= counts.reshape(-1, *extra)
+
+        return derivs
+
+
+class CoeffDerivs(OddSums, CoeffOpr):
+    """Computes the derivatives of expansions in the coefficient space.
+
+        DERIV[T_n, x] = 2*n * SUM[T_k, k < n, n-k odd]
+
+    with the term at k = 0 halved, so that the coefficients of the
+    derivative are
+
+        d_k = 2 * SUM[j*c_j, j > k, j-k odd]
+
+    halved at k = 0.
+
+    The derivative of order m is computed by m such sums.
+
+    SOURCE: Mason, Handscomb, Chebyshev Polynomials (2003), sec. 2.4.5
+    """
+
+    def __init__(self, order=1):
+        super().__init__()
+        self.order = order
+
+    def getimage(self, coeffs):
+
+        image = coeffs
+
+        for _ in range(self.order):
+            image = self.oddsums(image)
+
+        return image
+
+    def getmat(self, number):
+
+        mat = self.getoddmat(number)
+        out = mat
+
+        for _ in range(1, self.order):
+            out = mat @ out
+
+        return out
+
+    def get_left(self, number):
+
+        left = np.full(number, 2.)
+        left[0:1] = 1.
+
+        return left
+
+    def get_right(self, number):
+        return np.arange(number, dtype=float)
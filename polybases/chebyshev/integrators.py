@@ -2,6 +2,7 @@
 """Integrate Tn(x) and x*Tn(x) over [x, 1] and [-1, x].
 """
 
+import numpy as np
 from .. import legendre
 from . import funcsderivs
 
@@ -60,6 +61,16 @@ class IntegT0Tn(legendre.IntegP0Pm):
     def get_bias(self, count):
         return 1.0/(count*count-1.)
 
+    def get_primfactors(self, counts):
+
+        single = counts == 1
+        others = np.where(single, 2., counts)
+
+        prev = np.where(single, -0.25, -self.get_beta(others))
+        bias = np.where(single, 0., self.get_bias(others))
+
+        return prev, self.get_alfa(counts), bias
+
 
 class IntegT1Tn(legendre.IntegP1Pm):
     """Indefinite integral of x*Tn(x) normalized to be 0 at x=1.
@@ -80,11 +91,13 @@ class IntegT1Tn(legendre.IntegP1Pm):
     REMARK: Derived from the recurrence relation for polynomials.
     """
 
+    BASES = IntegT0Tn()
+
     def get_integral(self, prev, coming, _):
         return 0.5*prev + 0.5*coming
 
-    def getbases(self, nodes, maxindex):
-        return IntegT0Tn().getoutputs(nodes, maxindex)
+    def get_primfactors(self, counts):
+        return counts*0. + 0.5, counts*0. + 0.5, counts*0.
 
 
 class IntegT0TnXB(legendre.IntegXB):
@@ -100,20 +113,15 @@ class IntegT0TnAX(legendre.IntegAX):
 
     INTEG_FROM_X = IntegT0TnXB()
 
-    def get_total_integ(self, maxindex):
+    def get_total_integ(self, maxindex, dtype=float):
 
-        if maxindex == 0:
-            return [2.]
+        counts = np.arange(maxindex+1, dtype=dtype)
+        totalinteg = np.zeros_like(counts)
 
-        if maxindex == 1:
-            return [2., 0.]
+        evens = counts[0::2]
+        totalinteg[0::2] = 2/(1-evens*evens)
 
-        def integ(count):
-            return (1+(-1)**count)/(1.-count*count)
-
-        return [
-            2., 0., *map(integ, range(2, maxindex+1))
-        ]
+        return totalinteg
 
 
 class IntegT1TnXB(legendre.IntegXB):
@@ -121,6 +129,7 @@ class IntegT1TnXB(legendre.IntegXB):
     """
 
     PRIMINTEG = IntegT1Tn()
+    UNWEIGHTED = IntegT0TnXB()
 
 
 class IntegT1TnAX(legendre.IntegAX):
@@ -128,24 +137,15 @@ class IntegT1TnAX(legendre.IntegAX):
     """
 
     INTEG_FROM_X = IntegT1TnXB()
+    UNWEIGHTED = IntegT0TnAX()
 
-    def get_total_integ(self, maxindex):
-
-        if maxindex == 0:
-            return [0.]
-
-        if maxindex == 1:
-            return [0., 2./3.]
-
-        if maxindex == 2:
-            return [0., 2./3., 0.]
+    def get_total_integ(self, maxindex, dtype=float):
 
-        def base(count):
-            return (1+(-1)**count)/(1.-count*count)
+        counts = np.arange(maxindex+1, dtype=dtype)
+        totalinteg = np.zeros_like(counts)
 
-        def integ(count):
-            return (1/2)*base(count-1) + (1/2)*base(count+1)
+        # Half the totals of T_{n-1} and T_{n+1}, both even.
+        odds = counts[1::2]
+        totalinteg[1::2] = 1/(1-(odds-1)**2) + 1/(1-(odds+1)**2)
 
-        return [
-            0., 2./3., 0., *map(integ, range(3, maxindex+1))
-        ]
+        return totalinteg
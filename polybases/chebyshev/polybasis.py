@@ -3,8 +3,13 @@
 """
 
 from ..abcpolys import PolyBasis
+from .. import conversion
+from .. import roots
+from ..legendre import CoeffIntegAX, CoeffIntegXB
 from . import funcsderivs
 from . import integrators
+from . import chebnodes
+from . import transforms
 
 
 def apiobj(obj):
@@ -26,26 +31,53 @@ class Chebyshev(PolyBasis):
     """
 
     def polys(self):
-        return funcsderivs.Polys()
+        return funcsderivs.Polys().setdtype(self.dtype)
 
     def derivs(self, order):
-        if order == 1:
-            return funcsderivs.Derivs()
-        raise NotImplementedError(
-            'currently not implemented for Chebyshev'
-        )
+        return funcsderivs.Derivs(order).setdtype(self.dtype)
+
+    def coeffderivs(self, order=1):
+        return funcsderivs.CoeffDerivs(order).setdtype(self.dtype)
 
     def integax(self, weighted=False):
         if not weighted:
-            return integrators.IntegT0TnAX()
-        return integrators.IntegT1TnAX()
+            return integrators.IntegT0TnAX().setdtype(self.dtype)
+        return integrators.IntegT1TnAX().setdtype(self.dtype)
 
     def integxb(self, weighted=False):
         if not weighted:
-            return integrators.IntegT0TnXB()
-        return integrators.IntegT1TnXB()
+            return integrators.IntegT0TnXB().setdtype(self.dtype)
+        return integrators.IntegT1TnXB().setdtype(self.dtype)
 
-    def nodes(self):
-        raise NotImplementedError(
-            'currently not implemented for Chebyshev'
+    def converters(self):
+        return {
+            'legendre': conversion.ChebToLeg()
+        }
+
+    def coeffintegax(self, weighted=False):
+        integ = self.integax(weighted)
+        return CoeffIntegAX(integ).setdtype(self.dtype)
+
+    def coeffintegxb(self, weighted=False):
+        integ = self.integxb(weighted)
+        return CoeffIntegXB(integ).setdtype(self.dtype)
+
+    def tabulator(self):
+        return funcsderivs.Table()
+
+    def rootfinder(self):
+        return roots.ExpansionRoots(
+            self.polys(), self.derivs(order=1)
         )
+
+    def nodes(self):
+        return {
+            'gauss': chebnodes.GaussNodes().setdtype(self.dtype),
+            'lobatto': chebnodes.LobattoNodes().setdtype(self.dtype)
+        }
+
+    def transforms(self):
+        return {
+            'gauss': transforms.GaussTransform(),
+            'lobatto': transforms.LobattoTransform()
+        }
@@ -0,0 +1,121 @@
+# -*- coding: utf-8 -*-
+"""Discrete Chebyshev transforms at the Chebyshev nodes.
+"""
+
+import numpy as np
+from ..abcpolys import Transform
+
+
+class DCTransform(Transform):
+    """Base class for the transforms by discrete cosine transforms.
+
+    Values are real and taken at the ascending nodes x = -COS(t),
+    hence Tm(x) = (-1)^m * COS(m*t).
+    """
+
+    def get_signs(self, size):
+        signs = np.ones(size)
+        signs[1::2] = -1.
+        return signs
+
+
+class GaussTransform(DCTransform):
+    """Transform at the Chebyshev–Gauss nodes.
+
+        c_m = (2/n) * SUM[v_k * Tm(x_k), k = 0, ..., n-1]
+
+    halved at m = 0, is the DCT-II of the values, and the inverse is
+    the DCT-III. Both are computed by the FFT of length 2*n in
+    O(n*log(n)) operations.
+
+    SOURCE: Mason, Handscomb, Chebyshev Polynomials (2003), sec. 4.7
+    """
+
+    def forward(self, values):
+
+        number = values.shape[-1]
+
+        if number < 1:
+            raise ValueError(
+                'number of Chebyshev–Gauss nodes must be at least 1'
+            )
+
+        evens = np.concatenate([values, values[..., ::-1]], axis=-1)
+        sums = np.fft.rfft(evens, axis=-1)[..., 0:number]
+
+        sums *= self.get_shifts(number, -1.)
+
+        coeffs = sums.real*(1./number)
+        coeffs[..., 0] *= 0.5
+
+        return coeffs*self.get_signs(number)
+
+    def backward(self, coeffs):
+
+        number = coeffs.shape[-1]
+
+        if number < 1:
+            raise ValueError(
+                'number of Chebyshev–Gauss nodes must be at least 1'
+            )
+
+        sums = np.zeros((*coeffs.shape[:-1], number+1), complex)
+
+        sums[..., 0:number] = coeffs*self.get_signs(number)
+        sums[..., 0:number] *= self.get_shifts(number, +1.)
+        sums[..., 0] *= 2.
+
+        values = np.fft.irfft(sums, 2*number, axis=-1)
+
+        return number*values[..., 0:number]
+
+    def get_shifts(self, number, sign):
+        return np.exp(sign*0.5j*np.pi*np.arange(number)/number)
+
+
+class LobattoTransform(DCTransform):
+    """Transform at the Chebyshev–Gauss–Lobatto nodes.
+
+        c_m = (2/N) * SUM''[v_k * Tm(x_k), k = 0, ..., N]
+
+    halved at m = 0, N, where N = n-1 and the sum is halved at
+    k = 0, N, is the DCT-I of the values, as is the inverse. Both
+    are computed by the FFT of length 2*N in O(n*log(n)) operations.
+
+    SOURCE: Mason, Handscomb, Chebyshev Polynomials (2003), sec. 4.7
+    """
+
+    def forward(self, values):
+
+        size = values.shape[-1]-1
+
+        if size < 1:
+            raise ValueError(
+                'number of Chebyshev–Lobatto nodes must be at least 2'
+            )
+
+        evens = np.concatenate([values, values[..., -2:0:-1]], axis=-1)
+        sums = np.fft.rfft(evens, axis=-1).real
+
+        coeffs = sums*(1./size)
+        coeffs[..., 0] *= 0.5
+        coeffs[..., size] *= 0.5
+
+        return coeffs*self.get_signs(size+1)
+
+    def backward(self, coeffs):
+
+        size = coeffs.shape[-1]-1
+
+        if size < 1:
+            raise ValueError(
+                'number of Chebyshev–Lobatto nodes must be at least 2'
+            )
+
+        sums = coeffs*(size*self.get_signs(size+1))
+        sums[..., 0] *= 2.
+        sums[..., size] *= 2.
+
+        values = np.fft.irfft(sums, 2*size, axis=-1)
+
+        return values[..., 0:size+1]
@@ -0,0 +1,204 @@
+# -*- coding: utf-8 -*-
+"""Conversion of coefficients between the Legendre and Chebyshev bases.
+"""
+
+import math
+import numpy as np
+from .abcpolys import Converter
+from .utils import LRUCache, ToeplitzHankel
+from .utils.specfuncs import gammaratio
+
+
+class Conversion(Converter):
+    """Base class for the Legendre-Chebyshev conversions.
+
+    Conversion matrices are upper triangular with entries of the form
+
+        A_{k,n} = left_k * t_{n-k} * h_{n+k} * right_n
+
+    and are applied by `ToeplitzHankel` in O(n*log(n)^2) operations.
+    Up to DENSEMAX coefficients, the dense matrix is applied instead.
+    Dense matrices and fast plans are cached by number of coefficients.
+    """
+
+    DENSEMAX = 1024
+
+    CACHE = LRUCache(maxsize=8)
+
+    def apply(self, coeffs):
+
+        number = len(coeffs)
+        plan = self.get_plan(number)
+
+        if isinstance(plan, np.ndarray):
+            return np.tensordot(plan, coeffs, axes=(1, 0))
+
+        return self.apply_fast(plan, coeffs)
+
+    def get_plan(self, number):
+
+        key = (type(self).__name__, number)
+        plan = self.CACHE.get(key)
+
+        if plan is None:
+            plan = self.compute_plan(number)
+            self.CACHE.put(key, plan)
+
+        return plan
+
+    def compute_plan(self, number):
+
+        if number > self.DENSEMAX:
+            return self.compute_fastplan(number)
+
+        mat = self.compute_mat(number)
+        mat.flags.writeable = False
+
+        return mat
+
+    def compute_toeplitz_dot_hankel(self, number):
+        """Dense product (T o H) of the matrices in `ToeplitzHankel`.
+        """
+
+        index = np.arange(number)
+
+        toeplitz = self.get_toeplitz(number)
+        hankel = self.get_hankel(number)
+
+        diffs = index[None, :] - index[:, None]
+        sums = index[None, :] + index[:, None]
+
+        return np.where(
+            diffs >= 0, toeplitz[np.abs(diffs)], 0.
+        )*hankel[sums]
+
+    def get_evens(self, values, index):
+        return np.where(index % 2 == 0, values, 0.)
+
+
+class LegToCheb(Conversion):
+    """Conversion from Legendre to Chebyshev coefficients.
+
+        P_n = SUM[M_{k,n} * T_k, k = 0, ..., n]
+
+    where, for even n-k:
+
+        M_{k,n} = (2/pi) * L[(n-k)/2] * L[(n+k)/2]
+
+    halved at k = 0, and M_{k,n} = 0 otherwise, with
+
+        L(z) = GAMMA(z+1/2)/GAMMA(z+1)
+
+    SOURCE: Alpert, Rokhlin, SIAM J. Sci. Stat. Comput. 12 (1991) 158–179
+    """
+
+    def compute_mat(self, number):
+
+        mat = self.compute_toeplitz_dot_hankel(number)
+        mat *= self.get_left(number)[:, None]
+
+        return mat
+
+    def compute_fastplan(self, number):
+
+        toeplitz = self.get_toeplitz(number)
+        hankel = self.get_hankel(number)
+
+        return ToeplitzHankel(
+            toeplitz, hankel, self.get_left(number), np.ones(number)
+        )
+
+    def apply_fast(self, plan, coeffs):
+        return plan.apply(coeffs)
+
+    def get_toeplitz(self, number):
+        index = np.arange(number)
+        return self.get_evens(gammaratio(0.5*index), index)
+
+    def get_hankel(self, number):
+        return gammaratio(0.5*np.arange(2*number-1))
+
+    def get_left(self, number):
+
+        left = np.full(number, 2./math.pi)
+        left[0] = 1./math.pi
+
+        return left
+
+
+class ChebToLeg(Conversion):
+    """Conversion from Chebyshev to Legendre coefficients.
+
+        T_n = SUM[M_{k,n} * P_k, k = 0, ..., n]
+
+    where, for even n-k and k < n:
+
+        M_{k,n} = -(k+1/2) * n * L[(n-k-2)/2]/(n-k)
+                           * L[(n+k-1)/2]/(n+k+1)
+
+    and M_{k,n} = 0 otherwise, except for
+
+        M_{0,0} = 1
+        M_{n,n} = SQRT(pi)/[2*L(n)], n > 0
+
+    with L(z) = GAMMA(z+1/2)/GAMMA(z+1). The strictly upper part is
+    applied to the coefficients shifted by one, j = n-1, so that the
+    Hankel entries L[(j+k)/2]/(j+k+2) are finite.
+
+    SOURCE: Alpert, Rokhlin, SIAM J. Sci. Stat. Comput. 12 (1991) 158–179
+    """
+
+    def compute_mat(self, number):
+
+        mat = np.zeros((number, number))
+
+        upper = self.compute_toeplitz_dot_hankel(number-1)
+        upper *= self.get_left(number-1)[:, None]
+        upper *= self.get_right(number-1)[None, :]
+
+        mat[0:number-1, 1:number] = upper
+        mat[np.diag_indices(number)] = self.get_diag(number)
+
+        return mat
+
+    def compute_fastplan(self, number):
+
+        toeplitz = self.get_toeplitz(number-1)
+        hankel = self.get_hankel(number-1)
+
+        return ToeplitzHankel(
+            toeplitz, hankel,
+            self.get_left(number-1), self.get_right(number-1)
+        )
+
+    def apply_fast(self, plan, coeffs):
+
+        shape = (-1,) + (1,)*(np.ndim(coeffs)-1)
+        diag = self.get_diag(len(coeffs)).reshape(shape)
+
+        out = diag*coeffs
+        out[0:-1] += plan.apply(coeffs[1:])
+
+        return out
+
+    def get_toeplitz(self, number):
+        index = np.arange(number)
+        values = gammaratio(0.5*np.maximum(index-1, 0))/(index+1.)
+        return self.get_evens(values, index+1)
+
+    def get_hankel(self, number):
+        index = np.arange(2*number-1)
+        return gammaratio(0.5*index)/(index+2.)
+
+    def get_left(self, number):
+        return -(np.arange(number)+0.5)
+
+    def get_right(self, number):
+        return np.arange(1., number+1.)
+
+    def get_diag(self, number):
+
+        diag = math.sqrt(math.pi)/(2.*gammaratio(np.arange(number)))
+        diag[0] = 1.
+
+        return diag
@@ -0,0 +1,170 @@
+# -*- coding: utf-8 -*-
+"""Operators mapped from the reference interval to elements.
+"""
+import numpy as np
+from .utils.arrays import astype
+
+__all__ = [
+    'ElementOpr'
+]
+
+
+class ElementOpr:
+    """Operator mapped from `[-1,1]` to a sequence of elements.
+
+    For an element `[a,b]` of length `h = b-a`, the nodes are mapped as
+
+        x = a + h*(t+1)/2
+
+    and the outputs are scaled by `(h/2)^p`, where p is -m for derivatives
+    of order m, 1 for integrals and 2 for integrals weighted by x. With
+    `x = c + h*t/2` about the midpoint c, the weight adds a term
+
+        INTEGRAL[x*P] = (h/2)^2*INTEGRAL[t*P] + c*(h/2)*INTEGRAL[P]
+
+    realized by the unweighted counterpart, see `PolyOpr.UNWEIGHTED`.
+    Other operators weighted by x are not supported.
+    """
+
+    def __init__(self, opr):
+        self.opr = opr
+        self.bounds = None
+
+    def setbounds(self, bounds):
+        """Defines the elements and returns the instance.
+
+        Parameters
+        ----------
+        bounds : array-like
+            Bounds `[a,b]` of the elements, of shape `(n_elements, 2)`.
+
+        Returns
+        -------
+        self
+            The instance itself.
+
+        """
+
+        bounds = np.asarray(bounds)
+
+        if bounds.ndim != 2 or bounds.shape[-1] != 2:
+            raise ValueError(
+                f'bounds have shape {bounds.shape}, expected (n, 2)'
+            )
+
+        self.bounds = bounds
+        return self
+
+    def setnodes(self, nodes):
+        """Defines the reference output points and returns the instance.
+
+        Parameters
+        ----------
+        nodes : array-like
+            Collocation points within `[-1,1]`, common to all elements.
+
+        Returns
+        -------
+        self
+            The instance itself.
+
+        """
+        _ = self.opr.setnodes(nodes)
+        return self
+
+    def setpolys(self, *indices):
+        """Defines a polynomial sequence and returns the instance.
+
+        Parameters
+        ----------
+        indices: *int
+            Indices of the polynomials to include.
+
+        Returns
+        -------
+        self
+            The instance itself.
+
+        """
+        _ = self.opr.setpolys(*indices)
+        return self
+
+    def getnodes(self):
+        """Returns the nodes mapped to the elements.
+
+        Returns
+        -------
+        ndarray
+            Nodes of shape `(n_elements, *nodes.shape)`.
+
+        """
+
+        nodes = astype(self.opr.nodes, self.opr.dtype)
+        lower, halves = self.get_lowers_halves(np.ndim(nodes))
+
+        return lower + halves*(np.asarray(nodes) + 1.)
+
+    def asmat(self, out=None):
+        """Realizes the operator on all elements as stacked matrices.
+
+        Parameters
+        ----------
+        out : ndarray = None
+            Array of shape `(n_elements, *nodes.shape, len(indices))` to
+            write the matrices to, a new array is returned if None.
+
+        Returns
+        -------
+        ndarray
+            Matrices of the elements along the first axis (a).
+
+        (a) The matrix at the reference nodes is computed once and scaled
+        for every element.
+
+        """
+
+        opr = self.opr
+
+        refmat = opr.asmat()
+        lowers, halves = self.get_lowers_halves(refmat.ndim)
+
+        halves = halves.astype(refmat.dtype)
+        scales = halves**opr.get_lengthpower()
+
+        mats = np.multiply(scales, refmat, out=out)
+
+        if opr.UNWEIGHTED is not None:
+            unweighted = self.get_unweighted()
+            scales = (lowers+halves)*halves**unweighted.get_lengthpower()
+            mats += scales*unweighted.asmat()
+
+        return mats
+
+    def get_unweighted(self):
+        """Counterpart of a weighted operator at the same polynomials.
+
+        It is a fresh copy with the settings of the operator, which is
+        left unchanged.
+        """
+
+        opr = self.opr
+        unweighted = opr.UNWEIGHTED.clone()
+
+        _ = unweighted.setdtype(opr.dtype).setcache(opr.cache)
+        _ = unweighted.setworkers(opr.workers).setworkspace(opr.workspace)
+
+        return unweighted.setnodes(opr.nodes).setpolys(*opr.indices)
+
+    def get_lowers_halves(self, ndim):
+        """Lower bounds and half-lengths, broadcastable over the outputs.
+        """
+
+        bounds = astype(self.bounds, self.opr.dtype)
+        bounds = np.asarray(bounds, dtype=np.result_type(bounds, 1.))
+
+        shape = (len(bounds),) + (1,)*ndim
+
+        lowers = bounds[:, 0].reshape(shape)
+        halves = 0.5*(bounds[:, 1] - bounds[:, 0]).reshape(shape)
+
+        return lowers, halves
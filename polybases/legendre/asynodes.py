@@ -0,0 +1,106 @@
+# -*- coding: utf-8 -*-
+"""Asymptotic expansions for the Gauss nodes in `(-1,1)`.
+"""
+
+import math
+import numpy as np
+from ..utils import findroots, specfuncs
+
+
+class InteriorFinder(findroots.SolverMasked):
+    """Computes the interior Gauss nodes in the angle, x = COS(t).
+
+        t = t - POLYN[COS(t)]/DERIVT(t)
+
+    where POLYN is given by the Stieltjes expansion
+
+        POLYN[COS(t)] = C * SUM[h_m * COS(ALFA_m)/(2*SIN(t))^(m+1/2)]
+
+    with:
+
+        ALFA_m = (n+m+1/2)*t - (m+1/2)*pi/2
+        h_m = h_{m-1} * (m-1/2)^2/[m*(n+m+1/2)], h_0 = 1
+
+        C = (2/SQRT(pi)) * GAMMA(n+1)/GAMMA(n+3/2)
+
+    and DERIVT is the derivative of POLYN[COS(t)] with respect to t.
+
+    The solution guess is
+
+        t = pi*(4*k-1)/(4*n+2)
+
+    SOURCE: Hale, Townsend, SIAM J. Sci. Comput. 35 (2013) A652–A674
+    """
+
+    TERMS = 20
+
+    def __init__(self, number):
+        super().__init__()
+        self.number = number
+        self.factors = self.get_factors(number)
+
+    def get_func(self, angles):
+        return self.get_series(angles)[0]
+
+    def get_deriv(self, angles):
+        return self.get_series(angles)[1]
+
+    def computenext(self, arg):
+        func, deriv = self.get_series(arg)
+        return self.updatesol(arg, func, deriv)
+
+    def get_scaled_deriv(self, angles):
+        """Returns DERIVT including the constant C.
+        """
+
+        const = self.get_const(self.number)
+
+        return const*self.get_series(angles)[1]
+
+    def get_series(self, angles):
+        """Returns the expansion and its derivative without C.
+        """
+
+        number = self.number
+
+        sines = 2.*np.sin(angles)
+        cotans = np.cos(angles)/np.sin(angles)
+
+        func = np.zeros_like(angles)
+        deriv = np.zeros_like(angles)
+
+        denom = np.sqrt(sines)
+
+        for index, factor in enumerate(self.factors):
+
+            shift = index + 0.5
+
+            alfa = (number+shift)*angles - shift*(0.5*math.pi)
+
+            cosalfa = np.cos(alfa)/denom
+            sinalfa = np.sin(alfa)/denom
+
+            func += factor*cosalfa
+            deriv -= factor*((number+shift)*sinalfa + shift*cotans*cosalfa)
+
+            denom = denom*sines
+
+        return func, deriv
+
+    def get_factors(self, number):
+
+        factors = [1.]
+
+        for index in range(1, self.TERMS):
+            shift = index - 0.5
+            factor = shift*shift/(index*(number+index+0.5))
+            factors.append(factors[-1]*factor)
+
+        return factors
+
+    def get_const(self, number):
+        return (2./math.sqrt(math.pi))*specfuncs.gammaratio(number+0.5)
+
+    def get_angles_guess(self, start, stop):
+        index = np.arange(start+1, stop+1)
+        return np.pi*(4*index-1.)/(4*self.number+2.)
@@ -3,15 +3,17 @@
 """
 
 import math
-from ..abcpolys import PolyOpr
-from ..utils import RecurrTriplet
+import numpy as np
+from ..abcpolys import PolyOpr, CoeffOpr
+from ..bundles import Tabulator
+from ..utils import RecurrTriplet, ClenshawSum, OddSums
 
 __all__ = [
-    'Polys', 'Derivs'
+    'Polys', 'Derivs', 'Table', 'CoeffDerivs'
 ]
 
 
-class Recurr(RecurrTriplet):
+class Recurr(RecurrTriplet, ClenshawSum):
     """Recurrence for Legendre polynomials and their derivatives.
 
         NEXT = alfa * x * CURRENT - beta * PREVIOUS
@@ -33,6 +35,7 @@ class Recurr(RecurrTriplet):
         super().__init__()
         self.nodes = None
         self.order = None
+        self.ftype = None
 
     def getoutputs(self, nodes, maxindex):
 
@@ -41,8 +44,44 @@ class Recurr(RecurrTriplet):
 
         return _
 
+    def iteroutputs(self, nodes, maxindex):
+        recurr = self.clone().setnodes(nodes)
+        return recurr.itersequence(maxindex)
+
+    def getoutmat(self, nodes, maxindex, out=None):
+
+        _ = self.setnodes(nodes)
+        _ = self.getseqarray(
+            maxindex, transpose=True, out=out, work=self.workspace
+        )
+
+        return _
+
+    def getoutcols(self, nodes, indices, out=None):
+
+        _ = self.setnodes(nodes)
+        _ = self.getseqsubset(
+            indices, transpose=True, out=out, work=self.workspace
+        )
+
+        return _
+
+    def tabulate(self, table, maxindex):
+        return table.getderivs(self.order, maxindex)
+
+    def evalseries(self, nodes, coeffs):
+
+        coeffs = np.asarray(coeffs)
+        nodes = np.reshape(nodes, np.shape(nodes) + (1,)*(coeffs.ndim-1))
+
+        _ = self.setnodes(nodes)
+        _ = self.clenshaw(coeffs)
+
+        return _
+
     def setnodes(self, nodes):
         self.nodes = nodes
+        self.ftype = np.result_type(nodes, 1.).type
         return self
 
     def computenext(self, prev, curr, index):
@@ -55,11 +94,34 @@ class Recurr(RecurrTriplet):
 
         return alfa*(nodes*curr) - beta*prev
 
+    def computenext_into(self, prev, curr, index, out, work):
+
+        nodes = self.nodes
+        order = self.order
+
+        alfa = self.get_alfa(index, order)
+        beta = self.get_beta(index, order)
+
+        np.multiply(nodes, curr, out=out)
+        np.multiply(prev, beta, out=work)
+
+        out *= alfa
+        out -= work
+
+    def get_recurrcoeffs(self, index):
+
+        order = self.order
+
+        alfa = self.get_alfa(index, order)
+        beta = self.get_beta(index, order)
+
+        return alfa, beta
+
     def get_alfa(self, index, order):
-        return (2.*index+1.)/(index-order+1.)
+        return self.ftype(2*index+1)/self.ftype(index-order+1)
 
     def get_beta(self, index, order):
-        return (index+order)/(index-order+1.)
+        return self.ftype(index+order)/self.ftype(index-order+1)
 
     def genstartseq(self):
         pass
@@ -97,6 +159,12 @@ class Derivs(Recurr, PolyOpr):
         super().__init__()
         self.order = order
 
+    def get_lengthpower(self):
+        return -self.order
+
+    def get_params(self):
+        return (self.order,)
+
     def genstartseq(self):
 
         nodes = self.nodes
@@ -116,7 +184,74 @@ class Derivs(Recurr, PolyOpr):
 
         order = self.order
 
-        _ = math.factorial(order)*math.pow(2., order)
-        deriv = math.factorial(2*order)/_
+        _ = math.factorial(order)*2**order
+        deriv = self.ftype(math.factorial(2*order))/self.ftype(_)
 
         return nodes*0. + deriv
+
+
+class Table(Tabulator):
+    """Table of Legendre polynomials and their derivatives.
+
+    Derivatives are derived from the lower ones as
+
+        DERIV[P_{n+1}, m] = DERIV[P_{n-1}, m] + (2*n+1)*DERIV[P_n, m-1]
+
+    starting from DERIV[P_0, m] = 0 and DERIV[P_1, m] = DERIV[P_0, m-1],
+    that is by alternate sums of (2*n+1)*DERIV[P_n, m-1].
+
+    SOURCE: en.wikipedia.org/wiki/Legendre_polynomials
+    """
+
+    def compute_polys(self, maxindex):
+        recurr = Polys().setnodes(self.nodes)
+        return recurr.getseqarray(maxindex)
+
+    def compute_derivs(self, lower, order):
+
+        counts = np.arange(len(lower)-1, dtype=lower.dtype)
+        return self.sum_alternate(lower, 2*counts+1)
+
+
+class CoeffDerivs(OddSums, CoeffOpr):
+    """Computes the derivatives of expansions in the coefficient space.
+
+        DERIV[P_n, x] = SUM[(2*k+1)*P_k, k < n, n-k odd]
+
+    so that the coefficients of the derivative are
+
+        d_k = (2*k+1) * SUM[c_j, j > k, j-k odd]
+
+    The derivative of order m is computed by m such sums.
+
+    SOURCE: en.wikipedia.org/wiki/Legendre_polynomials
+    """
+
+    def __init__(self, order=1):
+        super().__init__()
+        self.order = order
+
+    def getimage(self, coeffs):
+
+        image = coeffs
+
+        for _ in range(self.order):
+            image = self.oddsums(image)
+
+        return image
+
+    def getmat(self, number):
+
+        mat = self.getoddmat(number)
+        out = mat
+
+        for _ in range(1, self.order):
+            out = mat @ out
+
+        return out
+
+    def get_left(self, number):
+        return 2.*np.arange(number) + 1.
+
+    def get_right(self, number):
+        return np.ones(number)
@@ -6,22 +6,103 @@ import numpy as np
 from ..abcpolys import NodeSet
 from ..utils import findroots
 from . import funcsderivs
+from . import asynodes
 
 
 class GaussNodes(NodeSet):
     """Set of Gauss nodes in [-1, 1].
+
+    Nodes are computed by one of the methods:
+
+    - `'newton'` — Newton iterations on the recurrence relation.
+    - `'asymptotic'` — Newton iterations on asymptotic expansions.
+
+    The first one takes O(n^2) operations per iteration, the second one
+    takes O(n). By default, the asymptotic method is used for numbers
+    of nodes above `ASYNUM`, unless the dtype is more precise than
+    float64, which the asymptotic method is limited to. The method in
+    effect is a part of the cache key.
+
     """
 
+    BASIS = 'legendre'
+    FAMILY = 'gauss'
+
     TOL = 1e-14
     MAXITER = 10
 
+    ASYNUM = 300
+
+    METHODS = [
+        'newton', 'asymptotic'
+    ]
+
+    def __init__(self):
+        super().__init__()
+        self.method = None
+
+    def setmethod(self, method):
+        """Defines the method of computing nodes and returns the instance.
+
+        Parameters
+        ----------
+        method : str | None
+            One of `METHODS`, the choice depends on the number if None.
+
+        Returns
+        -------
+        self
+            The instance itself.
+
+        """
+
+        if method not in [None, *self.METHODS]:
+            raise ValueError(
+                f'unknown method {method!r}, expected one of {self.METHODS}'
+            )
+
+        self.method = method
+
+        return self
+
+    def get_method(self, number):
+        if self.method is not None:
+            return self.method
+        if self.is_extended():
+            return 'newton'
+        if number > self.ASYNUM:
+            return 'asymptotic'
+        return 'newton'
+
+    def get_cachekey(self, number):
+
+        key = super().get_cachekey(number)
+
+        if key is None:
+            return None
+
+        return key + (self.get_method(number),)
+
+    def is_extended(self):
+        eps = np.finfo(self.get_dtype()).eps
+        return eps < np.finfo(float).eps
+
+    def compute_nodeset(self, number):
+
+        if self.get_method(number) == 'newton':
+            return super().compute_nodeset(number)
+
+        return AsyNodesWeights(number).compute(
+            tol=self.TOL, maxiter=self.MAXITER
+        )
+
     def find_nodes(self, number):
 
         finder = NodesFinder(number)
-        guess = finder.get_nodes_guess(number)
+        guess = self.asdtype(finder.get_nodes_guess(number))
 
         finder.compute(
-            guess, tol=self.TOL, maxiter=self.MAXITER
+            guess, tol=self.scale_tol(self.TOL), maxiter=self.MAXITER
         )
 
         if finder.converge is True:
@@ -35,7 +116,7 @@ class GaussNodes(NodeSet):
         return WeightsFinder().compute_weights(nodes)
 
 
-class NodesFinder(findroots.SolverNewton):
+class NodesFinder(findroots.SolverMasked):
     """Computes the Gauss nodes.
 
         x = x - POLYN(x)/DERIVN(x)
@@ -63,13 +144,6 @@ class NodesFinder(findroots.SolverNewton):
         super().__init__()
         self.number = number
 
-    def get_norm(self, res):
-
-        maxval = res.max()
-        minval = res.min()
-
-        return max(abs(maxval), abs(minval))
-
     def get_func(self, nodes):
 
         outs = self.POLYS.getoutputs(
@@ -112,9 +186,10 @@ class WeightsFinder:
     POLYS = funcsderivs.Polys()
     DERIVS = funcsderivs.Derivs(order=1)
 
-    def compute_weights(self, nodes):
+    def compute_weights(self, nodes, number=None):
 
-        number = nodes.shape[0]
+        if number is None:
+            number = nodes.shape[0]
 
         polys = self.getpolys(nodes, number-1)
         derivs = self.getderivs(nodes, number-0)
@@ -130,6 +205,106 @@ class WeightsFinder:
         return outs.pop()
 
 
+class AsyNodesWeights:
+    """Computes the Gauss nodes and weights in O(n) operations.
+
+    Nodes in (0,1) are computed and mirrored:
+
+    - Boundary — NBDY nodes next to x=1 by `NodesFinder`.
+    - Interior — the rest by `asynodes.InteriorFinder`.
+
+    The boundary nodes take O(NBDY*n) operations. The interior weights
+
+        w = 2/DERIVT(t)^2
+
+    follow from the asymptotic expansion, DERIVT is the derivative of
+    POLYN[COS(t)] with respect to t.
+
+    SOURCE: Hale, Townsend, SIAM J. Sci. Comput. 35 (2013) A652–A674
+    """
+
+    NBDY = 10
+
+    def __init__(self, number):
+        self.number = number
+
+    def compute(self, tol, maxiter):
+        """Returns the nodes and weights in ascending order of nodes.
+        """
+
+        half = (self.number+1)//2
+        bdysize = min(self.NBDY, half)
+
+        bdynodes = self.find_boundary(bdysize, tol, maxiter)
+        bdyweights = WeightsFinder().compute_weights(bdynodes, self.number)
+
+        angles = self.find_interior(bdysize, half, tol, maxiter)
+        weights = self.get_interior_weights(angles)
+
+        nodes = np.concatenate([bdynodes, np.cos(angles)])
+        weights = np.concatenate([bdyweights, weights])
+
+        return self.mirror(nodes, weights)
+
+    def find_boundary(self, size, tol, maxiter):
+
+        finder = NodesFinder(self.number)
+        guess = finder.get_nodes_guess(self.number)[::-1][0:size]
+
+        finder.compute(
+            guess, tol=tol, maxiter=maxiter
+        )
+
+        return self.get_result(finder)
+
+    def find_interior(self, start, stop, tol, maxiter):
+
+        finder = asynodes.InteriorFinder(self.number)
+        guess = finder.get_angles_guess(start, stop)
+
+        if guess.size == 0:
+            return guess
+
+        finder.compute(
+            guess, tol=tol, maxiter=maxiter
+        )
+
+        return self.get_result(finder)
+
+    def get_result(self, finder):
+
+        if finder.converge is True:
+            return finder.result
+
+        raise NodesError(
+            'Gauss nodes finder failed, no convergence'
+        )
+
+    def get_interior_weights(self, angles):
+        finder = asynodes.InteriorFinder(self.number)
+        derivs = finder.get_scaled_deriv(angles)
+        return 2./(derivs*derivs)
+
+    def mirror(self, nodes, weights):
+        """Mirrors nodes in descending order from (0,1) to (-1,1).
+        """
+
+        skip = self.number % 2
+
+        if skip:
+            nodes[-1] = 0.
+
+        nodes = np.concatenate(
+            [-nodes, nodes[::-1][skip:]]
+        )
+
+        weights = np.concatenate(
+            [weights, weights[::-1][skip:]]
+        )
+
+        return nodes, weights
+
+
 class NodesError(Exception):
     """Raised when the nodes finder does not converge.
     """
@@ -4,18 +4,32 @@
 
 from abc import abstractmethod
 import itertools as itr
+import numpy as np
 from . import funcsderivs
-from ..abcpolys import PolyOpr
+from ..abcpolys import PolyOpr, CoeffOpr
+from ..utils import optional, profiling
 
 __all__ = [
-    'IntegP0Pm', 'IntegP1Pm', 'IntegAX', 'IntegXB'
+    'IntegP0Pm', 'IntegP1Pm', 'IntegAX', 'IntegXB',
+    'CoeffIntegAX', 'CoeffIntegXB'
 ]
 
 
+def get_realtype(*arrays):
+    """Real floating-point type of the arrays, counts are cast to it.
+    """
+    return np.finfo(np.result_type(*arrays, 1.)).dtype
+
+
 class Primint(PolyOpr):
     """Base class for primitive integrals.
     """
 
+    BLOCKSIZE = 16  # Rows of the scratch array combining the bases.
+
+    def get_lengthpower(self):
+        return 1
+
     def getoutputs(self, nodes, maxindex) -> list:
         """Primitive integrals from 0 to maxindex (>=0).
         """
@@ -23,10 +37,301 @@ class Primint(PolyOpr):
         prim_zero = self.prim_index_zero(nodes)
         prim_from_one = self.prim_index_from_one(nodes, maxindex)
 
+        profiling.count(self, triplets=maxindex)
+
         return self.merge_to_maxindex(
             prim_zero, prim_from_one, maxindex
         )
 
+    def evalseries(self, nodes, coeffs):
+
+        coeffs = np.asarray(coeffs)
+        basecoeffs, bias = self.get_primcoeffs(coeffs)
+
+        return self.evalbases(nodes, basecoeffs) + bias
+
+    def get_primcoeffs(self, coeffs):
+        """Expands a series of primitive integrals in the bases (a).
+
+        (a) Returns coefficients of the bases and a constant term.
+        """
+
+        size = len(coeffs)
+        extra = [1]*(coeffs.ndim-1)
+
+        dtype = np.result_type(coeffs, 1.)
+        basecoeffs = np.zeros((size+1, *coeffs.shape[1:]), dtype)
+
+        zeroprev, zerocoming = self.get_primfactors_zero()
+
+        basecoeffs[0] += zeroprev*coeffs[0]
+        basecoeffs[1] += zerocoming*coeffs[0]
+
+        counts = np.arange(1, size, dtype=get_realtype(coeffs))
+        prev, coming, bias = self.get_primfactors(counts)
+
+        basecoeffs[0:size-1] += prev.reshape(-1, *extra)*coeffs[1:]
+        basecoeffs[2:size+1] += coming.reshape(-1, *extra)*coeffs[1:]
+
+        bias = np.tensordot(bias, coeffs[1:], axes=(0, 0))
+
+        return basecoeffs, bias
+
+    def getcoeffimage(self, coeffs):
+        """Expands a series of primitive integrals in the polynomials.
+        """
+
+        basecoeffs, bias = self.get_primcoeffs(coeffs)
+
+        image = self.expandbases(basecoeffs)
+        image[0] += bias
+
+        return image
+
+    def getcoeffmat(self, number):
+        """Matrix of getcoeffimage() in the CSR format (a).
+
+        (a) Almost banded: a band and a dense first row.
+        """
+
+        mat = self.getprimmat(number)
+        mat = self.expandmat(mat)
+
+        return mat
+
+    def getprimmat(self, number):
+        """Matrix of get_primcoeffs() with the constant term in row 0.
+        """
+
+        sparse = optional.import_sparse()
+
+        zeroprev, zerocoming = self.get_primfactors_zero()
+
+        counts = np.arange(1, number)
+        prev, coming, bias = self.get_primfactors(counts)
+
+        rows = np.concatenate([[0, 1], counts-1, counts+1, counts*0])
+        cols = np.concatenate([[0, 0], counts, counts, counts])
+
+        values = np.concatenate(
+            [[zeroprev, zerocoming], prev, coming, bias]
+        )
+
+        mat = sparse.csr_array(
+            (values, (rows, cols)), shape=(number+1, number)
+        )
+        mat.eliminate_zeros()
+
+        return mat
+
+    def iteroutputs(self, nodes, maxindex):
+        """Generates primitive integrals from 0 to maxindex (>=0).
+
+        Only the bases F_{m-1}, F_m, F_{m+1} are kept alive.
+        """
+
+        bases = self.iterbases(nodes, maxindex+1)
+
+        lower = next(bases)
+        middle = next(bases)
+
+        zeroprev, zerocoming = self.get_primfactors_zero()
+        yield zeroprev*lower + zerocoming*middle
+
+        realtype = get_realtype(lower)
+
+        for count in range(1, maxindex+1):
+
+            upper = next(bases)
+
+            counts = np.array([count], dtype=realtype)
+            prev, coming, bias = self.get_primfactors(counts)
+
+            yield prev[0]*lower + coming[0]*upper + bias[0]
+
+            lower, middle = middle, upper
+
+    def getoutcols(self, nodes, indices, out=None):
+        """Primitive integrals at the indices as columns of a matrix.
+
+        The matrix is written to out, if given, through its columns.
+        """
+
+        if out is None:
+            rows = self.getprimrows(nodes, indices)
+            return np.moveaxis(rows, 0, -1)
+
+        self.check_outshape(out, np.shape(nodes) + (len(indices),))
+        _ = self.getprimrows(nodes, indices, np.moveaxis(out, -1, 0))
+
+        return out
+
+    def getprimrows(self, nodes, indices, out=None):
+        """Primitive integrals at the indices along the first axis.
+
+        Only the bases next to the indices are kept, so the memory is
+        proportional to the number of indices, not to their maximum.
+        Bases of contiguous indices are sliced, not gathered. Rows are
+        written to out, if given, and bases and scratch arrays are taken
+        from the workspace, if any.
+        """
+
+        indices = np.asarray(indices)
+
+        if np.all(np.diff(indices) == 1):
+
+            lower, upper = int(indices[0]), int(indices[-1])
+            baseindices = np.arange(max(lower-1, 0), upper+2)
+
+            bases = self.getbaserows(nodes, baseindices)
+            out = self.get_primout(bases, len(indices), out)
+
+            profiling.count(self, triplets=len(indices))
+
+            return self.combine_bases(bases, lower, upper, out)
+
+        baseindices, inverse = np.unique(
+            np.stack([indices-1, indices+1]).clip(0), return_inverse=True
+        )
+        inverse = inverse.reshape(2, -1)
+
+        bases = self.getbaserows(nodes, baseindices)
+        out = self.get_primout(bases, len(indices), out)
+
+        profiling.count(self, triplets=len(indices))
+
+        return self.gather_bases(bases, indices, inverse, out)
+
+    def gather_bases(self, bases, indices, inverse, out):
+        """Primitive integrals at any indices along the first axis of out.
+
+        Bases of the rows are at inverse[0] and inverse[1] and are
+        gathered block by block into a scratch array.
+        """
+
+        extra = [1]*(bases.ndim-1)
+
+        counts = indices.clip(1).astype(get_realtype(bases))
+        prev, coming, bias = self.get_primfactors(counts)
+
+        zeroprev, zerocoming = self.get_primfactors_zero()
+        atzero = indices == 0
+
+        prev = np.where(atzero, zeroprev, prev).reshape(-1, *extra)
+        coming = np.where(atzero, zerocoming, coming).reshape(-1, *extra)
+        bias = np.where(atzero, 0., bias).reshape(-1, *extra)
+
+        work = self.get_block(bases)
+
+        for first in range(0, len(indices), self.BLOCKSIZE):
+
+            last = min(first+self.BLOCKSIZE, len(indices))
+
+            block = work[0:last-first]
+            rows = out[first:last]
+
+            np.take(bases, inverse[0, first:last], 0, block, 'clip')
+            np.multiply(prev[first:last], block, out=rows)
+
+            np.take(bases, inverse[1, first:last], 0, block, 'clip')
+            block *= coming[first:last]
+
+            rows += block
+            rows += bias[first:last]
+
+        return out
+
+    def tabulate(self, table, maxindex):
+        bases = self.tabbases(table, maxindex+1)
+        return self.combine_bases(bases, 0, maxindex)
+
+    def combine_bases(self, bases, lower, upper, out=None):
+        """Primitive integrals from lower to upper along the first axis.
+
+        Bases run from max(lower-1, 0) to upper+1 and are sliced. Rows
+        are written to out, if given.
+        """
+
+        extra = [1]*(bases.ndim-1)
+
+        if out is None:
+            out = np.empty_like(bases[0:upper-lower+1])
+
+        work = self.get_block(bases)
+        start = 0
+
+        if lower == 0:
+
+            zeroprev, zerocoming = self.get_primfactors_zero()
+
+            np.multiply(zeroprev, bases[0:1], out=out[0:1])
+            np.multiply(zerocoming, bases[1:2], out=work[0:1])
+
+            out[0:1] += work[0:1]
+            start = 1
+
+        counts = np.arange(lower+start, upper+1, dtype=get_realtype(bases))
+        prev, coming, bias = self.get_primfactors(counts)
+
+        stop = len(counts)
+        rows = out[start:]
+
+        np.multiply(prev.reshape(-1, *extra), bases[0:stop], out=rows)
+
+        coming = coming.reshape(-1, *extra)
+
+        for first in range(0, stop, self.BLOCKSIZE):
+
+            last = min(first+self.BLOCKSIZE, stop)
+            block = work[0:last-first]
+
+            np.multiply(coming[first:last], bases[first+2:last+2], out=block)
+            rows[first:last] += block
+
+        if np.any(bias):
+            rows += bias.reshape(-1, *extra)
+
+        return out
+
+    def get_primout(self, bases, size, out=None):
+        """Rows for size primitive integrals like the bases, or out.
+        """
+
+        if out is not None:
+            return out
+
+        profiling.count(self, arrays=1)
+
+        return np.empty((size, *bases.shape[1:]), bases.dtype)
+
+    def get_baseout(self, nodes, size):
+        """Rows for size bases in the workspace, None without one.
+        """
+
+        if self.workspace is None:
+            return None
+
+        shape = (size, *np.shape(nodes))
+        dtype = np.result_type(nodes, 1.)
+
+        return self.workspace.get(
+            f'{type(self).__name__}.bases', shape, dtype
+        )
+
+    def get_block(self, bases):
+        """Scratch of BLOCKSIZE rows like the bases.
+
+        It is taken from the workspace, if any.
+        """
+
+        shape = (self.BLOCKSIZE, *bases.shape[1:])
+
+        if self.workspace is None:
+            profiling.count(self, arrays=1)
+            return np.empty(shape, bases.dtype)
+
+        return self.workspace.get('primblock', shape, bases.dtype)
+
     def merge_to_maxindex(self, atzero, fromone, maxindex):
 
         if maxindex == 0:
@@ -46,6 +351,46 @@ class Primint(PolyOpr):
         """Primitive integral for m >= 1.
         """
 
+    @abstractmethod
+    def iterbases(self, nodes, maxindex):
+        """Generates the bases from 0 to maxindex (>=1).
+        """
+
+    @abstractmethod
+    def getbaserows(self, nodes, indices):
+        """Bases at the indices along the first axis.
+        """
+
+    @abstractmethod
+    def tabbases(self, table, maxindex):
+        """Bases from 0 to maxindex (>=1) along the first axis.
+        """
+
+    @abstractmethod
+    def expandbases(self, coeffs):
+        """Expands a series of the bases in the polynomials.
+        """
+
+    @abstractmethod
+    def expandmat(self, mat):
+        """Left-multiplies a matrix by the matrix of expandbases().
+        """
+
+    @abstractmethod
+    def evalbases(self, nodes, coeffs):
+        """Sums the bases weighted by coefficients along the first axis.
+        """
+
+    @abstractmethod
+    def get_primfactors_zero(self) -> tuple:
+        """Factors of (F_0, F_1) in the primitive integral for m=0.
+        """
+
+    @abstractmethod
+    def get_primfactors(self, counts) -> tuple:
+        """Factors of (F_{m-1}, F_{m+1}, 1) in the primitive integrals.
+        """
+
     def set_triplets(self, funcs) -> zip:
         """Returns triplets (F_{m-1}, F_{m+1}, m) for m > 1.
         """
@@ -101,6 +446,34 @@ class IntegP0Pm(Primint):
     def getpolys(self, nodes, maxindex) -> list:
         return self.POLYS.getoutputs(nodes, maxindex)
 
+    def iterbases(self, nodes, maxindex):
+        return self.POLYS.iteroutputs(nodes, maxindex)
+
+    def getbaserows(self, nodes, indices):
+        polys = self.POLYS.setnodes(nodes)
+        out = self.get_baseout(nodes, len(indices))
+
+        return polys.getseqsubset(indices, out=out, work=self.workspace)
+
+    def evalbases(self, nodes, coeffs):
+        return self.POLYS.evalseries(nodes, coeffs)
+
+    def expandbases(self, coeffs):
+        return coeffs
+
+    def expandmat(self, mat):
+        return mat
+
+    def tabbases(self, table, maxindex):
+        return table.getpolys(maxindex)
+
+    def get_primfactors_zero(self):
+        return -1., 1.
+
+    def get_primfactors(self, counts):
+        factor = 1./(2*counts+1)
+        return -factor, factor, counts*0.
+
 
 class IntegP1Pm(Primint):
     """Primitive integral of x*Pm(x) normalized to be 0 at x=1.
@@ -125,6 +498,8 @@ class IntegP1Pm(Primint):
     REMARK: Derived from the recurrence relation for polynomials.
     """
 
+    BASES = IntegP0Pm()
+
     def prim_index_zero(self, nodes):
         return 0.5*(nodes*nodes - 1.)
 
@@ -152,7 +527,33 @@ class IntegP1Pm(Primint):
         return count/(2*count+1)
 
     def getbases(self, nodes, maxindex):
-        return IntegP0Pm().getoutputs(nodes, maxindex)
+        return self.BASES.getoutputs(nodes, maxindex)
+
+    def iterbases(self, nodes, maxindex):
+        return self.BASES.iteroutputs(nodes, maxindex)
+
+    def getbaserows(self, nodes, indices):
+        out = self.get_baseout(nodes, len(indices))
+        return self.BASES.getprimrows(nodes, indices, out)
+
+    def evalbases(self, nodes, coeffs):
+        return self.BASES.evalseries(nodes, coeffs)
+
+    def expandbases(self, coeffs):
+        return self.BASES.getcoeffimage(coeffs)
+
+    def expandmat(self, mat):
+        return self.BASES.getcoeffmat(mat.shape[0]) @ mat
+
+    def tabbases(self, table, maxindex):
+        return self.BASES.tabulate(table, maxindex)
+
+    def get_primfactors_zero(self):
+        return 0., 1.
+
+    def get_primfactors(self, counts):
+        alfa = self.get_alfa(counts)
+        return alfa, 1.-alfa, counts*0.
 
 
 class IntegXB(PolyOpr):
@@ -168,11 +569,22 @@ class IntegXB(PolyOpr):
 
     PRIMINTEG = None  # Primitive integral that is 0 at x=1.
 
+    def get_lengthpower(self):
+        return 1 if self.UNWEIGHTED is None else 2
+
     def getoutputs(self, nodes, maxindex) -> list:
         outs = self.get_priminteg(nodes, maxindex)
         outs = self.make_negative(outs)
         return outs
 
+    def iteroutputs(self, nodes, maxindex):
+
+        outputs = self.PRIMINTEG.iteroutputs(nodes, maxindex)
+
+        return (
+            -val for val in outputs
+        )
+
     def get_priminteg(self, nodes, maxindex):
         return self.PRIMINTEG.getoutputs(nodes, maxindex)
 
@@ -181,6 +593,19 @@ class IntegXB(PolyOpr):
             -val for val in outs
         ]
 
+    def evalseries(self, nodes, coeffs):
+        return -self.PRIMINTEG.evalseries(nodes, coeffs)
+
+    def getoutcols(self, nodes, indices, out=None):
+
+        outcols = self.PRIMINTEG.getoutcols(nodes, indices, out)
+
+        return np.negative(outcols, out=outcols)
+
+    def tabulate(self, table, maxindex):
+        prims = self.PRIMINTEG.tabulate(table, maxindex)
+        return np.negative(prims, out=prims)
+
 
 class IntegAX(PolyOpr):
     """Base class for integrators over [-1, x].
@@ -195,28 +620,136 @@ class IntegAX(PolyOpr):
 
     INTEG_FROM_X = None
 
+    def get_lengthpower(self):
+        return 1 if self.UNWEIGHTED is None else 2
+
     def getoutputs(self, nodes, maxindex) -> list:
 
         integfromx = self.get_integ_fromx(nodes, maxindex)
-        totalinteg = self.get_total_integ(maxindex)
+        totalinteg = self.get_total_integ(maxindex, get_realtype(nodes))
 
         return self.subtract(
             totalinteg, integfromx
         )
 
+    def iteroutputs(self, nodes, maxindex):
+
+        integfromx = self.INTEG_FROM_X.iteroutputs(nodes, maxindex)
+        totalinteg = self.get_total_integ(maxindex, get_realtype(nodes))
+
+        return (
+            a-b for a, b in zip(totalinteg, integfromx)
+        )
+
     def get_integ_fromx(self, nodes, maxindex):
         return self.INTEG_FROM_X.getoutputs(nodes, maxindex)
 
     @abstractmethod
-    def get_total_integ(self, maxindex):
-        """Integral over [-1, 1] from 0 to maxindex (>=0):
+    def get_total_integ(self, maxindex, dtype=float):
+        """Integral over [-1, 1] from 0 to maxindex (>=0) in the dtype.
         """
 
+    def getoutcols(self, nodes, indices, out=None):
+
+        outcols = self.INTEG_FROM_X.getoutcols(nodes, indices, out)
+
+        totalinteg = self.get_total_integ(
+            int(np.max(indices)), get_realtype(outcols)
+        )
+
+        return np.subtract(totalinteg[indices], outcols, out=outcols)
+
     def subtract(self, itera, iterb):
         return [
             a-b for a, b in zip(itera, iterb)
         ]
 
+    def evalseries(self, nodes, coeffs):
+
+        coeffs = np.asarray(coeffs)
+
+        totalinteg = self.get_total_integ(
+            len(coeffs)-1, get_realtype(nodes, coeffs)
+        )
+        totalinteg = np.tensordot(totalinteg, coeffs, axes=(0, 0))
+
+        return totalinteg - self.INTEG_FROM_X.evalseries(nodes, coeffs)
+
+    def tabulate(self, table, maxindex):
+
+        integfromx = self.INTEG_FROM_X.tabulate(table, maxindex)
+        totalinteg = self.get_total_integ(maxindex, get_realtype(integfromx))
+
+        totalinteg = totalinteg.reshape(-1, *[1]*(integfromx.ndim-1))
+
+        return np.subtract(totalinteg, integfromx, out=integfromx)
+
+
+class CoeffIntegXB(CoeffOpr):
+    """Integrator over [x, 1] in the coefficient space.
+
+    Coefficients of the integral follow from the primitive integrals,
+    which are banded in the bases, see `Primint.get_primcoeffs()`.
+    It costs O(n) operations per expansion.
+    """
+
+    def __init__(self, integ):
+        super().__init__()
+        self.integ = integ
+
+    def getimage(self, coeffs):
+        return -self.integ.PRIMINTEG.getcoeffimage(coeffs)
+
+    def getmat(self, number):
+        return -self.integ.PRIMINTEG.getcoeffmat(number)
+
+
+class CoeffIntegAX(CoeffOpr):
+    """Integrator over [-1, x] in the coefficient space.
+
+        INTEGRAL[*, -1, x] = TOTAL[*] + PRIMINTEG[*](x)
+
+    The total integrals are added to the coefficient of the constant,
+    see `CoeffIntegXB`.
+    """
+
+    def __init__(self, integ):
+        super().__init__()
+        self.integ = integ
+
+    def getimage(self, coeffs):
+
+        integ = self.integ
+
+        totalinteg = integ.get_total_integ(
+            len(coeffs)-1, get_realtype(coeffs)
+        )
+
+        image = integ.INTEG_FROM_X.PRIMINTEG.getcoeffimage(coeffs)
+
+        image[0] += np.tensordot(totalinteg, coeffs, axes=(0, 0))
+
+        return image
+
+    def getmat(self, number):
+
+        sparse = optional.import_sparse()
+        integ = self.integ
+
+        mat = integ.INTEG_FROM_X.PRIMINTEG.getcoeffmat(number)
+
+        totalinteg = integ.get_total_integ(number-1, mat.dtype)
+        cols = np.arange(number)
+
+        total = sparse.csr_array(
+            (totalinteg, (cols*0, cols)), shape=mat.shape
+        )
+
+        mat = mat + total
+        mat.eliminate_zeros()
+
+        return mat
+
 
 class IntegP0PmXB(IntegXB):
     """Integral of Pm(x) over [x, 1].
@@ -231,8 +764,12 @@ class IntegP0PmAX(IntegAX):
 
     INTEG_FROM_X = IntegP0PmXB()
 
-    def get_total_integ(self, maxindex):
-        return [2.] + [0.]*maxindex
+    def get_total_integ(self, maxindex, dtype=float):
+
+        totalinteg = np.zeros(maxindex+1, dtype=dtype)
+        totalinteg[0] = 2
+
+        return totalinteg
 
 
 class IntegP1PmXB(IntegXB):
@@ -240,6 +777,7 @@ class IntegP1PmXB(IntegXB):
     """
 
     PRIMINTEG = IntegP1Pm()
+    UNWEIGHTED = IntegP0PmXB()
 
 
 class IntegP1PmAX(IntegAX):
@@ -247,13 +785,11 @@ class IntegP1PmAX(IntegAX):
     """
 
     INTEG_FROM_X = IntegP1PmXB()
+    UNWEIGHTED = IntegP0PmAX()
 
-    def get_total_integ(self, maxindex):
-
-        if maxindex == 0:
-            return [0.]
+    def get_total_integ(self, maxindex, dtype=float):
 
-        if maxindex == 1:
-            return [0., 2./3.]
+        totalinteg = np.zeros(maxindex+1, dtype=dtype)
+        totalinteg[1:2] = totalinteg.dtype.type(2)/3
 
-        return [0., 2./3.] + [0.]*(maxindex-1)
+        return totalinteg
@@ -0,0 +1,146 @@
+# -*- coding: utf-8 -*-
+"""Class representing the Gauss–Lobatto nodes in `[-1,1]`.
+"""
+
+import numpy as np
+from ..abcpolys import NodeSet
+from ..utils import findroots
+from . import funcsderivs
+
+
+class LobattoNodes(NodeSet):
+    """Set of Gauss–Lobatto nodes in [-1, 1].
+
+    Nodes are x = -1, 1 and the roots of the first derivative of the
+    Legendre polynomial of the order n-1.
+    """
+
+    BASIS = 'legendre'
+    FAMILY = 'lobatto'
+
+    TOL = 1e-14
+    MAXITER = 10
+
+    def find_nodes(self, number):
+
+        if number < 2:
+            raise ValueError(
+                'number of Gauss–Lobatto nodes must be at least 2'
+            )
+
+        inner = self.find_inner_nodes(number)
+
+        return np.concatenate(
+            [self.asdtype([-1.]), inner, self.asdtype([1.])]
+        )
+
+    def find_inner_nodes(self, number):
+
+        if number == 2:
+            return np.empty(0, self.get_dtype())
+
+        finder = NodesFinder(number)
+        guess = self.asdtype(finder.get_nodes_guess(number))
+
+        finder.compute(
+            guess, tol=self.scale_tol(self.TOL), maxiter=self.MAXITER
+        )
+
+        if finder.converge is True:
+            return finder.result
+
+        raise NodesError(
+            'Gauss–Lobatto nodes finder failed, no convergence'
+        )
+
+    def find_weights(self, nodes):
+        return WeightsFinder().compute_weights(nodes)
+
+
+class NodesFinder(findroots.SolverMasked):
+    """Computes the inner Gauss–Lobatto nodes.
+
+        x = x - DERIVN1(x)/DERIVN2(x)
+
+    where:
+
+        DERIVN1 — First derivative of POLYN.
+        DERIVN2 — Second derivative of POLYN.
+
+    with:
+
+        POLYN — Legendre polynomial of the order n-1.
+
+    The solution guess are the Chebyshev–Gauss–Lobatto nodes
+
+        x = -COS[pi*k/(n-1)]
+
+    with
+
+        k = 1, ..., n-2 (order matters)
+
+    SOURCE: mathworld.wolfram.com/LobattoQuadrature.html
+    """
+
+    DERIVS = funcsderivs.Derivs(order=1)
+    SECOND = funcsderivs.Derivs(order=2)
+
+    def __init__(self, number):
+        super().__init__()
+        self.number = number
+
+    def get_func(self, nodes):
+
+        outs = self.DERIVS.getoutputs(
+            nodes=nodes, maxindex=self.number-1
+        )
+
+        return outs.pop()
+
+    def get_deriv(self, nodes):
+
+        outs = self.SECOND.getoutputs(
+            nodes=nodes, maxindex=self.number-1
+        )
+
+        return outs.pop()
+
+    def get_nodes_guess(self, number):
+        index = np.arange(1, number-1)
+        return -np.cos(np.pi*index/(number-1.))
+
+
+class WeightsFinder:
+    """Computes weights of the Gauss–Lobatto quadrature.
+
+        w = 2/[n*(n-1)*POLYN(x)^2]
+
+    where:
+
+        POLYN — Legendre polynomial of the order n-1.
+
+    with:
+
+        n — Number of the quadrature nodes.
+        x — Nodes of the Gauss–Lobatto quadrature.
+
+    SOURCE: mathworld.wolfram.com/LobattoQuadrature.html
+    """
+
+    POLYS = funcsderivs.Polys()
+
+    def compute_weights(self, nodes):
+
+        number = nodes.shape[0]
+        polys = self.getpolys(nodes, number-1)
+
+        return 2.0/(number*(number-1)*polys*polys)
+
+    def getpolys(self, nodes, index):
+        outs = self.POLYS.getoutputs(nodes, index)
+        return outs.pop()
+
+
+class NodesError(Exception):
+    """Raised when the nodes finder does not converge.
+    """
@@ -3,9 +3,12 @@
 """
 
 from ..abcpolys import PolyBasis
+from .. import conversion
+from .. import roots
 from . import funcsderivs
 from . import integrators
 from . import gaussnodes
+from . import lobattonodes
 
 
 def apiobj(obj):
@@ -27,22 +30,47 @@ class Legendre(PolyBasis):
     """
 
     def polys(self):
-        return funcsderivs.Polys()
+        return funcsderivs.Polys().setdtype(self.dtype)
 
     def derivs(self, order):
-        return funcsderivs.Derivs(order)
+        return funcsderivs.Derivs(order).setdtype(self.dtype)
+
+    def coeffderivs(self, order=1):
+        return funcsderivs.CoeffDerivs(order).setdtype(self.dtype)
 
     def integax(self, weighted=False):
         if not weighted:
-            return integrators.IntegP0PmAX()
-        return integrators.IntegP1PmAX()
+            return integrators.IntegP0PmAX().setdtype(self.dtype)
+        return integrators.IntegP1PmAX().setdtype(self.dtype)
 
     def integxb(self, weighted=False):
         if not weighted:
-            return integrators.IntegP0PmXB()
-        return integrators.IntegP1PmXB()
+            return integrators.IntegP0PmXB().setdtype(self.dtype)
+        return integrators.IntegP1PmXB().setdtype(self.dtype)
+
+    def converters(self):
+        return {
+            'chebyshev': conversion.LegToCheb()
+        }
+
+    def coeffintegax(self, weighted=False):
+        integ = self.integax(weighted)
+        return integrators.CoeffIntegAX(integ).setdtype(self.dtype)
+
+    def coeffintegxb(self, weighted=False):
+        integ = self.integxb(weighted)
+        return integrators.CoeffIntegXB(integ).setdtype(self.dtype)
+
+    def tabulator(self):
+        return funcsderivs.Table()
+
+    def rootfinder(self):
+        return roots.ExpansionRoots(
+            self.polys(), self.derivs(order=1), self.converters()['chebyshev']
+        )
 
     def nodes(self):
         return {
-            'gauss': gaussnodes.GaussNodes()
+            'gauss': gaussnodes.GaussNodes().setdtype(self.dtype),
+            'lobatto': lobattonodes.LobattoNodes().setdtype(self.dtype)
         }
@@ -0,0 +1,315 @@
+# -*- coding: utf-8 -*-
+"""Real roots of polynomial expansions in [-1, 1].
+"""
+
+import numpy as np
+from .utils import findroots
+from .chebyshev.funcsderivs import Polys as ChebPolys
+from .chebyshev.transforms import LobattoTransform
+
+
+class ColleagueRoots:
+    """Real roots of Chebyshev expansions by colleague matrices.
+
+    For p(x) = SUM[c_k * T_k, k = 0, ..., n], the roots are the
+    eigenvalues of the colleague matrix M of size n, which follows from
+
+        x * T_0 = T_1
+        x * T_k = (T_{k-1} + T_{k+1})/2
+
+    with T_n eliminated by p(x) = 0, that is
+
+        M[0, 1] = 1
+        M[k, k-1] = M[k, k+1] = 1/2, k = 1, ..., n-2
+        M[n-1, n-2] = 1/2
+        M[n-1, k] -= c_k/(2*c_n), k = 0, ..., n-1
+
+    Above MAXDEGREE, the interval is split near its middle. On each part
+    the expansion is interpolated at the Chebyshev–Lobatto nodes and its
+    trailing coefficients below CHOPTOL are dropped, so that the degree
+    decreases with the length of the parts. The total cost is about
+    O(n^2) instead of O(n^3) for one large matrix. A root at the split
+    point is kept from the left part only.
+
+    Multiple roots split into eigenvalues about sqrt(eps) apart, often
+    complex pairs. Eigenvalues off the real axis by less than IMAGTOL
+    are kept, if the expansion is below RESTOL at their real part.
+    Eigenvalues just beyond an endpoint are kept only within the error
+    of a root there, see `select_real()`.
+
+    SOURCE: Boyd, SIAM J. Numer. Anal. 40 (2002) 1666–1682
+    """
+
+    MAXDEGREE = 64
+    MAXDEPTH = 24
+    CHOPTOL = 1e-14  # Relative to the largest coefficient.
+    IMAGTOL = 1e-6  # Imaginary parts of real roots.
+    ULPS = 32  # Roots beyond the endpoints in units of eps.
+    RESTOL = 1e-8  # Residuals of roots off the real axis.
+    MERGETOL = 1e-6  # Roots at the split point, relative to the length.
+    SPLIT = -0.004849834917525  # Split point in [-1, 1], off the middle.
+
+    POLYS = ChebPolys()
+    TRANSFORM = LobattoTransform()
+
+    def compute(self, coeffs):
+        """Returns the real roots in [-1, 1] in ascending order.
+        """
+
+        roots = self.find_roots(np.asarray(coeffs, dtype=float), -1., 1., 0)
+
+        if not roots:
+            return np.empty(0)
+
+        return np.sort(np.concatenate(roots))
+
+    def find_roots(self, coeffs, lower, upper, depth) -> list:
+        """Roots in [lower, upper] of coefficients on this interval.
+        """
+
+        coeffs = self.chop(coeffs)
+        degree = len(coeffs)-1
+
+        if degree > self.MAXDEGREE and depth < self.MAXDEPTH:
+            return self.split_roots(coeffs, lower, upper, depth)
+
+        roots = self.get_eigroots(coeffs)
+
+        return [
+            lower + 0.5*(upper-lower)*(roots+1.)
+        ]
+
+    def split_roots(self, coeffs, lower, upper, depth):
+
+        middle = lower + 0.5*(upper-lower)*(self.SPLIT+1.)
+
+        left = self.restrict(coeffs, -1., self.SPLIT)
+        right = self.restrict(coeffs, self.SPLIT, 1.)
+
+        lefts = self.find_roots(left, lower, middle, depth+1)
+        rights = self.find_roots(right, middle, upper, depth+1)
+
+        tol = self.MERGETOL*(upper-lower)
+
+        if any(np.any(np.fabs(roots-middle) < tol) for roots in lefts):
+            rights = [
+                roots[np.fabs(roots-middle) >= tol] for roots in rights
+            ]
+
+        return [
+            *lefts, *rights
+        ]
+
+    def restrict(self, coeffs, lower, upper):
+        """Coefficients on [lower, upper] in the local coordinate.
+        """
+
+        size = len(coeffs)-1
+        nodes = -np.cos(np.pi*np.arange(size+1)/size)
+
+        nodes = lower + 0.5*(upper-lower)*(nodes+1.)
+        values = self.POLYS.evalseries(nodes, coeffs)
+
+        return self.TRANSFORM.forward(values)
+
+    def chop(self, coeffs):
+
+        scale = np.amax(np.fabs(coeffs), initial=0.)
+        large = np.flatnonzero(np.fabs(coeffs) > self.CHOPTOL*scale)
+
+        if large.size == 0:
+            return coeffs[0:1]*0.
+
+        return coeffs[0:large[-1]+1]
+
+    def get_eigroots(self, coeffs):
+
+        degree = len(coeffs)-1
+
+        if degree < 1:
+            return np.empty(0)
+
+        if degree == 1:
+            roots = np.array([-coeffs[0]/coeffs[1]])
+        else:
+            roots = np.linalg.eigvals(self.get_colleague(coeffs))
+
+        return self.select_real(roots, coeffs)
+
+    def get_colleague(self, coeffs):
+
+        size = len(coeffs)-1
+        mat = np.zeros((size, size))
+
+        mat[0, 1] = 1.
+
+        index = np.arange(1, size)
+        mat[index, index-1] = 0.5
+        mat[index[:-1], index[:-1]+1] = 0.5
+
+        mat[-1, :] -= coeffs[0:size]/(2.*coeffs[size])
+
+        return mat
+
+    def select_real(self, roots, coeffs):
+        """Eigenvalues that are real roots in [-1, 1].
+
+        Eigenvalues beyond an endpoint are clipped to it, if they are
+        within ULPS units of eps times the error of a root there, and
+        the expansion at the endpoint is below RESTOL. The error follows
+        from the backward error of the colleague matrix (a):
+
+            SUM[|c_k|]^2/(|c_n| * |DERIV[p](+-1)|)
+
+        (a) Nakatsukasa, Noferini, Math. Comp. 85 (2016) 2391–2425
+        """
+
+        roots = roots[np.fabs(roots.imag) < self.IMAGTOL]
+        reals = roots.real
+
+        scale = np.sum(np.fabs(coeffs))
+        keep = np.ones(len(roots), dtype=bool)
+
+        paired = roots.imag != 0.
+
+        if np.any(paired):
+            values = self.POLYS.evalseries(reals[paired], coeffs)
+            keep[paired] = np.fabs(values) <= self.RESTOL*scale
+
+        outside = np.fabs(reals) > 1.
+
+        if np.any(outside):
+
+            ends = np.sign(reals[outside])
+            values, slopes = self.get_endvalues(coeffs, ends)
+
+            with np.errstate(divide='ignore'):
+                errors = scale*scale/np.fabs(coeffs[-1]*slopes)
+
+            tol = self.ULPS*np.finfo(float).eps*errors
+
+            keep[outside] &= np.fabs(reals[outside]) - 1. <= tol
+            keep[outside] &= np.fabs(values) <= self.RESTOL*scale
+
+        return np.clip(reals[keep], -1., 1.)
+
+    def get_endvalues(self, coeffs, ends):
+        """Expansion and its derivative at the endpoints ends (+-1).
+
+            T_k(+-1) = (+-1)^k
+            DERIV[T_k](+-1) = (+-1)^(k+1) * k^2
+
+        """
+
+        counts = np.arange(len(coeffs))
+        powers = ends.reshape(-1, 1)**counts
+
+        values = powers @ coeffs
+        slopes = ends*(powers @ (counts*counts*coeffs))
+
+        return values, slopes
+
+
+class RootsPolisher(findroots.SolverMasked):
+    """Polishes roots of an expansion by Newton iterations.
+
+        x = x - p(x)/DERIV[p](x)
+
+    where p is evaluated by the operators of its basis.
+    """
+
+    def __init__(self, polys, derivs, coeffs):
+        super().__init__()
+        self.polys = polys
+        self.derivs = derivs
+        self.coeffs = coeffs
+
+    def get_func(self, nodes):
+        return self.polys.evalseries(nodes, self.coeffs)
+
+    def get_deriv(self, nodes):
+        return self.derivs.evalseries(nodes, self.coeffs)
+
+
+class ExpansionRoots:
+    """Real roots of expansions in a polynomial basis.
+
+    Coefficients are converted to the Chebyshev basis, if needed, the
+    roots are found by `ColleagueRoots` and polished by `RootsPolisher`
+    on the original expansion. A polished root is kept only if it lies
+    in [-1, 1], moves by less than MAXSHIFT and reduces the magnitude of
+    the expansion. Newton steps at multiple roots may jump to another
+    root otherwise.
+
+    Roots are in the dtype of the operators, float64 if None. The
+    eigenvalues are computed in float64 and polished in that dtype.
+    """
+
+    TOL = 1e-15
+    MAXITER = 8
+    MAXSHIFT = 1e-6
+
+    def __init__(self, polys, derivs, converter=None):
+        self.polys = polys
+        self.derivs = derivs
+        self.converter = converter
+
+    def compute(self, coeffs):
+        """Returns the roots of one or several expansions.
+        """
+
+        coeffs = np.asarray(coeffs, dtype=self.get_dtype())
+
+        if coeffs.ndim == 1:
+            return self.find_roots(coeffs)
+
+        if coeffs.ndim != 2:
+            raise ValueError(
+                f'coeffs have shape {coeffs.shape}, expected (n,) or (n, m)'
+            )
+
+        return [
+            self.find_roots(column) for column in coeffs.T
+        ]
+
+    def find_roots(self, coeffs):
+
+        chebcoeffs = coeffs
+
+        if self.converter is not None:
+            chebcoeffs = self.converter.convert(coeffs)
+
+        roots = ColleagueRoots().compute(chebcoeffs)
+        roots = roots.astype(coeffs.dtype)
+
+        if roots.size == 0:
+            return roots
+
+        return np.sort(self.polish(roots, coeffs))
+
+    def get_dtype(self):
+        """Floating-point type of the roots.
+        """
+
+        if self.polys.dtype is None:
+            return np.dtype(float)
+
+        return np.dtype(self.polys.dtype)
+
+    def polish(self, roots, coeffs):
+
+        polisher = RootsPolisher(self.polys, self.derivs, coeffs)
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+
+            polished = polisher.compute(
+                roots, tol=self.TOL, maxiter=self.MAXITER
+            ).result
+
+            before = np.fabs(self.polys.evalseries(roots, coeffs))
+            after = np.fabs(self.polys.evalseries(polished, coeffs))
+
+            better = (np.fabs(polished) <= 1.) & (after <= before)
+            better &= np.fabs(polished-roots) < self.MAXSHIFT
+
+        return np.where(better, polished, roots)
@@ -3,4 +3,12 @@
 """
 
 from .recurrator import RecurrTriplet
-from .findroots import SolverNewton
+from .clenshaw import ClenshawSum
+from .oddsums import OddSums
+from .findroots import SolverNewton, SolverMasked
+from .lrucache import LRUCache
+from .nodecache import NodesCache
+from .matcache import MatCache
+from .toeplitzhankel import ToeplitzHankel
+from .workspace import Workspace
+from .profiling import Profiler
@@ -0,0 +1,34 @@
+# -*- coding: utf-8 -*-
+"""Conversions of arrays shared by operators.
+"""
+
+import numpy as np
+
+
+def astype(array, dtype):
+    """Converts an array to the dtype, if not None.
+    """
+
+    if dtype is None:
+        return array
+
+    return np.asarray(array, dtype=dtype)
+
+
+def asindices(indices):
+    """Converts indices of polynomials to a sorted array of unique ones.
+    """
+
+    indices = np.unique(np.array(indices, dtype=int))
+
+    if indices.size == 0:
+        raise ValueError(
+            'no polynomials defined, see setpolys()'
+        )
+
+    if indices.min() < 0:
+        raise ValueError(
+            'indices of polynomials must be non-negative'
+        )
+
+    return indices
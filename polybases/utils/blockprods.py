@@ -0,0 +1,82 @@
+# -*- coding: utf-8 -*-
+"""Products of tall matrices computed over blocks of rows.
+
+The matrices may be memory maps, only one block of rows is loaded at a
+time, see `PolyOpr.asmemmap()`.
+"""
+
+import numpy as np
+
+BLOCKSIZE = 2**20  # Entries per block of rows.
+
+
+def gram(mat, blocksize=None):
+    """Computes TRANSPOSE[A] @ A for a matrix A of shape (m, n).
+
+    Rows are read in blocks of blocksize, chosen from BLOCKSIZE if None.
+    """
+
+    mat = as_tallmat(mat)
+    size = mat.shape[-1]
+
+    out = np.zeros((size, size), dtype=np.result_type(mat, 1.))
+
+    for block in iterblocks(mat, blocksize):
+        out += block.T @ block
+
+    return out
+
+
+def tdot(mat, rhs, blocksize=None):
+    """Computes TRANSPOSE[A] @ b for a matrix A of shape (m, n).
+
+    The right-hand side b has shape (m,) or (m, k) and is read in the
+    same blocks of rows as A.
+    """
+
+    mat = as_tallmat(mat)
+    rhs = np.asarray(rhs)
+
+    if len(rhs) != len(mat):
+        raise ValueError(
+            f'rhs has {len(rhs)} rows, expected {len(mat)}'
+        )
+
+    shape = mat.shape[-1:] + rhs.shape[1:]
+    out = np.zeros(shape, dtype=np.result_type(mat, rhs, 1.))
+
+    for start, block in enumerate_blocks(mat, blocksize):
+        out += block.T @ rhs[start:start+len(block)]
+
+    return out
+
+
+def as_tallmat(mat):
+
+    if np.ndim(mat) != 2:
+        raise ValueError(
+            f'matrix has shape {np.shape(mat)}, expected (m, n)'
+        )
+
+    return mat
+
+
+def get_blockrows(mat, blocksize=None):
+    if blocksize is None:
+        return max(1, BLOCKSIZE//max(1, mat.shape[-1]))
+    return blocksize
+
+
+def enumerate_blocks(mat, blocksize=None):
+    """Generates (start, block) over blocks of rows loaded in memory.
+    """
+
+    rows = get_blockrows(mat, blocksize)
+
+    for start in range(0, len(mat), rows):
+        yield start, np.array(mat[start:start+rows])
+
+
+def iterblocks(mat, blocksize=None):
+    for _, block in enumerate_blocks(mat, blocksize):
+        yield block
@@ -0,0 +1,94 @@
+# -*- coding: utf-8 -*-
+"""Base class for the Clenshaw summation of triplet recurrences.
+"""
+
+from abc import ABC, abstractmethod
+import numpy as np
+
+
+class ClenshawSum(ABC):
+    """Base class for the Clenshaw summation of triplet recurrences.
+
+    Sums the series
+
+        SERIES = c_0*F_0 + c_1*F_1 + ... + c_N*F_N
+
+    for members of the recurrence
+
+        F_{k+1} = alfa_k * x * F_k - beta_k * F_{k-1}
+
+    by the backward recurrence
+
+        B_k = c_k + alfa_k * x * B_{k+1} - beta_{k+1} * B_{k+2}
+
+    with B_{N+1} = B_{N+2} = 0, which is run down to k = s, where s
+    is the index of the last leading member. Then
+
+        SERIES = SUM[c_k*F_k, k < s] + B_s*F_s - beta_s*F_{s-1}*B_{s+1}
+
+    SOURCE: en.wikipedia.org/wiki/Clenshaw_algorithm
+    """
+
+    def clenshaw(self, coeffs):
+        """Sums the series with coefficients along the first axis.
+        """
+
+        startseq = self.genstartseq()
+        startindex = len(startseq)-1
+
+        shape = np.broadcast_shapes(
+            np.shape(startseq[-1]), np.shape(coeffs)[1:]
+        )
+
+        dtype = np.result_type(coeffs, *startseq)
+        series = np.zeros(shape, dtype)
+
+        for coeff, item in zip(coeffs[0:startindex], startseq):
+            series += coeff*item
+
+        if len(coeffs) <= startindex:
+            return series
+
+        bnext, bcurr = self.runbackward(coeffs, startindex, shape, dtype)
+        _, beta = self.get_recurrcoeffs(startindex)
+
+        series += bcurr*startseq[-1]
+        series -= beta*(bnext*startseq[-2])
+
+        return series
+
+    def runbackward(self, coeffs, startindex, shape, dtype):
+        """Returns (B_{s+1}, B_s) of the backward recurrence.
+        """
+
+        bnext = np.zeros(shape, dtype)
+        bcurr = np.zeros(shape, dtype)
+        bprev = np.empty(shape, dtype)
+
+        work = np.empty(shape, dtype)
+
+        for index in range(len(coeffs)-1, startindex-1, -1):
+
+            alfa, _ = self.get_recurrcoeffs(index)
+            _, beta = self.get_recurrcoeffs(index+1)
+
+            np.multiply(self.nodes, bcurr, out=bprev)
+            np.multiply(bnext, beta, out=work)
+
+            bprev *= alfa
+            bprev -= work
+            bprev += coeffs[index]
+
+            bnext, bcurr, bprev = bcurr, bprev, bnext
+
+        return bnext, bcurr
+
+    @abstractmethod
+    def get_recurrcoeffs(self, index) -> tuple:
+        """Returns (alfa, beta) for the member at the index.
+        """
+
+    @abstractmethod
+    def genstartseq(self) -> list:
+        """Generates the leading recurrence members.
+        """
@@ -3,6 +3,8 @@
 """
 
 from abc import ABC, abstractmethod
+import numpy as np
+from . import profiling
 
 
 class IterNewton(ABC):
@@ -125,6 +127,9 @@ class SolverNewton(IterNewton):
         self.set_converge()
         self.get_results()
 
+        if profiling.ACTIVE is not None:
+            profiling.ACTIVE.log_solver(self, self.history, self.converge)
+
         return self
 
     def run_iterator(self):
@@ -135,3 +140,76 @@ class SolverNewton(IterNewton):
 
     def set_converge(self):
         self.converge = self.is_converged()
+
+
+class SolverMasked(SolverNewton):
+    """Base class for Newton solvers of independent components.
+
+    Each component of the solution is updated until its own step is
+    below the tolerance, then it is masked out, so that the functions
+    are computed at the active components only.
+
+    After `compute()`:
+
+    - converged — Boolean array, True for the converged components.
+    - counts — Number of updates per component.
+    - converge — True if all components converged.
+
+    The history holds the largest step over the active components.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.converged = None
+        self.counts = None
+        self._active = None
+
+    def set_init_state(self):
+
+        super().set_init_state()
+
+        self._sol = np.array(self._guess, copy=True)
+        self._active = np.flatnonzero(np.ones(self._sol.shape, bool))
+
+        self.converged = np.zeros(self._sol.shape, bool)
+        self.counts = np.zeros(self._sol.shape, int)
+
+        if self._active.size == 0:
+            self._converge = True
+
+    def __next__(self):
+
+        if self._converge is True:
+            raise StopIteration
+        if self._count == self._maxiter:
+            raise StopIteration
+
+        active = self._active
+        sol = self._sol.reshape(-1)
+
+        arg = sol[active]
+        new = self.computenext(arg)
+
+        sol[active] = new
+        self._count += 1
+
+        steps = self.get_steps(new, arg)
+        done = steps < self._tol
+
+        self.counts.reshape(-1)[active] += 1
+        self.converged.reshape(-1)[active[done]] = True
+
+        self._active = active[~done]
+
+        if self._active.size == 0:
+            self._converge = True
+
+        return self.get_norm(steps)
+
+    def get_steps(self, first, second):
+        """Computes the steps per component.
+        """
+        return np.fabs(first-second)
+
+    def get_norm(self, steps):
+        return np.amax(steps)
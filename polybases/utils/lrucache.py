@@ -0,0 +1,93 @@
+# -*- coding: utf-8 -*-
+"""Base class for least-recently-used caches.
+"""
+
+from collections import OrderedDict
+import threading
+
+
+class LRUCache:
+    """Least-recently-used cache with hit and miss counters.
+
+    Parameters
+    ----------
+    maxsize : int
+        Maximum number of entries, unlimited if None.
+
+    """
+
+    COUNTERS = [
+        'hits', 'misses', 'evictions'
+    ]
+
+    def __init__(self, maxsize):
+        self.maxsize = maxsize
+        self.entries = OrderedDict()
+        self.counters = dict.fromkeys(self.COUNTERS, 0)
+        self.lock = threading.RLock()
+
+    def setsize(self, maxsize):
+        """Sets the maximum number of entries and returns the instance.
+        """
+
+        with self.lock:
+            self.maxsize = maxsize
+            self.evict()
+
+        return self
+
+    def get(self, key):
+        """Returns the entry for the key, None if there is no entry.
+        """
+
+        with self.lock:
+
+            if key not in self.entries:
+                self.count('misses')
+                return None
+
+            self.count('hits')
+            self.entries.move_to_end(key)
+
+            return self.entries[key]
+
+    def put(self, key, value):
+        """Stores the entry for the key.
+        """
+
+        with self.lock:
+            self.entries[key] = value
+            self.entries.move_to_end(key)
+            self.evict()
+
+    def evict(self):
+        while self.is_overfull():
+            self.entries.popitem(last=False)
+            self.count('evictions')
+
+    def is_overfull(self):
+        if self.maxsize is None:
+            return False
+        return len(self.entries) > self.maxsize
+
+    def count(self, counter):
+        self.counters[counter] += 1
+
+    def clear(self):
+        """Removes all entries and resets the counters.
+        """
+
+        with self.lock:
+            self.entries.clear()
+            self.counters = dict.fromkeys(self.COUNTERS, 0)
+
+    def stats(self) -> dict:
+        """Returns the counters along with the current size.
+        """
+
+        with self.lock:
+            return {
+                **self.counters,
+                'size': len(self.entries),
+                'maxsize': self.maxsize
+            }
@@ -0,0 +1,105 @@
+# -*- coding: utf-8 -*-
+"""Cache of operator matrices within a memory budget.
+"""
+
+import hashlib
+import numpy as np
+from .lrucache import LRUCache
+
+
+class MatCache(LRUCache):
+    """Cache of realized operators keyed by operator, nodes and indices.
+
+    - Evicts the least recently used matrices beyond the memory budget.
+    - Skips matrices larger than the whole budget.
+
+    Cached matrices are read-only, so they can be shared by operators.
+
+    Parameters
+    ----------
+    maxbytes : int = 2**28
+        Memory budget of the matrices in bytes, unlimited if None.
+    maxsize : int = None
+        Maximum number of matrices, unlimited if None.
+
+    """
+
+    def __init__(self, maxbytes=2**28, maxsize=None):
+        super().__init__(maxsize)
+        self.maxbytes = maxbytes
+        self.nbytes = 0
+
+    def setbytes(self, maxbytes):
+        """Sets the memory budget and returns the instance.
+        """
+
+        with self.lock:
+            self.maxbytes = maxbytes
+            self.evict()
+
+        return self
+
+    def put(self, key, value):
+        """Stores the matrix for the key.
+        """
+
+        if self.maxbytes is not None and value.nbytes > self.maxbytes:
+            return
+
+        value.flags.writeable = False
+
+        with self.lock:
+
+            if key in self.entries:
+                self.nbytes -= self.entries[key].nbytes
+
+            self.nbytes += value.nbytes
+            super().put(key, value)
+
+    def evict(self):
+        while self.is_overfull():
+            _, value = self.entries.popitem(last=False)
+            self.nbytes -= value.nbytes
+            self.count('evictions')
+
+    def is_overfull(self):
+
+        if super().is_overfull():
+            return True
+
+        if self.maxbytes is None:
+            return False
+
+        return self.nbytes > self.maxbytes
+
+    def clear(self):
+        """Removes all entries and resets the counters.
+        """
+
+        with self.lock:
+            super().clear()
+            self.nbytes = 0
+
+    def stats(self) -> dict:
+        """Returns the counters along with the current size and bytes.
+        """
+
+        with self.lock:
+            return {
+                **super().stats(),
+                'nbytes': self.nbytes,
+                'maxbytes': self.maxbytes
+            }
+
+    @staticmethod
+    def hash_array(array):
+        """Digest of the values, shape and type of an array.
+        """
+
+        array = np.asarray(array)
+
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(str((array.shape, array.dtype.str)).encode())
+        digest.update(np.ascontiguousarray(array).data)
+
+        return digest.hexdigest()
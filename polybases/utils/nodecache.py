@@ -0,0 +1,155 @@
+# -*- coding: utf-8 -*-
+"""Cache of node sets with an optional on-disk store.
+"""
+
+import os
+import tempfile
+import numpy as np
+from .lrucache import LRUCache
+
+
+class NodesCache(LRUCache):
+    """Cache of nodes and weights keyed by (basis, family, number).
+
+    - Keeps the recently used node sets in memory.
+    - Optionally stores node sets in a directory as `.npy` files.
+    - Loads stored node sets as read-only memory maps.
+
+    Cached arrays are read-only, so they can be shared by node sets.
+
+    Parameters
+    ----------
+    maxsize : int = 64
+        Maximum number of node sets in memory, unlimited if None.
+    cachedir : str = None
+        Directory of the on-disk store, no store if None.
+
+    """
+
+    COUNTERS = [
+        'hits', 'misses', 'evictions', 'loads', 'saves'
+    ]
+
+    def __init__(self, maxsize=64, cachedir=None):
+        super().__init__(maxsize)
+        self.cachedir = None
+        self.setdir(cachedir)
+
+    def setdir(self, cachedir):
+        """Sets the directory of the on-disk store and returns the instance.
+
+        Parameters
+        ----------
+        cachedir : str | None
+            Directory of the on-disk store, no store if None.
+
+        Returns
+        -------
+        self
+            The instance itself.
+
+        """
+
+        if cachedir is not None:
+            cachedir = os.path.expanduser(cachedir)
+            os.makedirs(cachedir, exist_ok=True)
+
+        self.cachedir = cachedir
+
+        return self
+
+    def get(self, key):
+        """Returns (nodes, weights) for the key, None if not available.
+        """
+
+        with self.lock:
+
+            if key in self.entries:
+                return super().get(key)
+
+            stored = self.load(key)
+
+            if stored is None:
+                self.count('misses')
+                return None
+
+            self.count('loads')
+            super().put(key, stored)
+
+            return stored
+
+    def put(self, key, value):
+        """Stores (nodes, weights) for the key.
+        """
+
+        value = tuple(
+            self.make_readonly(item) for item in value
+        )
+
+        with self.lock:
+            super().put(key, value)
+            self.save(key, value)
+
+    def make_readonly(self, array):
+        if array is not None:
+            array.flags.writeable = False
+        return array
+
+    def load(self, key):
+
+        if self.cachedir is None:
+            return None
+
+        paths = self.get_paths(key)
+
+        if not os.path.exists(paths[0]):
+            return None
+
+        return tuple(
+            self.load_array(path) for path in paths
+        )
+
+    def load_array(self, path):
+        if not os.path.exists(path):
+            return None
+        return np.load(path, mmap_mode='r')
+
+    def save(self, key, value):
+
+        if self.cachedir is None:
+            return
+
+        paths = self.get_paths(key)
+
+        if os.path.exists(paths[0]):
+            return
+
+        for path, array in zip(paths[::-1], value[::-1]):
+            if array is not None:
+                self.save_array(path, array)
+
+        self.count('saves')
+
+    def save_array(self, path, array):
+        """Saves via a temporary file, so readers never see partial files.
+        """
+
+        handle, tmppath = tempfile.mkstemp(
+            dir=self.cachedir, suffix='.tmp'
+        )
+
+        with os.fdopen(handle, 'wb') as file:
+            np.save(file, array)
+
+        os.replace(tmppath, path)
+
+    def get_paths(self, key):
+
+        stem = '-'.join(
+            str(item) for item in key
+        )
+
+        return [
+            os.path.join(self.cachedir, f'{stem}-nodes.npy'),
+            os.path.join(self.cachedir, f'{stem}-weights.npy')
+        ]
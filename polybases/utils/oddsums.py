@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+"""Base class for sums over every other coefficient.
+"""
+
+from abc import ABC, abstractmethod
+import numpy as np
+from . import optional
+
+
+class OddSums(ABC):
+    """Base class for sums over every other coefficient.
+
+    Computes
+
+        d_k = left_k * SUM[right_j * c_j, j > k, j-k odd]
+
+    by the backward recurrence
+
+        s_k = right_{k+1} * c_{k+1} + s_{k+2}
+
+    that is a reversed cumulative sum over every other coefficient, in
+    O(n) operations. The matrix of the map is upper triangular, with
+    half of the upper entries non-zero.
+    """
+
+    def oddsums(self, coeffs):
+        """Computes d_k for coefficients along the first axis.
+        """
+
+        number = len(coeffs)
+        shape = (-1,) + (1,)*(np.ndim(coeffs)-1)
+
+        dtype = np.result_type(coeffs, 1.)
+
+        left = self.get_left(number).astype(dtype).reshape(shape)
+        right = self.get_right(number).astype(dtype).reshape(shape)
+
+        terms = right*coeffs
+        sums = np.zeros(np.shape(terms), terms.dtype)
+
+        for parity in range(2):
+            _ = np.cumsum(terms[parity+1::2][::-1], axis=0)
+            sums[parity:parity+2*len(_):2] = _[::-1]
+
+        sums *= left
+
+        return sums
+
+    def getoddmat(self, number):
+        """Returns the matrix of the map in the CSR format.
+        """
+
+        sparse = optional.import_sparse()
+
+        rows, cols = np.triu_indices(number, 1)
+        odd = (cols-rows) % 2 == 1
+
+        rows = rows[odd]
+        cols = cols[odd]
+
+        values = self.get_left(number)[rows]*self.get_right(number)[cols]
+
+        return sparse.csr_array(
+            (values, (rows, cols)), shape=(number, number)
+        )
+
+    @abstractmethod
+    def get_left(self, number):
+        """Factors left_k for k from 0 to number-1.
+        """
+
+    @abstractmethod
+    def get_right(self, number):
+        """Factors right_j for j from 0 to number-1.
+        """
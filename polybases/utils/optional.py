@@ -0,0 +1,17 @@
+# -*- coding: utf-8 -*-
+"""Imports of optional dependencies.
+"""
+
+
+def import_sparse():
+    """Imports scipy.sparse, raises ImportError if scipy is missing.
+    """
+
+    try:
+        from scipy import sparse
+    except ImportError as exc:
+        raise ImportError(
+            'scipy is required for sparse matrices'
+        ) from exc
+
+    return sparse
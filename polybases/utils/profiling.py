@@ -0,0 +1,146 @@
+# -*- coding: utf-8 -*-
+"""Opt-in counters of operators and Newton solvers.
+"""
+
+import threading
+import time
+
+ACTIVE = None  # Profiler in use, nothing is recorded if None.
+
+
+def count(obj, **counts):
+    """Adds counts of the object for the active profiler, if any.
+    """
+
+    profiler = ACTIVE
+
+    if profiler is not None:
+        profiler.count(obj, **counts)
+
+
+class Profiler:
+    """Records counters of operators and Newton solvers while active.
+
+    For operators, keyed by the qualified name of their class:
+
+    - calls, seconds — Calls and wall time of `asmat()`.
+    - steps — Steps of recurrences.
+    - triplets — Primitive integrals combined from their bases.
+    - arrays — Arrays allocated by recurrences and workspaces.
+    - bytes — Bytes of the realized matrices.
+
+    For Newton solvers, keyed by the qualified name of their class:
+
+    - calls, iterations, failures — Calls, iterations, and calls
+      without convergence.
+    - histories — Residuals per iteration, one list per call.
+
+    Hot paths check the module variable ACTIVE only, so the overhead is
+    negligible when no profiler is active.
+
+    Examples
+    --------
+    >>> with Profiler() as profiler:
+    ...     _ = opr.asmat()
+    >>> profiler.stats()
+
+    """
+
+    COUNTERS = [
+        'calls', 'seconds', 'steps', 'triplets', 'arrays', 'bytes'
+    ]
+
+    def __init__(self):
+        self.operators = {}
+        self.solvers = {}
+        self.lock = threading.Lock()
+        self.saved = None
+
+    def __enter__(self):
+        global ACTIVE
+        self.saved = ACTIVE
+        ACTIVE = self
+        return self
+
+    def __exit__(self, *_):
+        global ACTIVE
+        ACTIVE = self.saved
+        self.saved = None
+
+    def count(self, obj, **counts):
+        """Adds the counts to the counters of the object's class.
+        """
+
+        name = get_name(obj)
+
+        with self.lock:
+
+            record = self.operators.get(name)
+
+            if record is None:
+                record = dict.fromkeys(self.COUNTERS, 0)
+                self.operators[name] = record
+
+            for counter, value in counts.items():
+                record[counter] += value
+
+    def log_solver(self, obj, history, converge):
+        """Records a call of a Newton solver.
+        """
+
+        name = get_name(obj)
+
+        with self.lock:
+
+            record = self.solvers.setdefault(name, {
+                'calls': 0, 'iterations': 0, 'failures': 0, 'histories': []
+            })
+
+            record['calls'] += 1
+            record['iterations'] += len(history)
+            record['failures'] += converge is not True
+            record['histories'].append([float(val) for val in history])
+
+    def stats(self) -> dict:
+        """Returns copies of the operator and solver counters.
+        """
+
+        with self.lock:
+            return {
+                'operators': {
+                    name: dict(record)
+                    for name, record in self.operators.items()
+                },
+                'solvers': {
+                    name: {**record, 'histories': list(record['histories'])}
+                    for name, record in self.solvers.items()
+                }
+            }
+
+    def clear(self):
+        """Resets all counters.
+        """
+
+        with self.lock:
+            self.operators.clear()
+            self.solvers.clear()
+
+
+class Timer:
+    """Times a call for the active profiler, if any.
+    """
+
+    def __init__(self, profiler):
+        self.profiler = profiler
+        self.start = time.perf_counter()
+
+    def stop(self, obj, outmat):
+        self.profiler.count(
+            obj, calls=1, seconds=time.perf_counter()-self.start,
+            bytes=getattr(outmat, 'nbytes', 0)
+        )
+
+
+def get_name(obj):
+    objtype = type(obj)
+    return f'{objtype.__module__}.{objtype.__qualname__}'
@@ -3,6 +3,8 @@
 """
 
 from abc import ABC, abstractmethod
+import numpy as np
+from . import profiling
 
 
 class RecurrTriplet(ABC):
@@ -19,6 +21,198 @@ class RecurrTriplet(ABC):
             self.runrecurr(startseq, maxindex)
         )
 
+    def itersequence(self, maxindex):
+        """Generates the recurrence members from 0 to maxindex (>=0).
+
+        Only the last members are kept alive by the recurrence.
+        """
+
+        startseq = self.genstartseq()
+
+        return self.runrecurr(startseq, maxindex)
+
+    def getseqarray(self, maxindex, transpose=False, out=None, work=None):
+        """Computes the recurrence members from 0 to maxindex (>=0).
+
+        Members are written to the rows of a preallocated C-contiguous
+        array of shape (maxindex+1, *shape). If transpose is True, the
+        array is returned as a view with the member axis moved last.
+
+        If given, out is used instead of the array, in the layout of
+        the result. The scratch arrays are taken from the workspace
+        work, if given.
+        """
+
+        startseq = self.genstartseq()
+
+        array = self.get_outrows(startseq, maxindex+1, transpose, out)
+        self.fillsequence(array, startseq, work)
+
+        if out is not None:
+            return out
+
+        if transpose:
+            return np.moveaxis(array, 0, -1)
+
+        return array
+
+    def get_outrows(self, startseq, size, transpose, out):
+        """Returns an array of members along the first axis.
+
+        It is a new array or a view of out, which is checked.
+        """
+
+        shape = (size, *np.shape(startseq[-1]))
+        dtype = np.result_type(*startseq)
+
+        if out is None:
+            profiling.count(self, arrays=1)
+            return np.empty(shape, dtype)
+
+        rows = np.moveaxis(out, -1, 0) if transpose else out
+
+        if rows.shape != shape:
+            raise ValueError(
+                f'out has shape {out.shape}, expected rows of {shape}'
+            )
+
+        if not np.can_cast(dtype, rows.dtype, casting='same_kind'):
+            raise TypeError(
+                f'out has dtype {rows.dtype}, cannot hold {dtype}'
+            )
+
+        return rows
+
+    def fillsequence(self, out, startseq=None, work=None):
+        """Writes the recurrence members from 0 to len(out)-1 to out.
+
+        Members are written along the first axis of out.
+        """
+
+        if startseq is None:
+            startseq = self.genstartseq()
+
+        size = len(out)
+        startsize = len(startseq)
+
+        for index, item in enumerate(startseq[0:size]):
+            out[index] = item
+
+        if size <= startsize:
+            return out
+
+        rows = [
+            out[index, ...] for index in range(size)
+        ]
+
+        work = self.get_scratch(rows[0], 1, work)[0]
+
+        for index in range(startsize-1, size-1):
+            self.computenext_into(
+                rows[index-1], rows[index], index, rows[index+1], work
+            )
+
+        profiling.count(self, steps=size-startsize)
+
+        return out
+
+    def getseqsubset(self, indices, transpose=False, out=None, work=None):
+        """Computes the recurrence members at the indices (>=0).
+
+        Only the requested members are stored, in the rows of an array
+        of shape (len(indices), *shape), see getseqarray().
+        """
+
+        startseq = self.genstartseq()
+
+        array = self.get_outrows(startseq, len(indices), transpose, out)
+        self.fillsubset(indices, array, startseq, work)
+
+        if out is not None:
+            return out
+
+        if transpose:
+            return np.moveaxis(array, 0, -1)
+
+        return array
+
+    def fillsubset(self, indices, out, startseq=None, work=None):
+        """Writes the recurrence members at the indices to out.
+
+        Members are written along the first axis of out. A member is
+        computed directly in its row of out, if requested, and in one
+        of the rolling scratch rows otherwise.
+        """
+
+        if startseq is None:
+            startseq = self.genstartseq()
+
+        rows = {}
+
+        for row, index in enumerate(indices):
+            rows.setdefault(index, row)
+
+        targets = {
+            index: out[row, ...] for index, row in rows.items()
+        }
+
+        maxindex = max(targets)
+        startsize = len(startseq)
+
+        for index, item in enumerate(startseq[0:maxindex+1]):
+            if index in targets:
+                targets[index][...] = item
+
+        scratch = self.get_scratch(out[0, ...], 4, work)
+        work = scratch.pop()
+
+        prev = startseq[-2]
+        curr = startseq[-1]
+
+        for index in range(startsize-1, maxindex):
+
+            nexter = targets.get(index+1)
+
+            if nexter is None:
+                nexter = self.pick_scratch(scratch, prev, curr)
+
+            self.computenext_into(prev, curr, index, nexter, work)
+
+            prev = curr
+            curr = nexter
+
+        profiling.count(self, steps=max(0, int(maxindex)-startsize+1))
+
+        for row, index in enumerate(indices):
+            if rows[index] != row:
+                out[row] = out[rows[index]]
+
+        return out
+
+    def get_scratch(self, row, count, work=None):
+        """Returns a list of count scratch rows like the row.
+
+        Rows are views of an array in the workspace work, if given.
+        """
+
+        if work is None:
+            profiling.count(self, arrays=count)
+            return [
+                np.empty_like(row) for _ in range(count)
+            ]
+
+        array = work.get(f'scratch{count}', (count, *row.shape), row.dtype)
+
+        return [
+            array[index, ...] for index in range(count)
+        ]
+
+    def pick_scratch(self, scratch, *inuse):
+        for item in scratch:
+            if all(item is not val for val in inuse):
+                return item
+        return None
+
     def runrecurr(self, startseq, maxindex):
         """Generates the recurrence members from 0 to maxindex (>=0).
         """
@@ -36,18 +230,32 @@ class RecurrTriplet(ABC):
         for item in startseq:
             yield item
 
-        for index in range(startindex, maxindex):
+        steps = 0
 
-            nexter = self.computenext(prev, curr, index)
-            yield nexter
+        try:
+            for index in range(startindex, maxindex):
 
-            prev = curr
-            curr = nexter
+                nexter = self.computenext(prev, curr, index)
+                steps += 1
+                yield nexter
+
+                prev = curr
+                curr = nexter
+        finally:
+            profiling.count(self, steps=steps, arrays=steps)
 
     @abstractmethod
     def computenext(self, prev, curr, index):
-        """Computes the next member of the recurrence. 
+        """Computes the next member of the recurrence.
+        """
+
+    def computenext_into(self, prev, curr, index, out, work):
+        """Computes the next member of the recurrence in place.
+
+        The result is written to out, work is a scratch array of
+        the same shape. Subclasses override it with in-place ufuncs.
         """
+        out[...] = self.computenext(prev, curr, index)
 
     @abstractmethod
     def genstartseq(self) -> list:
@@ -0,0 +1,42 @@
+# -*- coding: utf-8 -*-
+"""Special functions used by polynomial bases.
+"""
+
+import math
+import numpy as np
+
+ASYMIN = 30.  # Asymptotic series of gammaratio() are used from here.
+
+GAMMARATIO_SERIES = [
+    1., -1./8., 1./128., 5./1024., -21./32768., -399./262144.,
+    869./4194304., 39325./33554432., -334477./2147483648.
+]
+
+
+def gammaratio(z):
+    """Computes GAMMA(z+1/2)/GAMMA(z+1) for z >= 0.
+
+    For large z, it uses the asymptotic series
+
+        GAMMA(z+1/2)/GAMMA(z+1) = SUM[a_k/z^k]/SQRT(z)
+
+    with a_k from GAMMARATIO_SERIES.
+
+    SOURCE: dlmf.nist.gov/5.11#iii
+    """
+
+    z = np.asarray(z, dtype=float)
+    out = np.empty_like(z)
+
+    small = z < ASYMIN
+    large = ~small
+
+    out[small] = [
+        math.gamma(val+0.5)/math.gamma(val+1.) for val in z[small]
+    ]
+
+    out[large] = np.polyval(
+        GAMMARATIO_SERIES[::-1], 1./z[large]
+    )/np.sqrt(z[large])
+
+    return out[()]
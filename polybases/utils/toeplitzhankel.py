@@ -0,0 +1,110 @@
+# -*- coding: utf-8 -*-
+"""Fast products with Toeplitz-dot-Hankel matrices.
+"""
+
+import numpy as np
+
+
+class ToeplitzHankel:
+    """Product with the matrix
+
+        A = DIAG(left) * (T o H) * DIAG(right)
+
+    where o is the elementwise product and:
+
+        T_{i,j} = t_{j-i} — Upper triangular Toeplitz matrix.
+        H_{i,j} = h_{i+j} — Positive semidefinite Hankel matrix.
+
+    The Hankel matrix has a low numerical rank, so the pivoted Cholesky
+    factorization H = SUM[l_r * l_r^T] is truncated at a relative
+    tolerance. Then
+
+        A*x = left * SUM[l_r * T*(l_r * right * x)]
+
+    where T is applied by the FFT. The product costs O(r*n*log(n))
+    operations, with r = O(log(n)) in practice.
+
+    SOURCE: Townsend, Webb, Olver, Math. Comp. 87 (2018) 1913–1934
+
+    Parameters
+    ----------
+    toeplitz : ndarray
+        Entries t_0, ..., t_{n-1}.
+    hankel : ndarray
+        Entries h_0, ..., h_{2n-2}.
+    left, right : ndarray
+        Diagonal scaling of rows and columns.
+
+    """
+
+    TOL = 1e-16
+
+    def __init__(self, toeplitz, hankel, left, right):
+        self.size = len(toeplitz)
+        self.left = left
+        self.right = right
+        self.factors = self.get_factors(hankel)
+        self.spectrum = np.fft.rfft(toeplitz, 2*self.size)
+
+    def apply(self, vectors):
+        """Multiplies vectors along the first axis by the matrix.
+        """
+
+        shape = (-1,) + (1,)*(np.ndim(vectors)-1)
+
+        left = np.reshape(self.left, shape)
+        right = np.reshape(self.right, shape)
+
+        vectors = right*vectors
+        out = np.zeros(np.shape(vectors), np.result_type(vectors, float))
+
+        for factor in self.factors:
+            factor = np.reshape(factor, shape)
+            out += factor*self.apply_toeplitz(factor*vectors)
+
+        return left*out
+
+    def apply_toeplitz(self, vectors):
+        """Multiplies vectors along the first axis by T.
+
+        The product is a convolution of t with the reversed vectors.
+        """
+
+        size = self.size
+        spectrum = np.reshape(self.spectrum, (-1,) + (1,)*(vectors.ndim-1))
+
+        _ = np.fft.rfft(vectors[::-1], 2*size, axis=0)
+        _ = np.fft.irfft(spectrum*_, 2*size, axis=0)
+
+        return _[size-1::-1]
+
+    def get_factors(self, hankel):
+        """Pivoted Cholesky factors of H as rows of an array.
+        """
+
+        size = self.size
+        index = np.arange(size)
+
+        diag = hankel[2*index].astype(float)
+        tol = self.TOL*np.amax(diag, initial=0.)
+
+        factors = []
+
+        for _ in range(size):
+
+            pivot = np.argmax(diag)
+
+            if diag[pivot] <= tol:
+                break
+
+            column = hankel[index+pivot].astype(float)
+
+            for factor in factors:
+                column -= factor*factor[pivot]
+
+            factor = column/np.sqrt(diag[pivot])
+            diag -= factor*factor
+
+            factors.append(factor)
+
+        return np.array(factors).reshape(-1, size)
@@ -0,0 +1,48 @@
+# -*- coding: utf-8 -*-
+"""Reusable scratch arrays.
+"""
+
+import numpy as np
+from . import profiling
+
+
+class Workspace:
+    """Scratch arrays reused by repeated evaluations.
+
+    - Arrays are keyed by name.
+    - An array is allocated again only if its shape or dtype changes.
+
+    A workspace must not be shared by operators that run concurrently.
+    """
+
+    def __init__(self):
+        self.arrays = {}
+
+    def get(self, name, shape, dtype):
+        """Returns an uninitialized array of the shape and dtype.
+        """
+
+        shape = tuple(shape)
+        dtype = np.dtype(dtype)
+
+        array = self.arrays.get(name)
+
+        if array is None or array.shape != shape or array.dtype != dtype:
+            array = np.empty(shape, dtype)
+            self.arrays[name] = array
+
+            profiling.count(self, arrays=1)
+
+        return array
+
+    def clear(self):
+        """Releases all arrays.
+        """
+        self.arrays.clear()
+
+    def nbytes(self) -> int:
+        """Returns the total size of the arrays in bytes.
+        """
+        return sum(
+            array.nbytes for array in self.arrays.values()
+        )